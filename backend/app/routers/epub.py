@@ -1,8 +1,9 @@
 import logging
+import mimetypes
 from typing import Any, Dict, List, Optional
+from urllib.parse import quote
 
-from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from pydantic import BaseModel
 
 from ..models.epub_responses import EPUBDetailResponse, EPUBListItem
@@ -39,6 +40,31 @@ def get_epub_doc_or_404(epub_id: int) -> Dict[str, Any]:
     return epub_doc
 
 
+def check_not_modified(request: Request, etag: str) -> str:
+    """
+    Raise 304 Not Modified if the client already holds this version.
+
+    Args:
+        request: The incoming request, for its If-None-Match header
+        etag: Validator from EPUBService.get_etag
+
+    Returns:
+        The quoted value to send in the response's ETag header
+
+    Raises:
+        HTTPException: 304 if If-None-Match matches etag
+    """
+    header_value = f'"{etag}"'
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        client_etags = {
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        }
+        if header_value in client_etags or "*" in client_etags:
+            raise HTTPException(status_code=304, headers={"ETag": header_value})
+    return header_value
+
+
 class EPUBProgressRequest(BaseModel):
     current_nav_id: str
     chapter_id: Optional[str] = None
@@ -67,7 +93,7 @@ async def get_epub_info_by_id(epub_id: int) -> EPUBDetailResponse:
     try:
         epub_doc = get_epub_doc_or_404(epub_id)
 
-        info = epub_service.get_epub_info(epub_doc["filename"])
+        info = await epub_service.get_epub_info_async(epub_doc["filename"])
         # Return EPUBDetailResponse model directly
         return EPUBDetailResponse(**info.model_dump(), id=epub_id)
     except HTTPException:
@@ -80,24 +106,55 @@ async def get_epub_info_by_id(epub_id: int) -> EPUBDetailResponse:
         )
 
 
+def _attachment_disposition(filename: str) -> str:
+    """
+    Build a Content-Disposition header the way FileResponse does, using the
+    RFC 5987 form for names that need percent-encoding
+    """
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"attachment; filename*=utf-8''{quoted}"
+    return f'attachment; filename="{filename}"'
+
+
 @router.get("/{epub_id:int}/thumbnail")
-async def get_epub_thumbnail_by_id(epub_id: int):
+async def get_epub_thumbnail_by_id(epub_id: int, request: Request):
     """
     Get thumbnail image for an EPUB cover by ID
     """
     try:
         epub_doc = get_epub_doc_or_404(epub_id)
+        etag = check_not_modified(
+            request, epub_service.get_etag(epub_doc["filename"], "thumbnail")
+        )
 
         thumbnail_path = epub_service.get_thumbnail_path(epub_doc["filename"])
 
-        # Generate thumbnail if it doesn't exist
-        if not thumbnail_path.exists():
-            thumbnail_path = epub_service.generate_thumbnail(epub_doc["filename"])
+        try:
+            thumbnail_data = await epub_service.read_thumbnail_bytes_async(
+                thumbnail_path
+            )
+        except FileNotFoundError:
+            # Generate thumbnail if it doesn't exist
+            thumbnail_path = await epub_service.generate_thumbnail_async(
+                epub_doc["filename"]
+            )
+            thumbnail_data = await epub_service.read_thumbnail_bytes_async(
+                thumbnail_path
+            )
 
-        return FileResponse(
-            path=str(thumbnail_path),
-            media_type="image/png",
-            filename=f"{epub_doc['filename']}_thumbnail.png",
+        # Thumbnails generated before the switch to JPEG may still be PNGs, so
+        # the media type is guessed from the file's own suffix
+        media_type, _ = mimetypes.guess_type(thumbnail_path.name)
+        return Response(
+            content=thumbnail_data,
+            media_type=media_type or "application/octet-stream",
+            headers={
+                "ETag": etag,
+                "Content-Disposition": _attachment_disposition(
+                    f"{epub_doc['filename']}_thumbnail{thumbnail_path.suffix}"
+                ),
+            },
         )
 
     except HTTPException:
@@ -111,14 +168,19 @@ async def get_epub_thumbnail_by_id(epub_id: int):
 
 
 @router.get("/{epub_id:int}/navigation")
-async def get_epub_navigation_by_id(epub_id: int) -> Dict[str, Any]:
+async def get_epub_navigation_by_id(
+    epub_id: int, request: Request, response: Response
+) -> Dict[str, Any]:
     """
     Get the hierarchical navigation structure (table of contents) for an EPUB by ID
     """
     try:
         epub_doc = get_epub_doc_or_404(epub_id)
+        response.headers["ETag"] = check_not_modified(
+            request, epub_service.get_etag(epub_doc["filename"], "navigation")
+        )
 
-        navigation = epub_service.get_navigation_tree(epub_doc["filename"])
+        navigation = await epub_service.get_navigation_tree_async(epub_doc["filename"])
         return navigation
     except HTTPException:
         raise
@@ -131,14 +193,21 @@ async def get_epub_navigation_by_id(epub_id: int) -> Dict[str, Any]:
 
 
 @router.get("/{epub_id:int}/content/{nav_id}")
-async def get_epub_content_by_id(epub_id: int, nav_id: str) -> Dict[str, Any]:
+async def get_epub_content_by_id(
+    epub_id: int, nav_id: str, request: Request, response: Response
+) -> Dict[str, Any]:
     """
     Get HTML content for a specific navigation section by EPUB ID
     """
     try:
         epub_doc = get_epub_doc_or_404(epub_id)
+        # Image URLs in the content embed the EPUB id, so it is part of the key
+        response.headers["ETag"] = check_not_modified(
+            request,
+            epub_service.get_etag(epub_doc["filename"], f"content:{epub_id}:{nav_id}"),
+        )
 
-        content = epub_service.get_content_by_nav_id(
+        content = await epub_service.get_content_by_nav_id_async(
             epub_doc["filename"], nav_id, epub_id
         )
         return content
@@ -153,15 +222,20 @@ async def get_epub_content_by_id(epub_id: int, nav_id: str) -> Dict[str, Any]:
 
 
 @router.get("/{epub_id:int}/styles")
-async def get_epub_styles_by_id(epub_id: int) -> Dict[str, Any]:
+async def get_epub_styles_by_id(
+    epub_id: int, request: Request, response: Response
+) -> Dict[str, Any]:
     """
     Get CSS styles from an EPUB file by ID
     Returns sanitized CSS content for safe browser rendering
     """
     try:
         epub_doc = get_epub_doc_or_404(epub_id)
+        response.headers["ETag"] = check_not_modified(
+            request, epub_service.get_etag(epub_doc["filename"], "styles")
+        )
 
-        styles = epub_service.get_epub_styles(epub_doc["filename"])
+        styles = await epub_service.get_epub_styles_async(epub_doc["filename"])
         return styles
     except HTTPException:
         raise
@@ -172,14 +246,19 @@ async def get_epub_styles_by_id(epub_id: int) -> Dict[str, Any]:
 
 
 @router.get("/{epub_id:int}/image/{image_path:path}")
-async def get_epub_image_by_id(epub_id: int, image_path: str):
+async def get_epub_image_by_id(epub_id: int, image_path: str, request: Request):
     """
     Get an image from an EPUB file by ID
     """
     try:
         epub_doc = get_epub_doc_or_404(epub_id)
+        etag = check_not_modified(
+            request, epub_service.get_etag(epub_doc["filename"], f"image:{image_path}")
+        )
 
-        image_data = epub_service.get_epub_image(epub_doc["filename"], image_path)
+        image_data = await epub_service.get_epub_image_async(
+            epub_doc["filename"], image_path
+        )
 
         # Determine media type based on file extension
         if image_path.lower().endswith(".png"):
@@ -195,9 +274,9 @@ async def get_epub_image_by_id(epub_id: int, image_path: str):
         else:
             media_type = "application/octet-stream"
 
-        from fastapi.responses import Response
-
-        return Response(content=image_data, media_type=media_type)
+        return Response(
+            content=image_data, media_type=media_type, headers={"ETag": etag}
+        )
 
     except HTTPException:
         raise
@@ -267,7 +346,7 @@ async def get_epub_progress_by_id(epub_id: int) -> Dict[str, Any]:
             if nav_metadata and epub_service.needs_word_count(nav_metadata):
                 try:
                     # Extract word counts and update nav_metadata
-                    updated_nav_metadata = epub_service.extract_word_counts(
+                    updated_nav_metadata = await epub_service.extract_word_counts_async(
                         filename, nav_metadata
                     )
                     # Save updated nav_metadata back to database
@@ -384,14 +463,16 @@ async def delete_epub_book_by_id(epub_id: int) -> Dict[str, Any]:
             deletion_results["epub_file"] = False
             logger.warning("Could not delete EPUB file %s", filename, exc_info=True)
 
-        # Delete thumbnail
+        # Delete thumbnails, one per size bucket
         try:
-            thumbnail_path = epub_service.get_thumbnail_path(filename)
-            if thumbnail_path.exists():
-                thumbnail_path.unlink()
-                deletion_results["thumbnail"] = True
-            else:
-                deletion_results["thumbnail"] = False
+            deleted_thumbnails = 0
+            for thumbnail_path in epub_service.get_thumbnail_paths(filename):
+                try:
+                    thumbnail_path.unlink()
+                    deleted_thumbnails += 1
+                except FileNotFoundError:
+                    pass
+            deletion_results["thumbnail"] = deleted_thumbnails > 0
         except Exception:
             deletion_results["thumbnail"] = False
             logger.warning("Could not delete thumbnail for %s", filename, exc_info=True)
@@ -442,7 +523,7 @@ async def list_epubs(
     Optionally filter by book status.
     """
     try:
-        epubs = epub_service.list_epubs()
+        epubs = await epub_service.list_epubs_async()
 
         # Get reading progress with status information
         if status:
@@ -4,14 +4,24 @@ Services Package
 This package contains database services for managing PDF reading progress,
 chat notes, and highlights. It provides both specialized services for each
 domain and a unified facade service for backward compatibility.
+
+Exports are resolved lazily: importing a submodule such as
+app.services.epub must not build the db_service singleton, since thumbnail
+worker processes import it and would otherwise each run the schema setup.
 """
 
-from .base_database_service import BaseDatabaseService
-from .chat_notes_service import ChatNotesService
-from .database_service import DatabaseService, db_service
-from .epub_highlights_service import EPUBHighlightService
-from .highlights_service import HighlightsService
-from .reading_progress_service import ReadingProgressService
+import importlib
+
+# Exported name -> submodule defining it
+_EXPORTS = {
+    "BaseDatabaseService": "base_database_service",
+    "ChatNotesService": "chat_notes_service",
+    "DatabaseService": "database_service",
+    "db_service": "database_service",
+    "EPUBHighlightService": "epub_highlights_service",
+    "HighlightsService": "highlights_service",
+    "ReadingProgressService": "reading_progress_service",
+}
 
 __all__ = [
     "DatabaseService",
@@ -22,3 +32,11 @@ __all__ = [
     "BaseDatabaseService",
     "EPUBHighlightService",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __name__)
+    return getattr(module, name)
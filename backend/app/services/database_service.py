@@ -177,15 +177,16 @@ class DatabaseService:
             """)
 
             # Create indexes for faster lookups of highlights by PDF and page
-            # These indexes significantly improve query performance for highlight retrieval
+            # These indexes significantly improve query performance for highlight retrieval.
+            # created_at is part of each key so the ORDER BY is served from the index.
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_highlights_pdf_page
-                ON highlights(pdf_filename, page_number)
+                CREATE INDEX IF NOT EXISTS idx_highlights_pdf_page_created
+                ON highlights(pdf_filename, page_number, created_at DESC)
             """)
 
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_highlights_pdf
-                ON highlights(pdf_filename)
+                CREATE INDEX IF NOT EXISTS idx_highlights_pdf_created
+                ON highlights(pdf_filename, created_at DESC)
             """)
 
             # Create pdf_documents table (Phase 1a: PDF Cache Database Backing)
@@ -776,8 +777,24 @@ class DatabaseService:
             coordinates,
         )
 
+    def save_highlights_bulk(self, highlights: list[dict[str, Any]]) -> int:
+        """
+        Save many PDF highlights in a single transaction.
+
+        Args:
+            highlights (list[dict[str, Any]]): Highlight dictionaries with the
+                same fields as the save_highlight arguments
+
+        Returns:
+            int: Number of highlights saved, 0 if the batch failed
+        """
+        return self.highlights.save_highlights_bulk(highlights)
+
     def get_highlights_for_pdf(
-        self, pdf_filename: str, page_number: int | None = None
+        self,
+        pdf_filename: str,
+        page_number: int | None = None,
+        include_coordinates: bool = True,
     ) -> list[dict[str, Any]]:
         """
         Retrieve highlights for a PDF document, optionally filtered by page number.
@@ -789,6 +806,8 @@ class DatabaseService:
         Args:
             pdf_filename (str): Name of the PDF file to get highlights for
             page_number (int | None): Specific page number to filter by, or None for all pages
+            include_coordinates (bool): Whether to load coordinates; when False
+                they are not read from the database and come back as None
 
         Returns:
             list[dict[str, Any]]: List of highlight dictionaries, each containing:
@@ -803,7 +822,9 @@ class DatabaseService:
                 - created_at: Creation timestamp
                 - updated_at: Last update timestamp
         """
-        return self.highlights.get_highlights_for_pdf(pdf_filename, page_number)
+        return self.highlights.get_highlights_for_pdf(
+            pdf_filename, page_number, include_coordinates
+        )
 
     def get_highlight_by_id(self, highlight_id: int) -> dict[str, Any] | None:
         """
@@ -963,6 +984,7 @@ class DatabaseService:
                 highlights_deleted = (
                     cursor.rowcount >= 0
                 )  # Consider successful even if no rows were deleted
+            self.highlights.clear_highlight_cache()
         except Exception as e:
             logger.error(f"Error deleting highlights for {pdf_filename}: {e}")
 
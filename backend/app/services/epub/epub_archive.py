@@ -0,0 +1,206 @@
+"""
+Cached access to the raw ZIP container of an EPUB
+Keeps the central directory and parsed OPF package document of recently used
+EPUBs in memory so that callers needing them (cover lookup, metadata) share a
+single open + parse per file version
+"""
+
+import logging
+import posixpath
+import threading
+import zipfile
+from collections import OrderedDict
+from functools import cached_property
+from pathlib import Path
+from urllib.parse import unquote
+
+import ebooklib
+from ebooklib import epub
+from lxml import etree
+
+from .epub_book_index import ImageNameIndex
+
+logger = logging.getLogger(__name__)
+
+CONTAINER_NS = "urn:oasis:names:tc:opendocument:xmlns:container"
+OPF_NS = "http://www.idpf.org/2007/opf"
+DC_NS = "http://purl.org/dc/elements/1.1/"
+
+# Number of archives kept open at once
+ARCHIVE_CACHE_SIZE = 128
+
+# Upper bound on threads used to read metadata for many EPUBs at once
+METADATA_WORKERS = 16
+
+
+class EPUBArchive:
+    """An open EPUB ZIP file together with its parsed OPF package document"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.zip_file = zipfile.ZipFile(path, "r")
+        try:
+            self.opf_path = self._find_opf_path()
+            self.opf_root = etree.fromstring(self.zip_file.read(self.opf_path))
+        except Exception:
+            self.zip_file.close()
+            raise
+
+        # Manifest hrefs are relative to the directory holding the OPF file
+        self.opf_dir = posixpath.dirname(self.opf_path)
+
+    def _find_opf_path(self) -> str:
+        container_root = etree.fromstring(self.zip_file.read("META-INF/container.xml"))
+        for rootfile in container_root.findall(f".//{{{CONTAINER_NS}}}rootfile"):
+            full_path = rootfile.get("full-path")
+            if full_path:
+                return full_path
+        raise ValueError(f"No OPF rootfile declared in {self.path.name}")
+
+    def resolve_href(self, href: str) -> str:
+        """
+        Convert a manifest href (relative to the OPF file) into a ZIP member name
+        """
+        if self.opf_dir:
+            return f"{self.opf_dir}/{href}"
+        return href
+
+    @cached_property
+    def image_names(self) -> list[str]:
+        """
+        Manifest image hrefs in manifest order, unquoted like ebooklib's item
+        names (relative to the OPF directory)
+        """
+        return [
+            unquote(item.get("href"))
+            for item in self.opf_root.iterfind(f"{{{OPF_NS}}}manifest/{{{OPF_NS}}}item")
+            if item.get("href") and (item.get("media-type") or "").startswith("image/")
+        ]
+
+    @cached_property
+    def image_name_index(self) -> ImageNameIndex:
+        """Lookup of requested image paths over image_names"""
+        return ImageNameIndex(self.image_names)
+
+    @cached_property
+    def metadata(self) -> "OPFMetadata":
+        """Metadata of the already parsed OPF, so cached archives walk it once"""
+        return OPFMetadata(self.opf_root)
+
+    def close(self) -> None:
+        self.zip_file.close()
+
+
+class OPFMetadata:
+    """
+    Dublin Core metadata and document count read straight from an OPF file.
+
+    get_metadata() returns the same [(value, attributes)] shape as ebooklib's
+    EpubBook, so existing metadata helpers accept either object.
+    """
+
+    def __init__(self, opf_root: etree._Element):
+        self._dc: dict[str, list[tuple[str, dict[str, str]]]] = {}
+
+        metadata = opf_root.find(f"{{{OPF_NS}}}metadata")
+        if metadata is not None:
+            dc_prefix = f"{{{DC_NS}}}"
+            for element in metadata:
+                if isinstance(element.tag, str) and element.tag.startswith(dc_prefix):
+                    name = element.tag[len(dc_prefix) :]
+                    self._dc.setdefault(name, []).append(
+                        (element.text or "", dict(element.attrib))
+                    )
+
+        # Matches ebooklib, which treats every XHTML manifest item (including
+        # the nav and cover pages) as ITEM_DOCUMENT
+        self.document_count = sum(
+            1
+            for item in opf_root.iterfind(f"{{{OPF_NS}}}manifest/{{{OPF_NS}}}item")
+            if item.get("media-type") == "application/xhtml+xml"
+        )
+
+    def get_metadata(self, namespace: str, name: str) -> list[tuple[str, dict]]:
+        if namespace not in ("DC", DC_NS):
+            return []
+        return self._dc.get(name, [])
+
+
+def read_opf_metadata(path: Path, shared: bool = False) -> OPFMetadata:
+    """
+    Read metadata from the OPF package document without loading the book.
+
+    Only container.xml and the OPF are decompressed, unlike epub.read_epub
+    which reads every manifest item. By default the archive is not added to
+    the shared cache so a library scan doesn't evict archives that are in
+    active use. Single-book callers pass shared=True so that the cover lookup
+    and thumbnail for the same book reuse this open ZIP and parsed OPF.
+    """
+    if shared:
+        return open_epub_archive(path).metadata
+
+    archive = EPUBArchive(path)
+    try:
+        return OPFMetadata(archive.opf_root)
+    finally:
+        archive.close()
+
+
+def read_epub_metadata(
+    path: Path, shared: bool = False
+) -> tuple[OPFMetadata | epub.EpubBook, int]:
+    """
+    Return a metadata source and chapter count for an EPUB.
+
+    Reads only the OPF package document, falling back to a full
+    epub.read_epub if the archive can't be parsed that way. Either source
+    answers get_metadata() the same way. shared is passed to
+    read_opf_metadata.
+    """
+    try:
+        opf_metadata = read_opf_metadata(path, shared)
+        return opf_metadata, opf_metadata.document_count
+    except Exception as e:
+        logger.debug(f"Fast OPF read failed for {path.name}, using ebooklib: {e}")
+        book = epub.read_epub(str(path))
+        return book, sum(1 for _ in book.get_items_of_type(ebooklib.ITEM_DOCUMENT))
+
+
+_archive_cache: OrderedDict[tuple[str, int, int], EPUBArchive] = OrderedDict()
+_archive_cache_lock = threading.Lock()
+
+
+def open_epub_archive(path: Path) -> EPUBArchive:
+    """
+    Return a cached EPUBArchive for path, opening and parsing it on a miss.
+
+    Entries are keyed by (path, st_mtime_ns, st_size), so replacing a file on
+    disk naturally produces a fresh entry. Evicted archives are not closed
+    explicitly because another thread may still be reading from them; the
+    underlying file is closed when the last reference is dropped.
+    """
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+
+    with _archive_cache_lock:
+        archive = _archive_cache.get(key)
+        if archive is not None:
+            _archive_cache.move_to_end(key)
+            return archive
+
+    # Parse outside the lock so a slow archive doesn't block other lookups
+    archive = EPUBArchive(path)
+
+    with _archive_cache_lock:
+        _archive_cache[key] = archive
+        _archive_cache.move_to_end(key)
+        while len(_archive_cache) > ARCHIVE_CACHE_SIZE:
+            _archive_cache.popitem(last=False)
+
+    return archive
+
+
+def clear_archive_cache() -> None:
+    """Drop every cached archive (used when the library is refreshed)"""
+    with _archive_cache_lock:
+        _archive_cache.clear()
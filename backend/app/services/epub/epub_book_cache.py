@@ -0,0 +1,112 @@
+"""
+Process-wide cache of parsed EPUB books
+ebooklib's read_epub unzips and parses every item in the archive, so parsed
+books are reused across requests until the file on disk changes
+"""
+
+import posixpath
+from functools import lru_cache, partial
+from pathlib import Path
+from urllib.parse import unquote
+
+from ebooklib import epub
+
+from .epub_archive import OPF_NS, open_epub_archive
+
+# Parsed books hold every chapter in memory, so keep the cache modest
+BOOK_CACHE_SIZE = 32
+
+# Manifest items of these media types are read from the ZIP when first asked
+# for instead of at parse time. They are usually the bulk of an EPUB's bytes
+# but are only needed when an image is served or a cover is guessed.
+DEFERRED_MEDIA_PREFIXES = (
+    "image/",
+    "audio/",
+    "video/",
+    "font/",
+    "application/font",
+    "application/x-font",
+    "application/vnd.ms-opentype",
+)
+
+
+def _read_deferred_content(
+    path: Path, mtime_ns: int, size: int, name: str, default=None
+) -> bytes:
+    # Signature (after the bound arguments) matches EpubItem.get_content.
+    # The book was parsed from the file version (mtime_ns, size); reading a
+    # replaced file's members would return another book's bytes.
+    stat = path.stat()
+    if (stat.st_mtime_ns, stat.st_size) != (mtime_ns, size):
+        raise FileNotFoundError(f"{path} changed since it was parsed")
+    return open_epub_archive(path).zip_file.read(name)
+
+
+class _DeferredContentReader(epub.EpubReader):
+    """
+    EpubReader that leaves binary resources in the archive.
+    Their items get a get_content() that reads the member through the shared
+    archive cache, so the parsed book only holds text content.
+    """
+
+    _deferred_names: frozenset[str] = frozenset()
+
+    def __init__(self, epub_file_name: str, mtime_ns: int, size: int, options=None):
+        super().__init__(epub_file_name, options)
+        # Version of the file being parsed, checked by deferred reads
+        self._mtime_ns = mtime_ns
+        self._size = size
+
+    def _load_manifest(self):
+        manifest = self.container.find(f"{{{OPF_NS}}}manifest")
+        deferred_names = set()
+        for item in manifest if manifest is not None else ():
+            href = item.get("href")
+            media_type = item.get("media-type") or ""
+            if href and media_type.startswith(DEFERRED_MEDIA_PREFIXES):
+                deferred_names.add(self._member_name(unquote(href)))
+        self._deferred_names = frozenset(deferred_names)
+
+        super()._load_manifest()
+
+        path = Path(self.file_name)
+        for item in self.book.get_items():
+            name = self._member_name(item.get_name())
+            if name in self._deferred_names:
+                item.get_content = partial(
+                    _read_deferred_content, path, self._mtime_ns, self._size, name
+                )
+
+    def _member_name(self, href: str) -> str:
+        return posixpath.normpath(posixpath.join(self.opf_dir, href))
+
+    def read_file(self, name):
+        if posixpath.normpath(name) in self._deferred_names:
+            return b""
+        return super().read_file(name)
+
+
+@lru_cache(maxsize=BOOK_CACHE_SIZE)
+def _read_epub(path_str: str, mtime_ns: int, size: int) -> epub.EpubBook:
+    # mtime_ns and size are only part of the cache key: a rewritten file gets
+    # a new entry even if the copy preserved its mtime
+    reader = _DeferredContentReader(path_str, mtime_ns, size)
+    book = reader.load()
+    reader.process()
+    return book
+
+
+def read_epub_cached(file_path: Path) -> epub.EpubBook:
+    """
+    Return the parsed EpubBook for file_path, reusing a cached copy when the
+    file hasn't been modified since it was parsed.
+
+    The returned book is shared between callers and must be treated as read-only.
+    """
+    stat = file_path.stat()
+    return _read_epub(str(file_path), stat.st_mtime_ns, stat.st_size)
+
+
+def clear_book_cache() -> None:
+    """Drop every cached book (used when the library is refreshed)"""
+    _read_epub.cache_clear()
@@ -0,0 +1,218 @@
+"""
+Hashtable lookups over the items of a parsed EPUB
+ebooklib's get_item_with_id() and get_items() scans are linear in the number of
+manifest items, which turns per-TOC-entry and per-spine-item lookups into
+O(entries x items). The index is built once per book and shared by the services
+"""
+
+import posixpath
+import threading
+import weakref
+from functools import cached_property
+
+import ebooklib
+
+from .epub_url_helper import EPUBURLHelper
+
+# Spine documents are bucketed by this many trailing characters of their name
+# without its extension (see spine_candidates)
+SPINE_SUFFIX_KEY_LENGTH = 3
+
+
+def _is_document_item(item) -> bool:
+    """Some ebooklib builds report document items with type 0 instead of ITEM_DOCUMENT."""
+    try:
+        item_type = item.get_type()
+    except Exception:
+        return False
+    return item_type in {getattr(ebooklib, "ITEM_DOCUMENT", None), 0}
+
+
+class EPUBBookIndex:
+    """Id and file-name lookups for the items of one book"""
+
+    def __init__(self, book):
+        items = list(book.get_items())
+
+        # setdefault keeps the first item, matching ebooklib's linear scans
+        self._by_id: dict[str, object] = {}
+        self._by_name: dict[str, object] = {}
+        for item in items:
+            self._by_id.setdefault(item.get_id(), item)
+            self._by_name.setdefault(item.get_name(), item)
+
+        self._documents = [item for item in items if _is_document_item(item)]
+        self._documents_by_name: dict[str, object] = {}
+        self._documents_by_basename: dict[str, list] = {}
+        for item in self._documents:
+            name = item.get_name()
+            self._documents_by_name.setdefault(name, item)
+            self._documents_by_basename.setdefault(posixpath.basename(name), []).append(
+                item
+            )
+
+        # The index is stored against the book in a WeakKeyDictionary, so it
+        # must not keep a reference to the book itself
+        self.spine_documents: list[tuple[int, str]] = []
+        self._spine_positions_by_id: dict[str, list[int]] = {}
+        for position, (item_id, _) in enumerate(book.spine):
+            self._spine_positions_by_id.setdefault(item_id, []).append(position)
+            item = self._by_id.get(item_id)
+            if item is not None and _is_document_item(item):
+                self.spine_documents.append((position, item.get_name()))
+
+        self._spine_by_stem_suffix: dict[str, list[tuple[int, str]]] = {}
+        self._unbucketed_spine: list[tuple[int, str]] = []
+        for position, name in self.spine_documents:
+            key = self._stem_suffix_key(name)
+            if key is None:
+                self._unbucketed_spine.append((position, name))
+            else:
+                self._spine_by_stem_suffix.setdefault(key, []).append((position, name))
+
+    @staticmethod
+    def _stem_suffix_key(name: str) -> str | None:
+        if "." not in name:
+            return None
+        stem = name.rsplit(".", 1)[0]
+        if len(stem) < SPINE_SUFFIX_KEY_LENGTH:
+            return None
+        return stem[-SPINE_SUFFIX_KEY_LENGTH:]
+
+    def spine_candidates(self, href: str) -> list[tuple[int, str]]:
+        """
+        Return the (position, name) spine documents that can match href, in
+        spine order.
+
+        Navigation matches one name being a suffix of the other, with or
+        without extensions. When both strings have an extension, either
+        relation makes one extension-less name a suffix of the other, so
+        both end in the same SPINE_SUFFIX_KEY_LENGTH characters and only that
+        bucket needs checking. Callers still apply their own comparison.
+        """
+        key = self._stem_suffix_key(href)
+        if key is None:
+            return self.spine_documents
+        candidates = self._spine_by_stem_suffix.get(key, [])
+        if self._unbucketed_spine:
+            candidates = sorted(candidates + self._unbucketed_spine)
+        return candidates
+
+    def get_spine_positions(self, item_ids) -> list[int]:
+        """Sorted spine positions of the given item ids, without scanning the spine"""
+        positions: set[int] = set()
+        for item_id in item_ids:
+            positions.update(self._spine_positions_by_id.get(item_id, ()))
+        return sorted(positions)
+
+    @cached_property
+    def image_name_index(self) -> "ImageNameIndex":
+        """Lookup of requested image paths over the book's image items"""
+        return ImageNameIndex(
+            item.get_name()
+            for item in self._by_id.values()
+            if item.get_type() == ebooklib.ITEM_IMAGE
+        )
+
+    def get_item_with_id(self, item_id: str):
+        """Equivalent to book.get_item_with_id() without the linear scan"""
+        return self._by_id.get(item_id)
+
+    def get_item_with_name(self, name: str):
+        """Return the item whose file name is exactly name, if any"""
+        return self._by_name.get(name)
+
+    def find_document_by_href(self, href: str):
+        """
+        Return a document item whose name equals href or ends with it.
+        Exact names and same-basename suffixes are hashtable lookups; only
+        unresolved hrefs fall back to scanning the documents.
+        """
+        if not href:
+            return None
+
+        item = self._documents_by_name.get(href)
+        if item is not None:
+            return item
+
+        for item in self._documents_by_basename.get(posixpath.basename(href), ()):
+            if item.get_name().endswith(href):
+                return item
+
+        # A suffix that doesn't start on a path segment, e.g. "1.xhtml" for
+        # "ch1.xhtml"; rare, so a scan is fine here
+        for item in self._documents:
+            if item.get_name().endswith(href):
+                return item
+
+        return None
+
+
+class ImageNameIndex:
+    """
+    Resolves a requested image path to one of an EPUB's image names.
+
+    Gives the same answer as scanning the names in order for the first whose
+    cleaned name equals the path, or whose name ends with it, then falling
+    back to the first name with the same file name. A name ending with a path
+    must end with that path's last segment, so suffix matches are found by
+    bucketing names under every suffix of their file name.
+    """
+
+    def __init__(self, names):
+        self._names = list(names)
+        self._by_clean_name: dict[str, int] = {}
+        self._by_basename: dict[str, int] = {}
+        self._by_basename_suffix: dict[str, list[int]] = {}
+        for position, name in enumerate(self._names):
+            clean_name = EPUBURLHelper.extract_image_path_from_epub_item(name)
+            self._by_clean_name.setdefault(clean_name, position)
+            basename = name.split("/")[-1]
+            self._by_basename.setdefault(basename, position)
+            for start in range(len(basename) + 1):
+                self._by_basename_suffix.setdefault(basename[start:], []).append(
+                    position
+                )
+
+    def match(self, image_path: str, normalized_path: str) -> str | None:
+        """Return the image name matching a requested path, if any"""
+        matches = []
+        for path in (image_path, normalized_path):
+            position = self._by_clean_name.get(path)
+            if position is not None:
+                matches.append(position)
+
+            # Buckets are in name order, so the first hit is the earliest
+            for position in self._by_basename_suffix.get(path.split("/")[-1], ()):
+                if self._names[position].endswith(path):
+                    matches.append(position)
+                    break
+
+        if matches:
+            return self._names[min(matches)]
+
+        # If not found, try fallback matching by filename only
+        position = self._by_basename.get(normalized_path.split("/")[-1])
+        return self._names[position] if position is not None else None
+
+
+_book_indexes: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_book_indexes_lock = threading.Lock()
+
+
+def get_book_index(book) -> EPUBBookIndex:
+    """
+    Return the index for book, building it on first use.
+
+    Books come from the shared parsed-book cache and are read-only, so the
+    index lives as long as the book does and never needs invalidating.
+    """
+    with _book_indexes_lock:
+        index = _book_indexes.get(book)
+    if index is not None:
+        return index
+
+    # Build outside the lock; a concurrent duplicate build is harmless
+    index = EPUBBookIndex(book)
+    with _book_indexes_lock:
+        return _book_indexes.setdefault(book, index)
@@ -1,9 +1,12 @@
-import re
+import html
 from typing import Any
 
 import ebooklib
+import lxml.html
 from bs4 import BeautifulSoup
+from lxml import etree
 
+from .epub_book_index import get_book_index
 from .epub_navigation_service import EPUBNavigationService
 from .epub_url_helper import EPUBURLHelper
 
@@ -87,7 +90,7 @@ class EPUBContentProcessor:
             return ""
 
         item_id, _ = book.spine[spine_position]
-        item = book.get_item_with_id(item_id)
+        item = get_book_index(book).get_item_with_id(item_id)
 
         if not self._is_document_item(item):
             return ""
@@ -102,18 +105,20 @@ class EPUBContentProcessor:
         requested_nav_id: str,
         epub_id: int | None = None,
     ) -> tuple[str, list[int]]:
-        combined_content = ""
+        # Chapters are collected and joined once; repeated += on a growing
+        # string recopies everything gathered so far for every spine item
+        content_parts: list[str] = []
         used_positions: list[int] = []
 
         # Primary: use explicit spine positions recorded for the nav entry.
         for pos in nav_entry.get("spine_positions", []) or []:
             html = self._get_single_spine_content(book, pos, filename, epub_id)
             if html:
-                combined_content += html
+                content_parts.append(html)
                 used_positions.append(pos)
 
-        if combined_content:
-            return combined_content, used_positions
+        if content_parts:
+            return "".join(content_parts), used_positions
 
         # Secondary: try using spine item ids to resolve positions.
         item_positions = self._positions_from_item_ids(
@@ -122,22 +127,21 @@ class EPUBContentProcessor:
         for pos in item_positions:
             html = self._get_single_spine_content(book, pos, filename, epub_id)
             if html:
-                combined_content += html
+                content_parts.append(html)
                 used_positions.append(pos)
 
-        if combined_content:
-            return combined_content, used_positions
+        if content_parts:
+            return "".join(content_parts), used_positions
 
         # Final attempt: resolve a specific item by href/nav id.
         candidate_item = self._find_candidate_item(book, nav_entry, requested_nav_id)
         if self._is_document_item(candidate_item):
             html = self._get_processed_item_content(candidate_item, filename, epub_id)
             if html:
-                combined_content = html
                 used_positions = self._positions_from_item_ids(
                     book, [candidate_item.get_id()]
                 )
-                return combined_content, used_positions
+                return html, used_positions
 
         return "", []
 
@@ -151,7 +155,7 @@ class EPUBContentProcessor:
         base_nav_id = nav_id.split("#", 1)[0]
 
         # Try to find an item by exact id first.
-        item = book.get_item_with_id(base_nav_id)
+        item = get_book_index(book).get_item_with_id(base_nav_id)
         if not self._is_document_item(item):
             search_key = base_nav_id.replace(".", "_").replace("/", "_")
             for doc_item in book.get_items():
@@ -230,99 +234,74 @@ class EPUBContentProcessor:
     def _count_readable_sections(self, flat_nav: list[dict[str, Any]]) -> int:
         return sum(1 for entry in flat_nav if self._entry_has_content(entry))
 
-    def _sanitize_html(self, html_content: str) -> str:
+    def _parse_html(self, raw_content: bytes) -> lxml.html.HtmlElement | None:
         """
-        Sanitize HTML content to remove potentially harmful elements
-        and extract only the body content for proper container styling
+        Parse chapter bytes into an HTML tree, or None if there is nothing to parse.
+        Bytes are parsed directly so XHTML files with an XML encoding
+        declaration don't need decoding first.
         """
-        # Remove script tags and their content
-        html_content = re.sub(
-            r"<script[^>]*>.*?</script>",
-            "",
-            html_content,
-            flags=re.DOTALL | re.IGNORECASE,
-        )
-
-        # Remove inline event handlers
-        html_content = re.sub(
-            r'\s+on\w+\s*=\s*[\'"][^\'"]*[\'"]', "", html_content, flags=re.IGNORECASE
-        )
-        html_content = re.sub(
-            r"\s+on\w+\s*=\s*[^\s>]+", "", html_content, flags=re.IGNORECASE
-        )
-
-        # Remove javascript: protocols from href and src attributes
-        html_content = re.sub(
-            r'(href|src)\s*=\s*[\'"]javascript:[^\'"]*[\'"]',
-            "",
-            html_content,
-            flags=re.IGNORECASE,
-        )
-
-        # Extract content from body tag if it exists
-        # This prevents EPUB body/html styles from interfering with our container
-        body_match = re.search(
-            r"<body[^>]*>(.*?)</body>", html_content, flags=re.DOTALL | re.IGNORECASE
-        )
+        # Parsers aren't safe to share between request threads, and creating
+        # one is cheap compared to parsing a chapter
+        parser = lxml.html.HTMLParser(encoding="utf-8")
+        try:
+            return lxml.html.document_fromstring(raw_content, parser=parser)
+        except (etree.ParserError, ValueError):
+            return None
 
-        if body_match:
-            # Use only the content inside the body tag
-            html_content = body_match.group(1)
-        else:
-            # If no body tag, remove html and head tags if present
-            # Remove head section entirely
-            html_content = re.sub(
-                r"<head[^>]*>.*?</head>",
-                "",
-                html_content,
-                flags=re.DOTALL | re.IGNORECASE,
-            )
+    def _sanitize_tree(self, root: lxml.html.HtmlElement) -> None:
+        """
+        Remove potentially harmful elements and attributes from a parsed chapter
+        """
+        # Remove script tags and their content (drop_tree keeps the tail text)
+        for script in list(root.iter("script")):
+            script.drop_tree()
 
-            # Remove html and body opening/closing tags but keep content
-            html_content = re.sub(
-                r"</?html[^>]*>",
-                "",
-                html_content,
-                flags=re.IGNORECASE,
-            )
-            html_content = re.sub(
-                r"</?body[^>]*>",
-                "",
-                html_content,
-                flags=re.IGNORECASE,
-            )
+        for element in root.iter():
+            # Comments and processing instructions have no attributes
+            if not isinstance(element.tag, str):
+                continue
 
-        # Remove any remaining doctype declarations
-        html_content = re.sub(
-            r"<!DOCTYPE[^>]*>",
-            "",
-            html_content,
-            flags=re.IGNORECASE,
-        )
+            for name in list(element.attrib):
+                lowered = name.lower()
+                # Remove inline event handlers
+                if lowered.startswith("on"):
+                    del element.attrib[name]
+                # Remove javascript: protocols from href and src attributes,
+                # including namespaced forms such as xlink:href on SVG links
+                elif lowered.rsplit(":", 1)[-1] in ("href", "src") and (
+                    element.attrib[name].strip().lower().startswith("javascript:")
+                ):
+                    del element.attrib[name]
 
-        # Clean up extra whitespace
-        html_content = html_content.strip()
+    def _serialize_body(self, root: lxml.html.HtmlElement) -> str:
+        """
+        Serialize only the children of <body>
+        This prevents EPUB body/html styles from interfering with our container
+        """
+        body = root.find("body")
+        if body is None:
+            return ""
 
-        return html_content
+        parts = [html.escape(body.text, quote=False)] if body.text else []
+        # tostring includes each child's tail text, so siblings join seamlessly
+        parts.extend(lxml.html.tostring(child, encoding="unicode") for child in body)
+        return "".join(parts).strip()
 
     def _rewrite_image_paths(
-        self, content: str, filename: str, epub_id: int | None = None
-    ) -> str:
+        self, root: lxml.html.HtmlElement, filename: str, epub_id: int | None = None
+    ) -> None:
         """
-        Rewrite image paths in HTML content to point to our image serving endpoint
+        Rewrite image paths in a parsed chapter to point to our image serving endpoint
         Uses robust URL helper for proper encoding and security
         """
-        # Pattern to match img src attributes
-        img_pattern = r'<img([^>]*?)src\s*=\s*["\']([^"\']*?)["\']([^>]*?)>'
-
-        def replace_img_src(match):
-            before_src = match.group(1)
-            src_path = match.group(2)
-            after_src = match.group(3)
+        for img in root.iter("img"):
+            src_path = img.get("src")
+            if src_path is None:
+                continue
 
             # Skip if already an absolute URL
             if src_path.startswith(("http://", "https://", "data:", "blob:")):
-                return match.group(0)
+                continue
 
             # Use ID-based URL builder if epub_id is available, otherwise fall back to filename
             if epub_id is not None:
@@ -335,12 +314,8 @@ class EPUBContentProcessor:
                 )
 
             # If URL building failed, keep original
-            if not new_src:
-                return match.group(0)
-
-            return f'<img{before_src}src="{new_src}"{after_src}>'
-
-        return re.sub(img_pattern, replace_img_src, content, flags=re.IGNORECASE)
+            if new_src:
+                img.set("src", new_src)
 
     def _extract_text_from_html(self, html_content: str) -> str:
         """
@@ -370,24 +345,22 @@ class EPUBContentProcessor:
         if not self._is_document_item(item):
             return ""
 
-        try:
-            raw_content = item.get_content().decode("utf-8")
-        except Exception:
+        # Parse once, then sanitize and rewrite image paths on the same tree
+        root = self._parse_html(item.get_content())
+        if root is None:
             return ""
 
-        sanitized_content = self._sanitize_html(raw_content)
-        return self._rewrite_image_paths(sanitized_content, filename, epub_id)
+        self._sanitize_tree(root)
+        self._rewrite_image_paths(root, filename, epub_id)
+        return self._serialize_body(root)
 
     def _positions_from_item_ids(self, book, item_ids: list[str]) -> list[int]:
         if not item_ids:
             return []
 
-        id_set = {item_id for item_id in item_ids if item_id}
-        positions: list[int] = []
-        for idx, (spine_item_id, _) in enumerate(book.spine):
-            if spine_item_id in id_set:
-                positions.append(idx)
-        return sorted(set(positions))
+        return get_book_index(book).get_spine_positions(
+            item_id for item_id in item_ids if item_id
+        )
 
     def _find_candidate_item(
         self, book, nav_entry: dict[str, Any], requested_nav_id: str
@@ -406,21 +379,16 @@ class EPUBContentProcessor:
         for candidate in candidates:
             if not candidate:
                 continue
-            item = book.get_item_with_id(candidate)
+            item = get_book_index(book).get_item_with_id(candidate)
             if self._is_document_item(item):
                 return item
 
         # Fallback: try matching by file name
-        name_candidates = [href.split("#", 1)[0], base_nav_id]
-        for item in book.get_items():
-            if not self._is_document_item(item):
-                continue
-            item_name = item.get_name()
-            for candidate in name_candidates:
-                if candidate and (
-                    item_name == candidate or item_name.endswith(candidate)
-                ):
-                    return item
+        book_index = get_book_index(book)
+        for candidate in (href.split("#", 1)[0], base_nav_id):
+            item = book_index.find_document_by_href(candidate)
+            if item:
+                return item
 
         return None
 
@@ -430,7 +398,7 @@ class EPUBContentProcessor:
             return str(title)
 
         for item_id in nav_entry.get("spine_item_ids", []) or []:
-            item = book.get_item_with_id(item_id)
+            item = get_book_index(book).get_item_with_id(item_id)
             if self._is_document_item(item):
                 return (
                     item.get_name()
@@ -1,20 +1,195 @@
 import io
+import logging
+import multiprocessing
+import os
+import posixpath
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import ebooklib
-from ebooklib import epub
+from lxml import etree
 from PIL import Image
 
+from .epub_archive import OPF_NS, EPUBArchive, open_epub_archive
+from .epub_book_cache import read_epub_cached
+from .epub_book_index import get_book_index
 from .epub_url_helper import EPUBURLHelper
 
+logger = logging.getLogger(__name__)
+
+# Covers more than this many times larger than the thumbnail are first reduced
+# by an integer factor before the final LANCZOS pass. The result is
+# indistinguishable at thumbnail size and the expensive filter touches far
+# fewer pixels. Resampling also speeds up transparently under Pillow-SIMD (see
+# README).
+THUMBNAIL_REDUCING_GAP = 3.0
+
+# Thumbnails are only ever rendered at these sizes. Requests snap to the
+# nearest bucket by width, and a cover is decoded once to render all of them,
+# so any later size request is served from disk.
+THUMBNAIL_SIZE_BUCKETS = [(100, 140), (200, 280), (400, 560)]
+
+
+# Covers are photographic, so JPEG is several times smaller and faster to
+# encode than PNG at no visible cost at thumbnail size
+THUMBNAIL_SAVE_OPTIONS = {"format": "JPEG", "quality": 85, "optimize": True}
+
+# JPEG covers are decoded at the smallest libjpeg scale (1/2, 1/4 or 1/8) that
+# still covers twice the largest bucket, so the final LANCZOS pass keeps full
+# quality. draft() is a no-op for other formats.
+THUMBNAIL_DRAFT_SIZE = (
+    2 * max(width for width, _ in THUMBNAIL_SIZE_BUCKETS),
+    2 * max(height for _, height in THUMBNAIL_SIZE_BUCKETS),
+)
+
+
+# Modes Image.reduce() accepts
+REDUCIBLE_MODES = ("RGB", "RGBA", "L", "LA", "CMYK")
+
+
+def snap_thumbnail_size(width: int, height: int) -> tuple[int, int]:
+    """Return the thumbnail size bucket closest to the requested width"""
+    return min(THUMBNAIL_SIZE_BUCKETS, key=lambda size: abs(size[0] - width))
+
+
+def _generate_thumbnail_worker(
+    thumbnails_dir: str,
+    file_path: str,
+    width: int,
+    height: int,
+    background_color: str,
+    strategy: str,
+) -> str:
+    """
+    Process pool entry point for thumbnail generation.
+    Lives at module level so it can be pickled; arguments and result are
+    plain strings so nothing heavier than a path crosses the process boundary.
+    """
+    service = EPUBImageService(thumbnails_dir)
+    thumbnail_path = service.generate_thumbnail(
+        Path(file_path), width, height, background_color, strategy
+    )
+    return str(thumbnail_path)
+
+
+class ZipImageItem:
+    """
+    Image item backed directly by a ZIP member, for covers ebooklib can't provide.
+    Mirrors the parts of the ebooklib item interface used here, plus open()
+    for streaming the image without materializing its bytes.
+    """
+
+    def __init__(self, zip_file: zipfile.ZipFile, id: str, name: str, path: str):
+        self._zip_file = zip_file
+        self._id = id
+        self._name = name
+        self._path = path
+
+    def get_id(self):
+        return self._id
+
+    def get_name(self):
+        return self._name
+
+    def get_content(self):
+        return self._zip_file.read(self._path)
+
+    def get_type(self):
+        return ebooklib.ITEM_IMAGE
+
+    def get_size(self) -> int:
+        """Uncompressed size from the central directory, without decompressing"""
+        return self._zip_file.getinfo(self._path).file_size
+
+    def open(self):
+        return self._zip_file.open(self._path)
+
 
 class EPUBImageService:
+    # Pre-compiled XPath expressions for performance
+    _COVER_META_ID_XPATH = etree.XPath(
+        '//opf:meta[@name="cover"]/@content', namespaces={"opf": OPF_NS}
+    )
+    _COVER_IMAGE_ID_XPATH = etree.XPath(
+        '//opf:item[contains(@properties, "cover-image")]/@id',
+        namespaces={"opf": OPF_NS},
+    )
+    _ITEM_BY_ID_XPATH = etree.XPath(
+        "//opf:item[@id=$item_id]", namespaces={"opf": OPF_NS}
+    )
+
     def __init__(self, thumbnails_dir: str = "thumbnails"):
         self.thumbnails_dir = Path(thumbnails_dir)
         if not self.thumbnails_dir.exists():
             self.thumbnails_dir.mkdir(exist_ok=True)
 
+    def generate_thumbnails_bulk(
+        self,
+        file_paths: list[Path],
+        width: int = 200,
+        height: int = 280,
+        background_color: str = "white",
+        strategy: str = "center",
+    ) -> list[Path | None]:
+        """
+        Generate thumbnails for many EPUBs in parallel, one cover per CPU core.
+        Decoding, resizing and JPEG encoding are CPU-bound, so a process pool
+        scales where threads would serialize on the GIL.
+
+        Args:
+            file_paths: Paths to EPUB files
+            width: Target thumbnail width
+            height: Target thumbnail height
+            background_color: Background color for padding
+            strategy: Sizing strategy - "center" (default) or "fill"
+
+        Returns:
+            Thumbnail paths, in the same order as file_paths. A cover whose
+            worker failed is logged and left as None.
+        """
+        if not file_paths:
+            return []
+
+        if len(file_paths) == 1:
+            # Not worth spawning worker processes for a single cover
+            return [
+                self.generate_thumbnail(
+                    file_paths[0], width, height, background_color, strategy
+                )
+            ]
+
+        # The pool lives for one batch only: batches are rare (startup sweep,
+        # library refresh), so idle worker interpreters aren't kept around.
+        # Use "spawn" so workers don't inherit the server's threads and locks.
+        thumbnail_paths: list[Path | None] = []
+        with ProcessPoolExecutor(
+            max_workers=min(os.cpu_count() or 1, len(file_paths)),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            futures = [
+                pool.submit(
+                    _generate_thumbnail_worker,
+                    str(self.thumbnails_dir),
+                    str(file_path),
+                    width,
+                    height,
+                    background_color,
+                    strategy,
+                )
+                for file_path in file_paths
+            ]
+
+            for file_path, future in zip(file_paths, futures):
+                try:
+                    thumbnail_paths.append(Path(future.result()))
+                except Exception as e:
+                    # Includes BrokenProcessPool if a worker died
+                    logger.warning(f"Failed to generate thumbnail for {file_path}: {e}")
+                    thumbnail_paths.append(None)
+
+        return thumbnail_paths
+
     def generate_thumbnail(
         self,
         file_path: Path,
@@ -22,6 +197,7 @@ class EPUBImageService:
         height: int = 280,
         background_color: str = "white",
         strategy: str = "center",
+        epub_stat: os.stat_result | None = None,
     ) -> Path:
         """
         Generate a thumbnail image of the EPUB cover
@@ -29,95 +205,232 @@ class EPUBImageService:
 
         Args:
             file_path: Path to EPUB file
-            width: Target thumbnail width
-            height: Target thumbnail height
+            width: Target thumbnail width, snapped to THUMBNAIL_SIZE_BUCKETS
+            height: Target thumbnail height, snapped along with width
             background_color: Background color for padding (white, #f0f0f0, etc.)
             strategy: Sizing strategy - "center" (default) or "fill"
+            epub_stat: Stat result for file_path, if the caller already has one
         """
-        # Create thumbnail filename with dimensions for caching
-        thumbnail_filename = f"{file_path.stem}_thumb_{width}x{height}.png"
-        thumbnail_path = self.thumbnails_dir / thumbnail_filename
+        width, height = snap_thumbnail_size(width, height)
+        thumbnail_path = self.get_thumbnail_path(file_path, width, height)
 
-        # Check if thumbnail already exists and is newer than the EPUB
-        if thumbnail_path.exists():
-            epub_mtime = file_path.stat().st_mtime
+        # Check if thumbnail already exists and is newer than the EPUB. A single
+        # stat() doubles as the existence check.
+        try:
             thumb_mtime = thumbnail_path.stat().st_mtime
+        except FileNotFoundError:
+            thumb_mtime = None
+
+        if thumb_mtime is not None:
+            epub_mtime = (epub_stat or file_path.stat()).st_mtime
             if thumb_mtime > epub_mtime:
                 return thumbnail_path
 
         try:
-            # Open EPUB
-            book = epub.read_epub(str(file_path))
+            # Find the cover from the ZIP directory and OPF alone
+            cover_image = self._find_zip_cover_item(file_path)
 
-            # Try to find cover image using EPUB specification methods
-            cover_image = self._find_cover_image(book, str(file_path))
+            if cover_image is None:
+                # Fall back to loading the book if the OPF couldn't be used
+                book = read_epub_cached(file_path)
+                cover_image = self._find_cover_image(book, str(file_path))
 
             if cover_image:
-                # Convert image data to PIL Image
-                image_data = io.BytesIO(cover_image.get_content())
-                img = Image.open(image_data)
-
-                if strategy == "fill":
-                    # Fill strategy: crop to exact aspect ratio, then resize
-                    target_ratio = width / height
-                    img_ratio = img.width / img.height
-
-                    if img_ratio > target_ratio:
-                        # Image is wider - crop width
-                        new_width = int(img.height * target_ratio)
-                        left = (img.width - new_width) // 2
-                        img = img.crop((left, 0, left + new_width, img.height))
-                    else:
-                        # Image is taller - crop height
-                        new_height = int(img.width / target_ratio)
-                        top = (img.height - new_height) // 2
-                        img = img.crop((0, top, img.width, top + new_height))
-
-                    # Resize to exact target size
-                    thumb = img.resize((width, height), Image.Resampling.LANCZOS)
-                else:
-                    # Center strategy: maintain aspect ratio with padding
-                    img.thumbnail((width, height), Image.Resampling.LANCZOS)
-
-                    # Create background with specified color
-                    thumb = Image.new("RGB", (width, height), background_color)
-
-                    # Calculate position to center the image
-                    x = (width - img.width) // 2
-                    y = (height - img.height) // 2
-
-                    thumb.paste(img, (x, y))
-
-                # Save thumbnail
-                thumb.save(str(thumbnail_path), "PNG")
+                img = self._prereduce_cover(self._load_cover_image(cover_image))
+
+                # Decoding dominates, so render every bucket from this one
+                # decode; later requests for other sizes are plain file reads
+                for bucket_width, bucket_height in THUMBNAIL_SIZE_BUCKETS:
+                    thumb = self._render_thumbnail(
+                        img.copy(),
+                        bucket_width,
+                        bucket_height,
+                        background_color,
+                        strategy,
+                    )
+                    bucket_path = self.get_thumbnail_path(
+                        file_path, bucket_width, bucket_height
+                    )
+                    thumb.save(str(bucket_path), **THUMBNAIL_SAVE_OPTIONS)
                 return thumbnail_path
             else:
                 # No cover image found, create a default thumbnail
-                thumb = Image.new("RGB", (width, height), "#f0f0f0")
-                # Could add text here for the book title
-                thumb.save(str(thumbnail_path), "PNG")
+                self._save_placeholder_thumbnails(file_path)
                 return thumbnail_path
 
         except Exception:
             # If thumbnail generation fails, create a default thumbnail
-            thumb = Image.new("RGB", (width, height), "#f0f0f0")
-            thumb.save(str(thumbnail_path), "PNG")
+            self._save_placeholder_thumbnails(file_path)
             return thumbnail_path
 
+    def _save_placeholder_thumbnails(self, file_path: Path) -> None:
+        """
+        Write the plain placeholder at every bucket size, so a book without a
+        usable cover leaves the same files as one with a cover
+        """
+        for bucket_width, bucket_height in THUMBNAIL_SIZE_BUCKETS:
+            thumb = Image.new("RGB", (bucket_width, bucket_height), "#f0f0f0")
+            # Could add text here for the book title
+            thumb.save(
+                str(self.get_thumbnail_path(file_path, bucket_width, bucket_height)),
+                **THUMBNAIL_SAVE_OPTIONS,
+            )
+
+    def _prereduce_cover(self, img: Image.Image) -> Image.Image:
+        """
+        Box-reduce a decoded cover by an integer factor down to about the
+        draft size, once for all buckets. JPEG covers usually arrive there
+        already through draft(); this catches large PNG and GIF covers, and
+        every bucket then copies and resamples the smaller image.
+        """
+        factor = min(
+            img.width // THUMBNAIL_DRAFT_SIZE[0],
+            img.height // THUMBNAIL_DRAFT_SIZE[1],
+        )
+        # reduce() doesn't support palette or bilevel images
+        if factor > 1 and img.mode in REDUCIBLE_MODES:
+            return img.reduce(factor)
+        return img
+
+    def _render_thumbnail(
+        self,
+        img: Image.Image,
+        width: int,
+        height: int,
+        background_color: str,
+        strategy: str,
+    ) -> Image.Image:
+        """
+        Scale a decoded cover to exactly width x height
+        img may be modified in place, so callers rendering several sizes
+        should pass a copy
+        """
+        if strategy == "fill":
+            # Fill strategy: crop to exact aspect ratio, then resize
+            target_ratio = width / height
+            img_ratio = img.width / img.height
+
+            if img_ratio > target_ratio:
+                # Image is wider - crop width
+                new_width = int(img.height * target_ratio)
+                left = (img.width - new_width) // 2
+                img = img.crop((left, 0, left + new_width, img.height))
+            else:
+                # Image is taller - crop height
+                new_height = int(img.width / target_ratio)
+                top = (img.height - new_height) // 2
+                img = img.crop((0, top, img.width, top + new_height))
+
+            # Resize to exact target size. For large downscales, reducing_gap
+            # shrinks by an integer factor with a cheap box filter first so
+            # LANCZOS only runs on the last step
+            img = img.resize(
+                (width, height),
+                Image.Resampling.LANCZOS,
+                reducing_gap=THUMBNAIL_REDUCING_GAP,
+            )
+            if img.mode == "RGB":
+                return img
+
+            # JPEG can't store alpha or palette images, so flatten the cover
+            # onto the background color
+            rgba = img.convert("RGBA")
+            thumb = Image.new("RGB", (width, height), background_color)
+            thumb.paste(rgba, mask=rgba)
+            return thumb
+
+        # Center strategy: maintain aspect ratio with padding
+        img.thumbnail(
+            (width, height),
+            Image.Resampling.LANCZOS,
+            reducing_gap=THUMBNAIL_REDUCING_GAP,
+        )
+
+        if img.size == (width, height) and img.mode == "RGB":
+            # Cover already fills the frame and is opaque RGB, so there is no
+            # padding to draw
+            return img
+
+        # Create background with specified color
+        thumb = Image.new("RGB", (width, height), background_color)
+
+        # Calculate position to center the image
+        x = (width - img.width) // 2
+        y = (height - img.height) // 2
+
+        thumb.paste(img, (x, y))
+        return thumb
+
+    def _load_cover_image(self, cover_image) -> Image.Image:
+        """
+        Decode a cover item into a PIL image.
+        ZIP-backed items are decoded straight from the compressed stream, so the
+        full cover bytes are never held in memory next to the decoded pixels.
+        """
+        if isinstance(cover_image, ZipImageItem):
+            with cover_image.open() as image_stream:
+                img = Image.open(image_stream)
+                img.draft(None, THUMBNAIL_DRAFT_SIZE)
+                img.load()
+            return img
+
+        # ebooklib already holds the bytes; BytesIO shares the buffer without copying
+        img = Image.open(io.BytesIO(cover_image.get_content()))
+        img.draft(None, THUMBNAIL_DRAFT_SIZE)
+        return img
+
     def get_thumbnail_path(
         self, file_path: Path, width: int = 200, height: int = 280
     ) -> Path:
         """
         Get the path to the thumbnail for an EPUB file
         """
-        thumbnail_filename = f"{file_path.stem}_thumb_{width}x{height}.png"
+        width, height = snap_thumbnail_size(width, height)
+        thumbnail_filename = f"{file_path.stem}_thumb_{width}x{height}.jpg"
         return self.thumbnails_dir / thumbnail_filename
 
+    def get_thumbnail_paths(self, file_path: Path) -> list[Path]:
+        """
+        Get the thumbnail path for every size bucket of an EPUB file
+        """
+        return [
+            self.get_thumbnail_path(file_path, width, height)
+            for width, height in THUMBNAIL_SIZE_BUCKETS
+        ]
+
     def get_epub_image(self, book, image_path: str) -> bytes:
         """
         Extract and return a specific image from an EPUB file
         Uses robust URL helper for path normalization and security
         """
+        normalized_path = self._normalize_requested_image_path(image_path)
+
+        book_index = get_book_index(book)
+        name = book_index.image_name_index.match(image_path, normalized_path)
+        if name is None:
+            raise FileNotFoundError(f"Image {image_path} not found in EPUB")
+        return book_index.get_item_with_name(name).get_content()
+
+    def get_epub_image_from_archive(self, epub_path: Path, image_path: str) -> bytes:
+        """
+        Like get_epub_image, but reads the image straight from the ZIP
+        The cached archive's manifest resolves the path, so serving an image
+        never loads the book.
+        """
+        normalized_path = self._normalize_requested_image_path(image_path)
+
+        archive = open_epub_archive(epub_path)
+        name = archive.image_name_index.match(image_path, normalized_path)
+        if name is None:
+            raise FileNotFoundError(f"Image {image_path} not found in EPUB")
+
+        try:
+            return archive.zip_file.read(posixpath.normpath(archive.resolve_href(name)))
+        except KeyError:
+            raise FileNotFoundError(f"Image {image_path} not found in EPUB") from None
+
+    def _normalize_requested_image_path(self, image_path: str) -> str:
+        """Validate a requested image path and return its normalized form"""
         # Validate the image path for security
         if not EPUBURLHelper.is_valid_image_path(image_path):
             raise FileNotFoundError(f"Invalid image path: {image_path}")
@@ -130,39 +443,7 @@ class EPUBImageService:
                 f"Empty image path after normalization: {image_path}"
             )
 
-        # Try to find the image by exact match first
-        for item in book.get_items_of_type(ebooklib.ITEM_IMAGE):
-            item_name = EPUBURLHelper.extract_image_path_from_epub_item(item.get_name())
-
-            # Try multiple matching strategies
-            if (
-                item_name == image_path
-                or item_name == normalized_path
-                or item.get_name() == image_path
-                or item.get_name() == normalized_path
-                or item.get_name().endswith(image_path)
-                or item.get_name().endswith(normalized_path)
-            ):
-                return item.get_content()
-
-        # If not found, try fallback matching by filename only
-        target_filename = (
-            normalized_path.split("/")[-1]
-            if "/" in normalized_path
-            else normalized_path
-        )
-
-        for item in book.get_items_of_type(ebooklib.ITEM_IMAGE):
-            item_filename = (
-                item.get_name().split("/")[-1]
-                if "/" in item.get_name()
-                else item.get_name()
-            )
-
-            if item_filename == target_filename:
-                return item.get_content()
-
-        raise FileNotFoundError(f"Image {image_path} not found in EPUB")
+        return normalized_path
 
     def get_epub_images_list(self, book) -> list[dict[str, str]]:
         """
@@ -176,7 +457,40 @@ class EPUBImageService:
 
         return images
 
-    def _find_cover_image(self, book, epub_path: str = None):
+    def _find_opf_cover_item(self, epub_path: Path) -> ZipImageItem | None:
+        """
+        Find the cover declared in the OPF and return it as a ZIP-backed item.
+        Only container.xml and the OPF are parsed, so a book with a declared
+        cover never needs a full ebooklib load.
+        """
+        try:
+            return self._find_declared_cover(open_epub_archive(epub_path))
+        except Exception as e:
+            logger.warning(f"OPF parsing failed for {epub_path}: {e}")
+
+        return None
+
+    def _find_declared_cover(self, archive: EPUBArchive) -> ZipImageItem | None:
+        """Return the cover declared in an already opened archive's OPF, if any"""
+        opf_root = archive.opf_root
+
+        # Ids from <meta name="cover" content="cover_id"/>, then from
+        # items with properties="cover-image"
+        cover_ids = [
+            *self._COVER_META_ID_XPATH(opf_root),
+            *self._COVER_IMAGE_ID_XPATH(opf_root),
+        ]
+        for cover_id in cover_ids:
+            if cover_id:
+                cover_item = self._create_image_item_from_zip(
+                    archive.zip_file, opf_root, cover_id, archive.opf_path
+                )
+                if cover_item:
+                    return cover_item
+
+        return None
+
+    def _find_cover_image(self, book, epub_path: str):
         """
         Find cover image using EPUB specification methods:
         1. Parse OPF directly to find cover metadata and manifest
@@ -184,109 +498,87 @@ class EPUBImageService:
         3. Fall back to filename-based detection
         4. Fall back to first image
         """
-        from xml.etree import ElementTree as ET
-
         # Method 1: Parse OPF file directly - most reliable
-        if epub_path:
-            try:
-                with zipfile.ZipFile(epub_path, "r") as zip_file:
-                    # Read container.xml to find OPF file
-                    container_xml = zip_file.read("META-INF/container.xml").decode(
-                        "utf-8"
+        cover_item = self._find_opf_cover_item(Path(epub_path))
+        if cover_item:
+            return cover_item
+
+        images = list(book.get_items_of_type(ebooklib.ITEM_IMAGE))
+        return self._guess_cover_image(images, lambda item: len(item.get_content()))
+
+    def _find_zip_cover_item(self, epub_path: Path) -> ZipImageItem | None:
+        """
+        Find the cover using only the ZIP central directory and the OPF.
+        Applies the same heuristics as _find_cover_image to the manifest's
+        images, using ZipInfo.file_size for the size check so that no image
+        is decompressed until the chosen cover is decoded.
+        """
+        try:
+            # One archive lookup serves both the declared cover and the guess
+            archive = open_epub_archive(epub_path)
+            cover_item = self._find_declared_cover(archive)
+            if cover_item:
+                return cover_item
+
+            images = []
+            for item_elem in archive.opf_root.iterfind(
+                f"{{{OPF_NS}}}manifest/{{{OPF_NS}}}item"
+            ):
+                href = item_elem.get("href")
+                if not href or not item_elem.get("media-type", "").startswith("image/"):
+                    continue
+                image_path = archive.resolve_href(href)
+                try:
+                    archive.zip_file.getinfo(image_path)
+                except KeyError:
+                    continue
+                images.append(
+                    ZipImageItem(
+                        archive.zip_file, item_elem.get("id"), href, image_path
                     )
-                    container_root = ET.fromstring(container_xml)
-
-                    # Find OPF path
-                    opf_path = None
-                    for rootfile in container_root.findall(
-                        ".//{urn:oasis:names:tc:opendocument:xmlns:container}rootfile"
-                    ):
-                        opf_path = rootfile.get("full-path")
-                        break
-
-                    if opf_path:
-                        opf_content = zip_file.read(opf_path).decode("utf-8")
-                        opf_root = ET.fromstring(opf_content)
-
-                        # Look for <meta name="cover" content="cover_id"/>
-                        cover_metas = opf_root.findall(
-                            './/{http://www.idpf.org/2007/opf}meta[@name="cover"]'
-                        )
-                        for meta in cover_metas:
-                            cover_id = meta.get("content")
-                            if cover_id:
-                                # First try to find the book item with this ID
-                                for item in book.get_items():
-                                    if (
-                                        item.get_id() == cover_id
-                                        and item.get_type() == ebooklib.ITEM_IMAGE
-                                    ):
-                                        return item
-
-                                # If ebooklib can't provide it, try to create a custom item from ZIP
-                                cover_item = self._create_image_item_from_zip(
-                                    zip_file, opf_root, cover_id, opf_path
-                                )
-                                if cover_item:
-                                    return cover_item
-
-                        # Look for items with properties="cover-image"
-                        manifest_items = opf_root.findall(
-                            ".//{http://www.idpf.org/2007/opf}item"
-                        )
-                        for item_elem in manifest_items:
-                            props = item_elem.get("properties", "")
-                            if "cover-image" in props:
-                                item_id = item_elem.get("id")
-                                # First try ebooklib
-                                for item in book.get_items():
-                                    if (
-                                        item.get_id() == item_id
-                                        and item.get_type() == ebooklib.ITEM_IMAGE
-                                    ):
-                                        return item
-
-                                # If ebooklib can't provide it, try to create from ZIP
-                                cover_item = self._create_image_item_from_zip(
-                                    zip_file, opf_root, item_id, opf_path
-                                )
-                                if cover_item:
-                                    return cover_item
-
-            except Exception as e:
-                print(f"OPF parsing failed: {e}")
-
-        # Method 2: Filename-based detection (more reliable than size-based)
-        cover_candidates = []
-        for item in book.get_items_of_type(ebooklib.ITEM_IMAGE):
+                )
+        except Exception as e:
+            logger.warning(f"OPF parsing failed for {epub_path}: {e}")
+            return None
+
+        return self._guess_cover_image(images, ZipImageItem.get_size)
+
+    def _guess_cover_image(self, images: list, size_of):
+        """
+        Pick the likely cover from a book's images when none is declared:
+        2. Filename-based detection
+        3. Largest image, if it clearly stands out
+        4. First image
+
+        Args:
+            images: Image items in manifest order
+            size_of: Callable returning an item's size in bytes
+        """
+        # Method 2: Filename-based detection (more reliable than size-based).
+        # Names are prioritized by how specific the match is, and the first
+        # image wins among equals, so a "cover" name ends the scan.
+        best_candidate = None
+        best_priority = 0
+        for item in images:
             item_name = item.get_name().lower()
-            # Common cover image naming patterns
-            if any(
-                pattern in item_name
-                for pattern in ["cover", "front", "title", "jacket", "poster"]
-            ):
-                # Prioritize by how specific the match is
-                if "cover" in item_name:
-                    cover_candidates.append((item, 3))  # Highest priority
-                elif "front" in item_name or "title" in item_name:
-                    cover_candidates.append((item, 2))  # Medium priority
-                else:
-                    cover_candidates.append((item, 1))  # Lower priority
-
-        # Return the highest priority cover candidate
-        if cover_candidates:
-            cover_candidates.sort(key=lambda x: x[1], reverse=True)
-            return cover_candidates[0][0]
+            if "cover" in item_name:
+                return item  # Highest priority
+            if best_priority < 2 and ("front" in item_name or "title" in item_name):
+                best_candidate, best_priority = item, 2  # Medium priority
+            elif best_priority < 1 and ("jacket" in item_name or "poster" in item_name):
+                best_candidate, best_priority = item, 1  # Lower priority
+
+        if best_candidate is not None:
+            return best_candidate
 
         # Method 3: Size-based detection (covers are usually largest)
         largest_image = None
         largest_size = 0
         size_candidates = []
 
-        for item in book.get_items_of_type(ebooklib.ITEM_IMAGE):
+        for item in images:
             try:
-                content = item.get_content()
-                size = len(content)
+                size = size_of(item)
                 size_candidates.append((item, size))
                 if size > largest_size:
                     largest_size = size
@@ -309,62 +601,37 @@ class EPUBImageService:
                 return largest_image
 
         # Method 4: Fall back to first image as last resort
-        for item in book.get_items_of_type(ebooklib.ITEM_IMAGE):
-            return item
-
-        return None
+        return images[0] if images else None
 
     def _create_image_item_from_zip(self, zip_file, opf_root, item_id, opf_path):
         """
         Create a custom image item from ZIP file when ebooklib can't provide it
         """
         try:
-            # Find the manifest item with this ID
-            manifest_items = opf_root.findall(".//{http://www.idpf.org/2007/opf}item")
-            for item_elem in manifest_items:
-                if item_elem.get("id") == item_id:
-                    href = item_elem.get("href")
-                    media_type = item_elem.get("media-type", "")
-
-                    if href and media_type.startswith("image/"):
-                        # Build full path to the image in ZIP
-                        # OPF path might be OEBPS/content.opf, so image is relative to OEBPS/
-                        opf_dir = "/".join(
-                            opf_path.split("/")[:-1]
-                        )  # Remove content.opf
-                        if opf_dir:
-                            image_path = f"{opf_dir}/{href}"
-                        else:
-                            image_path = href
-
-                        try:
-                            # Try to read the image from ZIP
-                            image_data = zip_file.read(image_path)
-
-                            # Create a custom item-like object
-                            class CustomImageItem:
-                                def __init__(self, id, name, content):
-                                    self._id = id
-                                    self._name = name
-                                    self._content = content
-
-                                def get_id(self):
-                                    return self._id
-
-                                def get_name(self):
-                                    return self._name
-
-                                def get_content(self):
-                                    return self._content
-
-                                def get_type(self):
-                                    return ebooklib.ITEM_IMAGE
-
-                            return CustomImageItem(item_id, href, image_data)
-
-                        except KeyError:
-                            # Image file not found in ZIP
-                            continue
+            # Find the manifest item with this ID; the id test runs in libxml2
+            # rather than as a Python comparison per manifest item
+            for item_elem in self._ITEM_BY_ID_XPATH(opf_root, item_id=item_id):
+                href = item_elem.get("href")
+                media_type = item_elem.get("media-type", "")
+
+                if href and media_type.startswith("image/"):
+                    # Build full path to the image in ZIP
+                    # OPF path might be OEBPS/content.opf, so image is relative to OEBPS/
+                    opf_dir = "/".join(opf_path.split("/")[:-1])  # Remove content.opf
+                    if opf_dir:
+                        image_path = f"{opf_dir}/{href}"
+                    else:
+                        image_path = href
+
+                    try:
+                        # Only check the central directory here; the image
+                        # is decompressed when the item is actually read
+                        zip_file.getinfo(image_path)
+                    except KeyError:
+                        # Image file not found in ZIP
+                        continue
+
+                    return ZipImageItem(zip_file, item_id, href, image_path)
 
             return None
 
@@ -1,12 +1,16 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-import ebooklib
-from ebooklib import epub
+from .epub_archive import METADATA_WORKERS, read_epub_metadata
 
 
 class EPUBMetadataExtractor:
+    # Separators for fields whose multiple values are all kept
+    _METADATA_SEPARATORS = {"creator": "; ", "subject": ", "}
+
     def __init__(self, epub_dir: str = "epubs"):
         self.epub_dir = Path(epub_dir)
 
@@ -16,92 +20,98 @@ class EPUBMetadataExtractor:
         """
         try:
             metadata_list = book.get_metadata(namespace, field)
-            if not metadata_list:
-                return ""
-
-            # Extract values from tuples and filter out empty ones
-            values = []
-            for item in metadata_list:
-                if isinstance(item, tuple) and len(item) > 0:
-                    value = str(item[0]).strip()
-                    if value:
-                        values.append(value)
-                elif isinstance(item, str):
-                    value = item.strip()
-                    if value:
-                        values.append(value)
-
-            # Join multiple values appropriately
-            if field == "creator":  # Authors
-                return "; ".join(values) if values else "Unknown"
-            elif field == "subject":  # Categories/tags
-                return ", ".join(values) if values else ""
-            else:  # Other fields like publisher, language - usually single value
-                return values[0] if values else ""
-
         except Exception:
             return ""
+        if not metadata_list:
+            return ""
+
+        # Entries are (value, attributes) tuples; bare strings are accepted too
+        values = [
+            value
+            for value in (
+                (item if isinstance(item, str) else str(item[0])).strip()
+                for item in metadata_list
+                if item
+            )
+            if value
+        ]
+
+        # Authors and categories keep every value; other fields like publisher
+        # and language are usually single valued
+        separator = self._METADATA_SEPARATORS.get(field)
+        if separator is None:
+            return values[0] if values else ""
+        if values:
+            return separator.join(values)
+        return "Unknown" if field == "creator" else ""
 
     def list_epubs(self) -> list[dict[str, Any]]:
         """
         List all EPUB files in the epubs directory with metadata
         """
-        epubs = []
-
-        for file_path in self.epub_dir.glob("*.epub"):
-            try:
-                # Get file stats
-                stat = file_path.stat()
-
-                # Get basic EPUB info
-                book = epub.read_epub(str(file_path))
-
-                # Extract metadata using robust method
-                title = self._extract_metadata_values(book, "DC", "title")
-                if not title:
-                    title = file_path.stem
-
-                author = self._extract_metadata_values(book, "DC", "creator")
-
-                # Count chapters (spine items that are not navigation)
-                chapter_count = len(
-                    [item for item in book.get_items_of_type(ebooklib.ITEM_DOCUMENT)]
-                )
-
-                epub_info = {
-                    "filename": file_path.name,
-                    "type": "epub",
-                    "title": str(title),
-                    "author": str(author) if author else "Unknown",
-                    "chapters": chapter_count,
-                    "file_size": stat.st_size,
-                    "modified_date": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                    "created_date": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                }
-
-                epubs.append(epub_info)
-
-            except Exception as e:
-                # If we can't read an EPUB, still include it but with limited info
-                stat = file_path.stat()
-                epub_info = {
-                    "filename": file_path.name,
-                    "type": "epub",
-                    "title": file_path.stem,
-                    "author": "Unknown",
-                    "chapters": 0,
-                    "file_size": stat.st_size,
-                    "modified_date": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                    "created_date": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                    "error": f"Could not read EPUB: {str(e)}",
-                }
-                epubs.append(epub_info)
+        with os.scandir(self.epub_dir) as entries:
+            epub_entries = [
+                entry
+                for entry in entries
+                if entry.name.endswith(".epub") and entry.is_file()
+            ]
+
+        if not epub_entries:
+            return []
+
+        # Each file is independent ZIP + XML work, so extract them in parallel
+        workers = min(METADATA_WORKERS, len(epub_entries))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            epubs = list(executor.map(self._extract_info_one, epub_entries))
 
         # Sort by modified date (newest first)
         epubs.sort(key=lambda x: x["modified_date"], reverse=True)
 
         return epubs
 
+    def _extract_info_one(self, entry: os.DirEntry) -> dict[str, Any]:
+        """
+        Extract listing metadata for one EPUB, with limited info if unreadable
+        """
+        file_path = Path(entry.path)
+        # DirEntry caches its stat result, so the error path reuses it too
+        stat = entry.stat()
+        try:
+            # Get basic EPUB info
+            book, chapter_count = read_epub_metadata(file_path)
+
+            # Extract metadata using robust method
+            title = self._extract_metadata_values(book, "DC", "title")
+            if not title:
+                title = file_path.stem
+
+            author = self._extract_metadata_values(book, "DC", "creator")
+
+            return {
+                "filename": file_path.name,
+                "type": "epub",
+                "title": str(title),
+                "author": str(author) if author else "Unknown",
+                "chapters": chapter_count,
+                "file_size": stat.st_size,
+                "modified_date": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                "created_date": datetime.fromtimestamp(stat.st_ctime).isoformat(),
+            }
+
+        except Exception as e:
+            # If we can't read an EPUB, still include it but with limited info
+            return {
+                "filename": file_path.name,
+                "type": "epub",
+                "title": file_path.stem,
+                "author": "Unknown",
+                "chapters": 0,
+                "file_size": stat.st_size,
+                "modified_date": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                "created_date": datetime.fromtimestamp(stat.st_ctime).isoformat(),
+                "error": f"Could not read EPUB: {str(e)}",
+            }
+
     def get_epub_info(self, file_path: Path) -> dict[str, Any]:
         """
         Get detailed information about a specific EPUB
@@ -114,7 +124,7 @@ class EPUBMetadataExtractor:
 
         stat = file_path.stat()
 
-        book = epub.read_epub(str(file_path))
+        book, chapter_count = read_epub_metadata(file_path, shared=True)
 
         # Extract metadata using robust method
         title = self._extract_metadata_values(book, "DC", "title")
@@ -126,11 +136,6 @@ class EPUBMetadataExtractor:
         publisher = self._extract_metadata_values(book, "DC", "publisher")
         language = self._extract_metadata_values(book, "DC", "language")
 
-        # Count chapters
-        chapter_count = len(
-            [item for item in book.get_items_of_type(ebooklib.ITEM_DOCUMENT)]
-        )
-
         epub_info = {
             "filename": file_path.name,
             "type": "epub",
@@ -2,6 +2,8 @@ from typing import Any
 
 import ebooklib
 
+from .epub_book_index import get_book_index
+
 
 class EPUBNavigationService:
     """Responsible for building navigation structures for EPUB files."""
@@ -52,7 +54,7 @@ class EPUBNavigationService:
         # Fallback: create navigation from spine (reading order)
         spine_items: list[dict[str, Any]] = []
         for index, (item_id, _) in enumerate(book.spine):
-            item = book.get_item_with_id(item_id)
+            item = get_book_index(book).get_item_with_id(item_id)
             if self._is_document_item(item):
                 display_title = (
                     item.get_name()
@@ -73,10 +75,13 @@ class EPUBNavigationService:
                 )
         return spine_items
 
-    def _process_toc_items(self, toc_items, book, level=1):
+    def _process_toc_items(self, toc_items, book, level=1, spine_matches=None):
         """
         Recursively process table of contents items
+        spine_matches memoizes spine positions by base href for one TOC walk
         """
+        if spine_matches is None:
+            spine_matches = {}
         processed_items = []
 
         for item in toc_items:
@@ -90,9 +95,11 @@ class EPUBNavigationService:
                         "title": str(section.title),
                         "href": section.href,
                         "level": level,
-                        "children": self._process_toc_items(children, book, level + 1),
+                        "children": self._process_toc_items(
+                            children, book, level + 1, spine_matches
+                        ),
                         "spine_positions": self._find_spine_positions_for_nav_href(
-                            section.href, book
+                            section.href, book, spine_matches
                         ),
                     }
                     processed_items.append(processed_item)
@@ -106,7 +113,7 @@ class EPUBNavigationService:
                     "level": level,
                     "children": [],
                     "spine_positions": self._find_spine_positions_for_nav_href(
-                        item.href, book
+                        item.href, book, spine_matches
                     ),
                 }
                 processed_items.append(processed_item)
@@ -172,14 +179,8 @@ class EPUBNavigationService:
             fragment = None
 
         # Find the item in the book
-        spine_item_id = None
-        for item in book.get_items():
-            if not self._is_document_item(item):
-                continue
-            name = item.get_name()
-            if name == base_href or name.endswith(base_href):
-                spine_item_id = item.get_id()
-                break
+        item = get_book_index(book).find_document_by_href(base_href)
+        spine_item_id = item.get_id() if item else None
 
         # Create unique ID by combining spine item ID with fragment
         if spine_item_id:
@@ -192,7 +193,12 @@ class EPUBNavigationService:
             # Fallback: use href as ID (cleaned but preserving fragments for uniqueness)
             return href.replace("/", "_").replace(".", "_")
 
-    def _find_spine_positions_for_nav_href(self, href: str | None, book) -> list[int]:
+    def _find_spine_positions_for_nav_href(
+        self,
+        href: str | None,
+        book,
+        spine_matches: dict[str, list[int]] | None = None,
+    ) -> list[int]:
         if not href:
             return []
 
@@ -201,23 +207,29 @@ class EPUBNavigationService:
         else:
             base_href = href
 
+        # TOC entries pointing at fragments of one file share a base href,
+        # so the spine lookup runs once per file rather than once per entry
+        if spine_matches is not None and base_href in spine_matches:
+            return list(spine_matches[base_href])
+
+        normalized_base = base_href.rsplit(".", 1)[0]
         matches: list[int] = []
-        for idx, (item_id, _) in enumerate(book.spine):
-            item = book.get_item_with_id(item_id)
-            if self._is_document_item(item):
-                name = item.get_name()
-                normalized_name = name.rsplit(".", 1)[0]
-                normalized_base = base_href.rsplit(".", 1)[0]
-
-                if (
-                    name == base_href
-                    or name.endswith(base_href)
-                    or base_href.endswith(name)
-                    or normalized_name == normalized_base
-                    or normalized_name.endswith(normalized_base)
-                    or normalized_base.endswith(normalized_name)
-                ):
-                    matches.append(idx)
+        for idx, name in get_book_index(book).spine_candidates(base_href):
+            normalized_name = name.rsplit(".", 1)[0]
+
+            if (
+                name == base_href
+                or name.endswith(base_href)
+                or base_href.endswith(name)
+                or normalized_name == normalized_base
+                or normalized_name.endswith(normalized_base)
+                or normalized_base.endswith(normalized_name)
+            ):
+                matches.append(idx)
+
+        if spine_matches is not None:
+            spine_matches[base_href] = matches
+            return list(matches)
         return matches
 
     def build_spine_to_nav_mapping(self, book) -> dict[int, dict[str, Any]]:
@@ -235,7 +247,7 @@ class EPUBNavigationService:
                 # Fallback: each spine item is its own section
                 nav_items = []
                 for idx, (item_id, _) in enumerate(book.spine):
-                    item = book.get_item_with_id(item_id)
+                    item = get_book_index(book).get_item_with_id(item_id)
                     if self._is_document_item(item):
                         nav_items.append(
                             {
@@ -299,18 +311,14 @@ class EPUBNavigationService:
             base_href = nav_href
 
         # Find all spine positions that match this href
-        for idx, (item_id, _) in enumerate(book.spine):
-            item = book.get_item_with_id(item_id)
-            if self._is_document_item(item):
-                item_name = item.get_name()
-
-                # Check if this spine item matches the navigation href
-                if (
-                    item_name == base_href
-                    or item_name.endswith(base_href)
-                    or base_href.endswith(item_name)
-                ):
-                    positions.append(idx)
+        for idx, item_name in get_book_index(book).spine_candidates(base_href):
+            # Check if this spine item matches the navigation href
+            if (
+                item_name == base_href
+                or item_name.endswith(base_href)
+                or base_href.endswith(item_name)
+            ):
+                positions.append(idx)
 
         return positions
 
@@ -359,4 +367,6 @@ class EPUBNavigationService:
         if not chapter_positions:
             chapter_positions = [start_position]
 
-        return sorted(set(chapter_positions))
+        # Positions come from an increasing range, so they are already sorted
+        # and unique
+        return chapter_positions
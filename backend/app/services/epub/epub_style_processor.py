@@ -5,6 +5,12 @@ import ebooklib
 
 
 class EPUBStyleProcessor:
+    # Pre-compiled regex patterns for performance
+    _IMPORT_PATTERN = re.compile(r"@import\s+[^;]+;", re.IGNORECASE)
+    _URL_PATTERN = re.compile(r'url\s*\(\s*[\'"]?[^\'")]*[\'"]?\s*\)', re.IGNORECASE)
+    _JAVASCRIPT_PATTERN = re.compile(r"javascript\s*:", re.IGNORECASE)
+    _EXPRESSION_PATTERN = re.compile(r"expression\s*\([^)]*\)", re.IGNORECASE)
+
     def get_epub_styles(self, book) -> dict[str, Any]:
         """
         Extract and return CSS styles from an EPUB
@@ -36,22 +42,15 @@ class EPUBStyleProcessor:
         Sanitize CSS content to remove potentially harmful elements
         """
         # Remove @import statements to prevent loading external resources
-        css_content = re.sub(r"@import\s+[^;]+;", "", css_content, flags=re.IGNORECASE)
+        css_content = self._IMPORT_PATTERN.sub("", css_content)
 
         # Remove url() functions that could load external resources
-        css_content = re.sub(
-            r'url\s*\(\s*[\'"]?[^\'")]*[\'"]?\s*\)',
-            "url(about:blank)",
-            css_content,
-            flags=re.IGNORECASE,
-        )
+        css_content = self._URL_PATTERN.sub("url(about:blank)", css_content)
 
         # Remove javascript: protocols
-        css_content = re.sub(r"javascript\s*:", "", css_content, flags=re.IGNORECASE)
+        css_content = self._JAVASCRIPT_PATTERN.sub("", css_content)
 
         # Remove expression() functions (IE-specific but potentially harmful)
-        css_content = re.sub(
-            r"expression\s*\([^)]*\)", "", css_content, flags=re.IGNORECASE
-        )
+        css_content = self._EXPRESSION_PATTERN.sub("", css_content)
 
         return css_content
@@ -13,6 +13,8 @@ from typing import Any
 import ebooklib
 from bs4 import BeautifulSoup
 
+from .epub_book_index import get_book_index
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,6 +27,9 @@ class EPUBWordCountService:
     reading statistics tracking.
     """
 
+    # Pre-compiled regex patterns for performance
+    _WORD_PATTERN = re.compile(r"\b\w+\b")
+
     def extract_word_counts(
         self, book: ebooklib.epub.EpubBook, nav_metadata: dict[str, Any]
     ) -> dict[str, Any]:
@@ -117,7 +122,7 @@ class EPUBWordCountService:
 
         # Also map spine items by their id
         for item_id, _ in book.spine:
-            item = book.get_item_with_id(item_id)
+            item = get_book_index(book).get_item_with_id(item_id)
             if self._is_document_item(item):
                 name = item.get_name()
                 # Map by spine item id
@@ -171,14 +176,8 @@ class EPUBWordCountService:
             fragment = None
 
         # Find the item in the book
-        spine_item_id = None
-        for item in book.get_items():
-            if not self._is_document_item(item):
-                continue
-            name = item.get_name()
-            if name == base_href or name.endswith(base_href):
-                spine_item_id = item.get_id()
-                break
+        item = get_book_index(book).find_document_by_href(base_href)
+        spine_item_id = item.get_id() if item else None
 
         # Create unique ID by combining spine item ID with fragment
         if spine_item_id:
@@ -262,9 +261,9 @@ class EPUBWordCountService:
 
             text = soup.get_text(separator=" ")
 
-            # Count words using regex to handle various whitespace
-            words = re.findall(r"\b\w+\b", text)
-            return len(words)
+            # Count words using regex to handle various whitespace; finditer
+            # avoids building a list of every word in the section
+            return sum(1 for _ in self._WORD_PATTERN.finditer(text))
 
         except Exception as e:
             logger.warning(f"Failed to count words: {e}")
@@ -1,14 +1,14 @@
-import json
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-import ebooklib
-from ebooklib import epub
-
 from app.models.epub_metadata import EPUBBasicMetadata, EPUBExtendedMetadata
 
+from .epub.epub_archive import METADATA_WORKERS, read_epub_metadata
 from .epub_documents_service import EPUBDocumentsService
 
 logger = logging.getLogger(__name__)
@@ -26,6 +26,9 @@ class EPUBCache:
     Database backing ensures cache persists between service restarts.
     """
 
+    # Separators for fields whose multiple values are all kept
+    _METADATA_SEPARATORS = {"creator": "; ", "subject": ", "}
+
     def __init__(
         self,
         epub_dir: Path,
@@ -56,6 +59,15 @@ class EPUBCache:
         self._cache_built_at: str | None = None
         self._cache_epub_count: int = 0
 
+        # Directory mtime observed when the cache was last built. Adding,
+        # removing or renaming an EPUB bumps it, which triggers a rebuild.
+        self._dir_mtime_ns: int | None = None
+
+        # Sorted listing returned by get_all_epubs, rebuilt only when the
+        # cache contents change
+        self._sorted_epubs: list[EPUBBasicMetadata] | None = None
+        self._lock = threading.Lock()
+
         # Build cache on initialization
         logger.info("Initializing EPUB cache with database backing...")
         self._build_cache()
@@ -67,56 +79,78 @@ class EPUBCache:
         """
         try:
             metadata_list = book.get_metadata(namespace, field)
-            if not metadata_list:
-                # Return "Unknown" for creator field when no metadata found
-                return "Unknown" if field == "creator" else ""
-
-            # Extract values from tuples and filter out empty ones
-            values = []
-            for item in metadata_list:
-                if isinstance(item, tuple) and len(item) > 0:
-                    value = str(item[0]).strip()
-                    if value:
-                        values.append(value)
-                elif isinstance(item, str):
-                    value = item.strip()
-                    if value:
-                        values.append(value)
-
-            # Join multiple values appropriately
-            if field == "creator":  # Authors
-                return "; ".join(values) if values else "Unknown"
-            elif field == "subject":  # Categories/tags
-                return ", ".join(values) if values else ""
-            else:  # Other fields like publisher, language - usually single value
-                return values[0] if values else ""
-
         except Exception:
             return ""
+        if not metadata_list:
+            # Return "Unknown" for creator field when no metadata found
+            return "Unknown" if field == "creator" else ""
+
+        # Entries are (value, attributes) tuples; bare strings are accepted too
+        values = [
+            value
+            for value in (
+                (item if isinstance(item, str) else str(item[0])).strip()
+                for item in metadata_list
+                if item
+            )
+            if value
+        ]
+
+        # Authors and categories keep every value; other fields like publisher
+        # and language are usually single valued
+        separator = self._METADATA_SEPARATORS.get(field)
+        if separator is None:
+            return values[0] if values else ""
+        if values:
+            return separator.join(values)
+        return "Unknown" if field == "creator" else ""
 
     def _build_cache(self) -> None:
         """
         Build the cache by scanning filesystem and loading from database when possible.
         Only extracts metadata and generates thumbnails for new EPUBs not in database.
 
-        Leverages database backing for fast cache initialization.
+        Leverages database backing for fast cache initialization. The new
+        entries are collected in a local dict and swapped in once the build is
+        complete, so readers never see a partially built cache.
         """
         start_time = datetime.now()
-        self._cache = {}
+        cache: dict[str, EPUBBasicMetadata | EPUBExtendedMetadata] = {}
+
+        # Record the directory mtime before scanning so that files added
+        # mid-scan still invalidate the listing on the next request
+        dir_mtime_ns = self._get_dir_mtime_ns()
 
         logger.info(f"Scanning EPUB directory: {self.epub_dir}")
 
-        epub_files = list(self.epub_dir.glob("*.epub"))
+        epub_files = self._scan_epub_files()
         logger.info(f"Found {len(epub_files)} EPUB files")
 
         db_hits = 0
         db_misses = 0
 
-        for file_path in epub_files:
+        # One query for every indexed EPUB instead of a connection and lookup
+        # per file; the database plays the role of a persistent metadata index
+        db_records = {
+            record["filename"]: record for record in self._db_service.list_all()
+        }
+
+        # EPUBs that need a thumbnail, generated together after the scan
+        pending_thumbnails: list[str] = []
+
+        # EPUBs missing from the database, whose metadata must be extracted
+        new_files: list[tuple[Path, os.stat_result]] = []
+
+        for file_path, stat in epub_files:
             filename = file_path.name
 
             # Check if EPUB exists in database
-            db_record = self._db_service.get_by_filename(filename)
+            db_record = db_records.get(filename)
+
+            if db_record and not self._is_record_current(db_record, stat):
+                # File was replaced since it was indexed - extract it again
+                logger.info(f"EPUB changed on disk, re-indexing: {filename}")
+                db_record = None
 
             if db_record:
                 # Load from database (fast path)
@@ -125,48 +159,10 @@ class EPUBCache:
                 # Get thumbnail path from database
                 thumbnail_path_str = db_record.get("thumbnail_path", "")
 
-                # Only generate thumbnail if DB has no path or file doesn't exist
+                # Queue thumbnail generation if DB has no path or file doesn't exist
                 if not thumbnail_path_str or not Path(thumbnail_path_str).exists():
-                    try:
-                        thumbnail_path = self.epub_service.generate_thumbnail(filename)
-                        thumbnail_path_str = str(thumbnail_path)
-
-                        # Update database with new thumbnail path
-                        try:
-                            # Parse existing metadata_json if present
-                            metadata = None
-                            if db_record.get("metadata_json"):
-                                try:
-                                    metadata = json.loads(db_record["metadata_json"])
-                                except json.JSONDecodeError:
-                                    logger.warning(
-                                        f"Failed to parse metadata_json for {filename}"
-                                    )
-
-                            self._db_service.create_or_update(
-                                filename=filename,
-                                chapters=db_record.get("chapters", 0),
-                                title=db_record.get("title"),
-                                author=db_record.get("author"),
-                                subject=db_record.get("subject"),
-                                publisher=db_record.get("publisher"),
-                                language=db_record.get("language"),
-                                file_size=db_record.get("file_size"),
-                                file_path=db_record.get("file_path"),
-                                thumbnail_path=thumbnail_path_str,
-                                created_date=db_record.get("created_date"),
-                                modified_date=db_record.get("modified_date"),
-                                metadata=metadata,
-                            )
-                        except Exception as db_error:
-                            logger.warning(
-                                f"Failed to update thumbnail path in database for {filename}: {db_error}"
-                            )
-                    except Exception as thumb_error:
-                        logger.warning(
-                            f"Failed to generate thumbnail for {filename}: {thumb_error}"
-                        )
-                        thumbnail_path_str = ""
+                    pending_thumbnails.append(filename)
+                    thumbnail_path_str = ""
 
                 epub_info = EPUBBasicMetadata(
                     filename=filename,
@@ -180,116 +176,55 @@ class EPUBCache:
                     thumbnail_path=thumbnail_path_str,
                     error=None,
                 )
-                self._cache[filename] = epub_info
+                cache[filename] = epub_info
                 db_hits += 1
 
             else:
-                # Not in database - extract from file (slow path)
-                logger.debug(f"Extracting metadata from file: {filename}")
-                try:
-                    # Get file stats
-                    stat = file_path.stat()
-
-                    # Extract basic metadata
-                    book = epub.read_epub(str(file_path))
-
-                    # Extract metadata using robust method
-                    title = self._extract_metadata_values(book, "DC", "title")
-                    if not title:
-                        title = file_path.stem
-
-                    author = self._extract_metadata_values(book, "DC", "creator")
-
-                    # Extract extended metadata while we have the book open
-                    subject = self._extract_metadata_values(book, "DC", "subject")
-                    publisher = self._extract_metadata_values(book, "DC", "publisher")
-                    language = self._extract_metadata_values(book, "DC", "language")
-
-                    # Count chapters (spine items that are documents)
-                    chapter_count = len(
-                        [
-                            item
-                            for item in book.get_items_of_type(ebooklib.ITEM_DOCUMENT)
-                        ]
-                    )
-
-                    # Pre-generate thumbnail
-                    try:
-                        thumbnail_path = self.epub_service.generate_thumbnail(
-                            file_path.name
-                        )
-                        thumbnail_path_str = str(thumbnail_path)
-                    except Exception as thumb_error:
-                        logger.warning(
-                            f"Failed to generate thumbnail for {file_path.name}: {thumb_error}"
-                        )
-                        thumbnail_path_str = ""
-
-                    # Store extended metadata in cache
-                    epub_info = EPUBExtendedMetadata(
-                        filename=file_path.name,
-                        type="epub",
-                        title=str(title),
-                        author=str(author) if author else "Unknown",
-                        chapters=chapter_count,
-                        file_size=stat.st_size,
-                        modified_date=datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                        created_date=datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                        thumbnail_path=thumbnail_path_str,
-                        subject=subject,
-                        publisher=publisher,
-                        language=language,
-                        error=None,
-                    )
-
-                    self._cache[file_path.name] = epub_info
-
-                    # Persist to database
-                    try:
-                        self._db_service.create_or_update(
-                            filename=file_path.name,
-                            title=epub_info.title,
-                            author=epub_info.author,
-                            subject=epub_info.subject,
-                            publisher=epub_info.publisher,
-                            language=epub_info.language,
-                            chapters=chapter_count,
-                            file_size=stat.st_size,
-                            file_path=str(file_path),
-                            thumbnail_path=thumbnail_path_str,
-                            created_date=epub_info.created_date,
-                            modified_date=epub_info.modified_date,
-                            metadata=epub_info.model_dump(),
-                        )
-                    except Exception as db_error:
-                        logger.warning(
-                            f"Failed to persist EPUB metadata to database for {file_path.name}: {db_error}"
-                        )
-
-                    db_misses += 1
-
-                except Exception as e:
-                    # If we can't read an EPUB, still include it but with limited info
-                    logger.error(f"Error processing {file_path.name}: {e}")
-                    stat = file_path.stat()
-                    epub_info = EPUBBasicMetadata(
-                        filename=file_path.name,
-                        type="epub",
-                        title=file_path.stem,
-                        author="Unknown",
-                        chapters=0,
-                        file_size=stat.st_size,
-                        modified_date=datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                        created_date=datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                        thumbnail_path="",
-                        error=f"Could not read EPUB: {str(e)}",
-                    )
-                    self._cache[file_path.name] = epub_info
-                    db_misses += 1
+                # Not in database - extracted in parallel below (slow path)
+                new_files.append((file_path, stat))
+
+        for epub_info in self._extract_new_epubs(new_files):
+            cache[epub_info.filename] = epub_info
+            db_misses += 1
+
+            # Unreadable EPUBs are listed but neither persisted nor thumbnailed
+            if epub_info.error:
+                continue
+
+            # Thumbnail is generated in bulk once the scan is done
+            pending_thumbnails.append(epub_info.filename)
+
+            # Persist to database
+            try:
+                self._db_service.create_or_update(
+                    filename=epub_info.filename,
+                    title=epub_info.title,
+                    author=epub_info.author,
+                    subject=epub_info.subject,
+                    publisher=epub_info.publisher,
+                    language=epub_info.language,
+                    chapters=epub_info.chapters,
+                    file_size=epub_info.file_size,
+                    file_path=str(self.epub_dir / epub_info.filename),
+                    thumbnail_path=epub_info.thumbnail_path,
+                    created_date=epub_info.created_date,
+                    modified_date=epub_info.modified_date,
+                    metadata=epub_info.model_dump(),
+                )
+            except Exception as db_error:
+                logger.warning(
+                    f"Failed to persist EPUB metadata to database for {epub_info.filename}: {db_error}"
+                )
+
+        self._generate_thumbnails(cache, pending_thumbnails)
+
+        self._cache = cache
+        self._sorted_epubs = None
+        self._dir_mtime_ns = dir_mtime_ns
 
         # Update cache metadata
         self._cache_built_at = datetime.now().isoformat()
-        self._cache_epub_count = len(self._cache)
+        self._cache_epub_count = len(cache)
 
         elapsed_time = (datetime.now() - start_time).total_seconds()
         logger.info(
@@ -297,20 +232,176 @@ class EPUBCache:
             f"(DB hits: {db_hits}, new: {db_misses})"
         )
 
+    def _is_record_current(
+        self, db_record: dict[str, Any], stat: os.stat_result
+    ) -> bool:
+        """
+        Check whether a database record still describes the file on disk.
+        Records store the size and mtime seen when the EPUB was indexed, so a
+        replaced file is detected without opening it.
+        """
+        return (
+            db_record.get("file_size") == stat.st_size
+            and db_record.get("modified_date")
+            == datetime.fromtimestamp(stat.st_mtime).isoformat()
+        )
+
+    def _extract_new_epubs(
+        self, epub_files: list[tuple[Path, os.stat_result]]
+    ) -> list[EPUBBasicMetadata | EPUBExtendedMetadata]:
+        """
+        Extract metadata for EPUBs that are not in the database yet.
+
+        Each file is independent ZIP + XML work that releases the GIL while
+        reading and inflating, so files are processed on a thread pool.
+        Database writes stay on the calling thread.
+        """
+        if not epub_files:
+            return []
+        if len(epub_files) == 1:
+            return [self._extract_info_one(*epub_files[0])]
+
+        paths, stats = zip(*epub_files, strict=True)
+        workers = min(METADATA_WORKERS, len(epub_files))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self._extract_info_one, paths, stats))
+
+    def _extract_info_one(
+        self, file_path: Path, stat: os.stat_result
+    ) -> EPUBBasicMetadata | EPUBExtendedMetadata:
+        """
+        Extract metadata for a single EPUB file.
+
+        Never raises: unreadable EPUBs are returned with limited info and the
+        error set.
+        """
+        logger.debug(f"Extracting metadata from file: {file_path.name}")
+        modified_date = datetime.fromtimestamp(stat.st_mtime).isoformat()
+        created_date = datetime.fromtimestamp(stat.st_ctime).isoformat()
+
+        try:
+            book, chapter_count = read_epub_metadata(file_path)
+
+            # Extract metadata using robust method
+            title = self._extract_metadata_values(book, "DC", "title")
+            if not title:
+                title = file_path.stem
+
+            author = self._extract_metadata_values(book, "DC", "creator")
+
+            # Extended metadata is read while we have the OPF anyway
+            return EPUBExtendedMetadata(
+                filename=file_path.name,
+                type="epub",
+                title=str(title),
+                author=str(author) if author else "Unknown",
+                chapters=chapter_count,
+                file_size=stat.st_size,
+                modified_date=modified_date,
+                created_date=created_date,
+                thumbnail_path="",
+                subject=self._extract_metadata_values(book, "DC", "subject"),
+                publisher=self._extract_metadata_values(book, "DC", "publisher"),
+                language=self._extract_metadata_values(book, "DC", "language"),
+                error=None,
+            )
+
+        except Exception as e:
+            # If we can't read an EPUB, still include it but with limited info
+            logger.error(f"Error processing {file_path.name}: {e}")
+            return EPUBBasicMetadata(
+                filename=file_path.name,
+                type="epub",
+                title=file_path.stem,
+                author="Unknown",
+                chapters=0,
+                file_size=stat.st_size,
+                modified_date=modified_date,
+                created_date=created_date,
+                thumbnail_path="",
+                error=f"Could not read EPUB: {str(e)}",
+            )
+
+    def _scan_epub_files(self) -> list[tuple[Path, os.stat_result]]:
+        """
+        List the EPUB files in the library directory together with their stats.
+
+        Uses os.scandir so the directory is read once and each entry's stat
+        result can be reused instead of stat()-ing every file again later.
+        """
+        epub_files = []
+        with os.scandir(self.epub_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".epub") and entry.is_file():
+                    epub_files.append((Path(entry.path), entry.stat()))
+        return epub_files
+
+    def _generate_thumbnails(
+        self,
+        cache: dict[str, EPUBBasicMetadata | EPUBExtendedMetadata],
+        filenames: list[str],
+    ) -> None:
+        """
+        Pre-generate thumbnails for newly discovered EPUBs (or ones whose
+        thumbnail went missing) in a single parallel batch, so they are ready
+        before the library is first rendered. Paths are recorded in cache,
+        the dict being built by _build_cache.
+        """
+        if not filenames:
+            return
+
+        logger.info(f"Generating {len(filenames)} missing thumbnails")
+        try:
+            thumbnail_paths = self.epub_service.generate_thumbnails_bulk(filenames)
+        except Exception as thumb_error:
+            logger.warning(f"Failed to generate thumbnails: {thumb_error}")
+            return
+
+        for filename, thumbnail_path in zip(filenames, thumbnail_paths):
+            if thumbnail_path is None:
+                # Already logged by the image service; leave the path empty
+                continue
+            thumbnail_path_str = str(thumbnail_path)
+            cache[filename] = cache[filename].model_copy(
+                update={"thumbnail_path": thumbnail_path_str}
+            )
+
+            try:
+                self._db_service.update_thumbnail_path(filename, thumbnail_path_str)
+            except Exception as db_error:
+                logger.warning(
+                    f"Failed to update thumbnail path in database for {filename}: {db_error}"
+                )
+
+    def _get_dir_mtime_ns(self) -> int | None:
+        try:
+            return self.epub_dir.stat().st_mtime_ns
+        except OSError:
+            return None
+
     def get_all_epubs(self) -> list[EPUBBasicMetadata]:
         """
         Get all EPUBs with basic metadata from cache.
 
+        The cache is rebuilt when the EPUB directory's mtime has changed since
+        the last build; otherwise this costs a single stat() call.
+
         Returns:
             List of EPUBBasicMetadata objects, sorted by modified_date (newest first)
         """
-        # Convert cache dict to list
-        epubs = list(self._cache.values())
-
-        # Sort by modified date (newest first)
-        epubs.sort(key=lambda x: x.modified_date, reverse=True)
+        with self._lock:
+            if self._get_dir_mtime_ns() != self._dir_mtime_ns:
+                logger.info("EPUB directory changed, rebuilding cache")
+                self._build_cache()
+
+            if self._sorted_epubs is None:
+                # Sort by modified date (newest first)
+                self._sorted_epubs = sorted(
+                    self._cache.values(), key=lambda x: x.modified_date, reverse=True
+                )
 
-        return epubs
+            # Return a copy so callers can filter without touching the cache
+            return list(self._sorted_epubs)
 
     def get_epub_info(self, filename: str) -> EPUBExtendedMetadata:
         """
@@ -347,7 +438,7 @@ class EPUBCache:
             if not file_path.exists():
                 raise FileNotFoundError(f"EPUB {filename} not found on filesystem")
 
-            book = epub.read_epub(str(file_path))
+            book, _ = read_epub_metadata(file_path, shared=True)
 
             # Extract extended metadata
             extended_info = EPUBExtendedMetadata(
@@ -359,6 +450,7 @@ class EPUBCache:
 
             # Update cache with extended metadata
             self._cache[filename] = extended_info
+            self._sorted_epubs = None
 
             logger.debug(f"Extended metadata cached for: {filename}")
 
@@ -397,6 +489,7 @@ class EPUBCache:
             )
             # Update cache with extended metadata (even if empty)
             self._cache[filename] = extended_info
+            self._sorted_epubs = None
             return extended_info
 
     def get_thumbnail_path(self, filename: str) -> str:
@@ -423,7 +516,8 @@ class EPUBCache:
         Clears all cached data (including extended metadata) and regenerates.
         """
         logger.info("Refreshing EPUB cache...")
-        self._build_cache()
+        with self._lock:
+            self._build_cache()
         logger.info("EPUB cache refresh complete")
 
     def get_cache_info(self) -> dict[str, Any]:
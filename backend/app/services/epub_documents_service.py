@@ -179,6 +179,30 @@ class EPUBDocumentsService:
             logger.info(f"Saved EPUB document: {filename} (ID: {epub_id})")
             return epub_id
 
+    def update_thumbnail_path(self, filename: str, thumbnail_path: str) -> bool:
+        """
+        Update the thumbnail path for an EPUB document.
+
+        Args:
+            filename: Name of the EPUB file
+            thumbnail_path: Path to the generated thumbnail image
+
+        Returns:
+            True if a document was updated, False otherwise
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                UPDATE epub_documents
+                SET thumbnail_path = ?
+                WHERE filename = ?
+                """,
+                (thumbnail_path, filename),
+            )
+            conn.commit()
+            return cursor.rowcount > 0
+
     def update_last_accessed(self, epub_id: int):
         """
         Update the last_accessed timestamp for an EPUB document.
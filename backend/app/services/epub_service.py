@@ -1,3 +1,8 @@
+import asyncio
+import copy
+import hashlib
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -12,10 +17,18 @@ from .epub import (
     EPUBNavigationService,
     EPUBStyleProcessor,
 )
+from .epub.epub_archive import clear_archive_cache
+from .epub.epub_book_cache import clear_book_cache, read_epub_cached
 from .epub.epub_url_helper import EPUBURLHelper
 from .epub.epub_word_count_service import EPUBWordCountService
 from .epub_cache import EPUBCache
 
+# Number of books whose navigation tree and styles are kept in memory
+DERIVED_CACHE_SIZE = 64
+
+# Number of thumbnail images kept in memory; JPEG covers are a few KB each
+THUMBNAIL_BYTES_CACHE_SIZE = 256
+
 
 class EPUBService:
     def __init__(
@@ -42,6 +55,22 @@ class EPUBService:
         self.style_processor = EPUBStyleProcessor()
         self.word_count_service = EPUBWordCountService()
 
+        # Navigation trees and styles depend only on the file contents, so cache
+        # them per (path, mtime, size) like the parsed books they are derived from
+        self._navigation_tree_cached = lru_cache(maxsize=DERIVED_CACHE_SIZE)(
+            self._build_navigation_tree
+        )
+        self._epub_styles_cached = lru_cache(maxsize=DERIVED_CACHE_SIZE)(
+            self._build_epub_styles
+        )
+        self._thumbnail_bytes_cached = lru_cache(maxsize=THUMBNAIL_BYTES_CACHE_SIZE)(
+            self._read_thumbnail_file
+        )
+
+        # In-flight thumbnail generations, so concurrent requests for the same
+        # cover (e.g. a freshly loaded library grid) share a single render
+        self._pending_thumbnails: dict[tuple, asyncio.Future] = {}
+
         # Initialize cache with database backing (must be after other services are initialized)
         self.cache = EPUBCache(self.epub_dir, self.thumbnails_dir, self, db_path)
 
@@ -51,6 +80,13 @@ class EPUBService:
         """
         return self.cache.get_all_epubs()
 
+    async def list_epubs_async(self) -> list[EPUBBasicMetadata]:
+        """
+        Async wrapper for list_epubs that keeps the event loop free while the
+        cache is consulted (and rebuilt, if needed) in a worker thread
+        """
+        return await asyncio.to_thread(self.list_epubs)
+
     def get_epub_info(self, filename: str) -> EPUBExtendedMetadata:
         """
         Get detailed information about a specific EPUB (with lazy-loaded extended metadata)
@@ -59,23 +95,51 @@ class EPUBService:
         decoded_filename = EPUBURLHelper.decode_filename_from_url(filename)
         return self.cache.get_epub_info(decoded_filename)
 
+    async def get_epub_info_async(self, filename: str) -> EPUBExtendedMetadata:
+        """
+        Async wrapper for get_epub_info; lazily reading extended metadata
+        opens the EPUB, so it runs in a worker thread
+        """
+        return await asyncio.to_thread(self.get_epub_info, filename)
+
     def get_epub_path(self, filename: str) -> Path:
         """
         Get the full path to an EPUB file
         Handles URL decoding for filenames with special characters
         """
+        file_path, _ = self._get_epub_path_and_stat(filename)
+        return file_path
+
+    def _get_epub_path_and_stat(self, filename: str) -> tuple[Path, os.stat_result]:
+        """
+        Like get_epub_path, but also returns the stat result from the existence
+        check so callers that need the mtime don't stat the file again
+        """
         # Decode the filename in case it's URL-encoded
         decoded_filename = EPUBURLHelper.decode_filename_from_url(filename)
 
         file_path = self.epub_dir / decoded_filename
 
-        if not file_path.exists():
-            raise FileNotFoundError(f"EPUB {decoded_filename} not found")
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"EPUB {decoded_filename} not found") from None
 
         if not file_path.suffix.lower() == ".epub":
             raise ValueError(f"{decoded_filename} is not an EPUB file")
 
-        return file_path
+        return file_path, stat
+
+    def get_etag(self, filename: str, variant: str = "") -> str:
+        """
+        Get an HTTP validator for a response derived from an EPUB
+        Only the file is stat'ed, so a route can answer 304 Not Modified
+        before doing any parsing. variant distinguishes the responses built
+        from the same book (a section id, an image path, ...).
+        """
+        file_path, stat = self._get_epub_path_and_stat(filename)
+        key = f"{file_path.name}:{stat.st_mtime_ns}:{stat.st_size}:{variant}"
+        return hashlib.blake2s(key.encode(), digest_size=8).hexdigest()
 
     def generate_thumbnail(
         self,
@@ -89,11 +153,62 @@ class EPUBService:
         Generate a thumbnail image of the EPUB cover
         Returns the path to the generated thumbnail
         """
-        file_path = self.get_epub_path(filename)
+        file_path, stat = self._get_epub_path_and_stat(filename)
         return self.image_service.generate_thumbnail(
-            file_path, width, height, background_color, strategy
+            file_path, width, height, background_color, strategy, epub_stat=stat
         )
 
+    def generate_thumbnails_bulk(
+        self,
+        filenames: list[str],
+        width: int = 200,
+        height: int = 280,
+        background_color: str = "white",
+        strategy: str = "center",
+    ) -> list[Path | None]:
+        """
+        Generate thumbnails for several EPUBs in parallel using a process pool
+        Returns thumbnail paths in the same order as filenames, with None for
+        any cover that failed
+        """
+        file_paths = [self.get_epub_path(filename) for filename in filenames]
+        return self.image_service.generate_thumbnails_bulk(
+            file_paths, width, height, background_color, strategy
+        )
+
+    async def generate_thumbnail_async(
+        self,
+        filename: str,
+        width: int = 200,
+        height: int = 280,
+        background_color: str = "white",
+        strategy: str = "center",
+    ) -> Path:
+        """
+        Async wrapper for generate_thumbnail; the ZIP read, decode and resize
+        run in a worker thread instead of blocking the event loop. Concurrent
+        calls with the same arguments await the same generation.
+        """
+        key = (filename, width, height, background_color, strategy)
+        future = self._pending_thumbnails.get(key)
+        if future is None:
+            future = asyncio.ensure_future(
+                asyncio.to_thread(
+                    self.generate_thumbnail,
+                    filename,
+                    width,
+                    height,
+                    background_color,
+                    strategy,
+                )
+            )
+            self._pending_thumbnails[key] = future
+            future.add_done_callback(lambda _: self._pending_thumbnails.pop(key, None))
+
+        # Shield so one client disconnecting doesn't cancel the render the
+        # other waiters are sharing
+        return await asyncio.shield(future)
+
     def get_thumbnail_path(
         self, filename: str, width: int = 200, height: int = 280
     ) -> Path:
@@ -109,17 +224,76 @@ class EPUBService:
         except FileNotFoundError:
             pass
 
-        # Fallback: generate if not in cache (shouldn't happen normally)
-        file_path = self.get_epub_path(filename)
-        return self.image_service.get_thumbnail_path(file_path, width, height)
+        # Fallback: derive the path if not in cache (shouldn't happen normally).
+        # This is a pure string operation, so skip get_epub_path's stat calls.
+        return self.image_service.get_thumbnail_path(
+            self.epub_dir / decoded_filename, width, height
+        )
+
+    def get_thumbnail_paths(self, filename: str) -> list[Path]:
+        """
+        Get every thumbnail path that may exist for an EPUB file: one per size
+        bucket, plus the cached path if it points elsewhere (e.g. an older PNG)
+        Works after the EPUB itself has been deleted.
+        """
+        decoded_filename = EPUBURLHelper.decode_filename_from_url(filename)
+        paths = self.image_service.get_thumbnail_paths(self.epub_dir / decoded_filename)
+
+        try:
+            cached_path_str = self.cache.get_thumbnail_path(decoded_filename)
+        except FileNotFoundError:
+            cached_path_str = ""
+        if cached_path_str and Path(cached_path_str) not in paths:
+            paths.append(Path(cached_path_str))
+        return paths
+
+    def read_thumbnail_bytes(self, thumbnail_path: Path) -> bytes:
+        """
+        Get the contents of a generated thumbnail, keeping hot covers in memory
+        Raises FileNotFoundError if the thumbnail hasn't been generated yet
+        """
+        stat = thumbnail_path.stat()
+        return self._thumbnail_bytes_cached(
+            str(thumbnail_path), stat.st_mtime_ns, stat.st_size
+        )
+
+    async def read_thumbnail_bytes_async(self, thumbnail_path: Path) -> bytes:
+        """
+        Async wrapper for read_thumbnail_bytes; the stat, and the file read
+        on a cache miss, run in a worker thread
+        """
+        return await asyncio.to_thread(self.read_thumbnail_bytes, thumbnail_path)
+
+    def _read_thumbnail_file(self, path_str: str, mtime_ns: int, size: int) -> bytes:
+        # mtime_ns and size are only part of the cache key: a regenerated
+        # thumbnail gets a new entry
+        return Path(path_str).read_bytes()
 
     def get_navigation_tree(self, filename: str) -> dict[str, Any]:
         """
         Get the hierarchical navigation structure of an EPUB
         Returns full table of contents with nested structure
         """
-        file_path = self.get_epub_path(filename)
-        book = epub.read_epub(str(file_path))
+        file_path, stat = self._get_epub_path_and_stat(filename)
+        navigation = self._navigation_tree_cached(
+            str(file_path), stat.st_mtime_ns, stat.st_size
+        )
+        # The cached tree is shared, so hand each caller its own copy
+        return copy.deepcopy(navigation)
+
+    async def get_navigation_tree_async(self, filename: str) -> dict[str, Any]:
+        """
+        Async wrapper for get_navigation_tree; a cache miss parses the whole
+        book, so it runs in a worker thread
+        """
+        return await asyncio.to_thread(self.get_navigation_tree, filename)
+
+    def _build_navigation_tree(
+        self, path_str: str, mtime_ns: int, size: int
+    ) -> dict[str, Any]:
+        # mtime_ns and size are only part of the cache key: a rewritten file
+        # gets a new entry
+        book = read_epub_cached(Path(path_str))
         return self.navigation_service.get_navigation_tree(book)
 
     def get_content_by_nav_id(
@@ -130,11 +304,22 @@ class EPUBService:
         Enhanced to handle chapters that span multiple spine items
         """
         file_path = self.get_epub_path(filename)
-        book = epub.read_epub(str(file_path))
+        book = read_epub_cached(file_path)
         return self.content_processor.get_content_by_nav_id(
             book, nav_id, filename, epub_id
         )
 
+    async def get_content_by_nav_id_async(
+        self, filename: str, nav_id: str, epub_id: int | None = None
+    ) -> dict[str, Any]:
+        """
+        Async wrapper for get_content_by_nav_id; parsing and sanitizing the
+        section's chapters run in a worker thread
+        """
+        return await asyncio.to_thread(
+            self.get_content_by_nav_id, filename, nav_id, epub_id
+        )
+
     def get_epub_book(self, filename: str) -> epub.EpubBook:
         """
         Load and return an EPUB book object.
@@ -146,14 +331,14 @@ class EPUBService:
             The loaded EpubBook object
         """
         file_path = self.get_epub_path(filename)
-        return epub.read_epub(str(file_path))
+        return read_epub_cached(file_path)
 
     def extract_section_text(self, filename: str, nav_id: str) -> str:
         """
         Extracts plain text content for a specific navigation section.
         """
         file_path = self.get_epub_path(filename)
-        book = epub.read_epub(str(file_path))
+        book = read_epub_cached(file_path)
         return self.content_processor.extract_section_text(book, nav_id, filename)
 
     def get_epub_styles(self, filename: str) -> dict[str, Any]:
@@ -161,8 +346,26 @@ class EPUBService:
         Extract and return CSS styles from an EPUB
         Returns sanitized CSS content for safe browser rendering
         """
-        file_path = self.get_epub_path(filename)
-        book = epub.read_epub(str(file_path))
+        file_path, stat = self._get_epub_path_and_stat(filename)
+        styles = self._epub_styles_cached(
+            str(file_path), stat.st_mtime_ns, stat.st_size
+        )
+        # The cached styles are shared, so hand each caller its own copy
+        return copy.deepcopy(styles)
+
+    async def get_epub_styles_async(self, filename: str) -> dict[str, Any]:
+        """
+        Async wrapper for get_epub_styles; a cache miss parses the book and
+        sanitizes its stylesheets in a worker thread
+        """
+        return await asyncio.to_thread(self.get_epub_styles, filename)
+
+    def _build_epub_styles(
+        self, path_str: str, mtime_ns: int, size: int
+    ) -> dict[str, Any]:
+        # mtime_ns and size are only part of the cache key: a rewritten file
+        # gets a new entry
+        book = read_epub_cached(Path(path_str))
         return self.style_processor.get_epub_styles(book)
 
     def get_epub_image(self, filename: str, image_path: str) -> bytes:
@@ -170,21 +373,38 @@ class EPUBService:
         Extract and return a specific image from an EPUB file
         """
         file_path = self.get_epub_path(filename)
-        book = epub.read_epub(str(file_path))
-        return self.image_service.get_epub_image(book, image_path)
+        try:
+            return self.image_service.get_epub_image_from_archive(file_path, image_path)
+        except FileNotFoundError:
+            raise
+        except Exception:
+            # Archives whose OPF can't be read directly still work via ebooklib
+            book = read_epub_cached(file_path)
+            return self.image_service.get_epub_image(book, image_path)
+
+    async def get_epub_image_async(self, filename: str, image_path: str) -> bytes:
+        """
+        Async wrapper for get_epub_image; the ZIP read runs in a worker thread
+        """
+        return await asyncio.to_thread(self.get_epub_image, filename, image_path)
 
     def get_epub_images_list(self, filename: str) -> list[dict[str, str]]:
         """
         Get a list of all images in an EPUB file
         """
         file_path = self.get_epub_path(filename)
-        book = epub.read_epub(str(file_path))
+        book = read_epub_cached(file_path)
         return self.image_service.get_epub_images_list(book)
 
     def refresh_cache(self) -> dict[str, Any]:
         """
         Refresh the EPUB cache by rebuilding from filesystem
         """
+        clear_archive_cache()
+        clear_book_cache()
+        self._navigation_tree_cached.cache_clear()
+        self._epub_styles_cached.cache_clear()
+        self._thumbnail_bytes_cached.cache_clear()
         self.cache.refresh()
         return self.cache.get_cache_info()
 
@@ -208,9 +428,18 @@ class EPUBService:
             Updated nav_metadata with word_count fields added
         """
         file_path = self.get_epub_path(filename)
-        book = epub.read_epub(str(file_path))
+        book = read_epub_cached(file_path)
         return self.word_count_service.extract_word_counts(book, nav_metadata)
 
+    async def extract_word_counts_async(
+        self, filename: str, nav_metadata: dict[str, Any]
+    ) -> dict[str, Any]:
+        """
+        Async wrapper for extract_word_counts; counting words parses every
+        section, so it runs in a worker thread
+        """
+        return await asyncio.to_thread(self.extract_word_counts, filename, nav_metadata)
+
     def needs_word_count(self, nav_metadata: dict[str, Any] | None) -> bool:
         """
         Check if word counts need to be extracted for the given nav_metadata.
@@ -8,6 +8,9 @@ while reading PDFs.
 
 import json
 import logging
+import sqlite3
+import threading
+from functools import lru_cache
 from typing import Any
 
 from .base_database_service import BaseDatabaseService
@@ -16,6 +19,9 @@ from .pdf_documents_service import PDFDocumentsService
 # Configure logger for this module
 logger = logging.getLogger(__name__)
 
+# Highlights kept in memory for get_highlight_by_id
+HIGHLIGHT_CACHE_SIZE = 1024
+
 
 class HighlightsService(BaseDatabaseService):
     """
@@ -25,6 +31,70 @@ class HighlightsService(BaseDatabaseService):
     - Text highlights with coordinates and visual properties
     """
 
+    # Timestamps are local time, like get_current_timestamp(), rather than
+    # the UTC column defaults. SQLite computes them itself, and 'now' is
+    # fixed for the whole statement, so created_at == updated_at on insert.
+    _LOCAL_NOW = "datetime('now', 'localtime')"
+    _INSERT_HIGHLIGHT_QUERY = f"""
+        INSERT INTO highlights (
+            pdf_filename, pdf_id, page_number, selected_text, start_offset, end_offset,
+            color, coordinates, created_at, updated_at
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, {_LOCAL_NOW}, {_LOCAL_NOW})
+    """
+
+    # Coordinates can be far larger than the rest of a row, so list views
+    # that don't draw the highlights read the columns without them
+    _HIGHLIGHT_LIST_COLUMNS = """
+        id, pdf_filename, pdf_id, page_number, selected_text, start_offset, end_offset,
+        color, created_at, updated_at
+    """
+    _HIGHLIGHT_COLUMNS = f"{_HIGHLIGHT_LIST_COLUMNS}, coordinates"
+    _SELECT_HIGHLIGHTS_BY_PAGE_QUERY = f"""
+        SELECT {_HIGHLIGHT_COLUMNS}
+        FROM highlights
+        WHERE pdf_filename = ? AND page_number = ?
+        ORDER BY created_at DESC
+    """
+    _SELECT_HIGHLIGHTS_BY_PDF_QUERY = f"""
+        SELECT {_HIGHLIGHT_COLUMNS}
+        FROM highlights
+        WHERE pdf_filename = ?
+        ORDER BY page_number, created_at DESC
+    """
+    _SELECT_HIGHLIGHT_LIST_BY_PAGE_QUERY = f"""
+        SELECT {_HIGHLIGHT_LIST_COLUMNS}
+        FROM highlights
+        WHERE pdf_filename = ? AND page_number = ?
+        ORDER BY created_at DESC
+    """
+    _SELECT_HIGHLIGHT_LIST_BY_PDF_QUERY = f"""
+        SELECT {_HIGHLIGHT_LIST_COLUMNS}
+        FROM highlights
+        WHERE pdf_filename = ?
+        ORDER BY page_number, created_at DESC
+    """
+    _SELECT_HIGHLIGHT_BY_ID_QUERY = f"""
+        SELECT {_HIGHLIGHT_COLUMNS}
+        FROM highlights
+        WHERE id = ?
+    """
+    _UPDATE_HIGHLIGHT_COLOR_QUERY = f"""
+        UPDATE highlights
+        SET color = ?, updated_at = {_LOCAL_NOW}
+        WHERE id = ?
+    """
+    _DELETE_HIGHLIGHT_QUERY = "DELETE FROM highlights WHERE id = ?"
+
+    # Per-connection tuning for file databases, applied once when a thread
+    # opens its connection: temp tables in memory, reads through a 256 MiB
+    # memory map, and a ~20 MB page cache
+    _CONNECTION_PRAGMAS = (
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA mmap_size=268435456",
+        "PRAGMA cache_size=-20000",
+    )
+
     def __init__(self, db_path: str = "data/reading_progress.db"):
         """
         Initialize the highlights service.
@@ -33,17 +103,64 @@ class HighlightsService(BaseDatabaseService):
             db_path (str): Path to the SQLite database file
         """
         super().__init__(db_path)
+        # One connection per thread, opened on first use (see get_connection)
+        self._local = threading.local()
+        # Highlights by id, keyed with a generation that every write bumps, so
+        # a read racing a write can't put the old row back (see
+        # clear_highlight_cache)
+        self._cache_generation = 0
+        self._highlight_by_id_cached = lru_cache(maxsize=HIGHLIGHT_CACHE_SIZE)(
+            self._load_highlight_by_id
+        )
         # Phase 3c: Initialize PDF documents service for pdf_id lookups
         # Note: Must be initialized before _init_table() for consistency,
         # though backfill uses direct SQL joins, not the helper method
         self._pdf_docs_service = PDFDocumentsService(db_path)
         self._init_table()
 
+    def get_connection(self) -> sqlite3.Connection:
+        """
+        Get this thread's database connection.
+
+        Highlight queries are short, so opening a connection per call was a
+        large share of their cost. Each thread keeps one open connection
+        instead, which also keeps SQLite's page cache warm between calls.
+        Callers use it as a context manager, which commits or rolls back but
+        doesn't close it.
+
+        Highlights are committed one row at a time. With the database in WAL
+        mode (see _init_table), synchronous=NORMAL skips the fsync on every
+        commit; a power loss can drop the last commits but can't corrupt the
+        database.
+
+        The connection lives as long as its thread, so the remaining
+        per-connection pragmas (_CONNECTION_PRAGMAS) are worth setting here
+        too. They are skipped for ':memory:' databases, which have no file to
+        map and are never larger than the cache.
+
+        Returns:
+            sqlite3.Connection: Database connection object
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = super().get_connection()
+            conn.execute("PRAGMA synchronous=NORMAL")
+            if self.db_path != ":memory:":
+                for pragma in self._CONNECTION_PRAGMAS:
+                    conn.execute(pragma)
+            self._local.conn = conn
+        return conn
+
     def _init_table(self):
         """
         Initialize the highlights table and indexes.
         """
         with self.get_connection() as conn:
+            # WAL is a persistent property of the database file, so setting it
+            # once here covers every later connection. Readers also no longer
+            # block on a highlight being written.
+            conn.execute("PRAGMA journal_mode=WAL")
+
             # Create highlights table
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS highlights (
@@ -60,17 +177,24 @@ class HighlightsService(BaseDatabaseService):
                 )
             """)
 
-            # Create indexes for faster lookups
+            # Create indexes for faster lookups. created_at is part of each
+            # key so the ORDER BY in get_highlights_for_pdf (by page, newest
+            # first) and the per-PDF MAX(created_at) are read straight from
+            # the index instead of sorting the matching rows.
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_highlights_pdf_page
-                ON highlights(pdf_filename, page_number)
+                CREATE INDEX IF NOT EXISTS idx_highlights_pdf_page_created
+                ON highlights(pdf_filename, page_number, created_at DESC)
             """)
 
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_highlights_pdf
-                ON highlights(pdf_filename)
+                CREATE INDEX IF NOT EXISTS idx_highlights_pdf_created
+                ON highlights(pdf_filename, created_at DESC)
             """)
 
+            # The indexes above start with the same columns as these older ones
+            conn.execute("DROP INDEX IF EXISTS idx_highlights_pdf_page")
+            conn.execute("DROP INDEX IF EXISTS idx_highlights_pdf")
+
             # Phase 3c: Add pdf_id column if it doesn't exist (backward compatible migration)
             cursor = conn.cursor()
             cursor.execute("PRAGMA table_info(highlights)")
@@ -97,23 +221,27 @@ class HighlightsService(BaseDatabaseService):
             # TODO: This backfill can be removed after all environments have been updated
             #       and no NULL pdf_id values remain. Safe to remove after ~March 2026.
             # =============================================================================
-            cursor.execute("""
-                UPDATE highlights
-                SET pdf_id = (
-                    SELECT id FROM pdf_documents
-                    WHERE pdf_documents.filename = highlights.pdf_filename
-                )
-                WHERE pdf_id IS NULL
-                AND EXISTS (
-                    SELECT 1 FROM pdf_documents
-                    WHERE pdf_documents.filename = highlights.pdf_filename
-                )
-            """)
-            backfilled = cursor.rowcount
-            if backfilled > 0:
-                logger.info(
-                    f"Backfilled pdf_id for {backfilled} existing highlights rows"
-                )
+            # The probe is answered from idx_highlights_pdf_id, so once every row
+            # has a pdf_id, startup skips planning the correlated UPDATE
+            cursor.execute("SELECT 1 FROM highlights WHERE pdf_id IS NULL LIMIT 1")
+            if cursor.fetchone() is not None:
+                cursor.execute("""
+                    UPDATE highlights
+                    SET pdf_id = (
+                        SELECT id FROM pdf_documents
+                        WHERE pdf_documents.filename = highlights.pdf_filename
+                    )
+                    WHERE pdf_id IS NULL
+                    AND EXISTS (
+                        SELECT 1 FROM pdf_documents
+                        WHERE pdf_documents.filename = highlights.pdf_filename
+                    )
+                """)
+                backfilled = cursor.rowcount
+                if backfilled > 0:
+                    logger.info(
+                        "Backfilled pdf_id for %s existing highlights rows", backfilled
+                    )
 
             conn.commit()
 
@@ -132,10 +260,10 @@ class HighlightsService(BaseDatabaseService):
         try:
             pdf_doc = self._pdf_docs_service.get_by_filename(pdf_filename)
             if pdf_doc:
-                return pdf_doc.get("id")
+                return pdf_doc.id
             return None
         except Exception as e:
-            logger.warning(f"Could not look up pdf_id for {pdf_filename}: {e}")
+            logger.warning("Could not look up pdf_id for %s: %s", pdf_filename, e)
             return None
 
     def save_highlight(
@@ -165,18 +293,11 @@ class HighlightsService(BaseDatabaseService):
         """
         try:
             # Convert coordinates list to JSON string for storage
-            coordinates_json = json.dumps(coordinates)
+            coordinates_json = self._dump_coordinates(coordinates)
 
             # Phase 3c: Look up pdf_id for auto-population
             pdf_id = self._get_pdf_id(pdf_filename)
 
-            query = """
-                INSERT INTO highlights (
-                    pdf_filename, pdf_id, page_number, selected_text, start_offset, end_offset,
-                    color, coordinates, created_at, updated_at
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
             params = (
                 pdf_filename,
                 pdf_id,
@@ -186,22 +307,77 @@ class HighlightsService(BaseDatabaseService):
                 end_offset,
                 color,
                 coordinates_json,
-                self.get_current_timestamp(),
-                self.get_current_timestamp(),
             )
 
-            highlight_id = self.execute_insert(query, params)
+            highlight_id = self.execute_insert(self._INSERT_HIGHLIGHT_QUERY, params)
             if highlight_id:
                 logger.info(
-                    f"Saved highlight for {pdf_filename}, page {page_number} (pdf_id={pdf_id})"
+                    "Saved highlight for %s, page %s (pdf_id=%s)",
+                    pdf_filename,
+                    page_number,
+                    pdf_id,
                 )
             return highlight_id
         except Exception as e:
-            logger.error(f"Error saving highlight: {e}")
+            logger.error("Error saving highlight: %s", e)
             return None
 
+    def save_highlights_bulk(self, highlights: list[dict[str, Any]]) -> int:
+        """
+        Save many highlights in a single transaction.
+
+        Each pdf_id is looked up once per distinct filename in the batch, and
+        all rows are inserted with one executemany on one connection.
+
+        Args:
+            highlights (list[dict[str, Any]]): Highlight dictionaries with the
+                same fields as the save_highlight arguments
+
+        Returns:
+            int: Number of highlights saved, 0 if the batch failed
+        """
+        if not highlights:
+            return 0
+
+        try:
+            pdf_ids: dict[str, int | None] = {}
+            rows = []
+            for highlight in highlights:
+                pdf_filename = highlight["pdf_filename"]
+                if pdf_filename not in pdf_ids:
+                    pdf_ids[pdf_filename] = self._get_pdf_id(pdf_filename)
+                rows.append(
+                    (
+                        pdf_filename,
+                        pdf_ids[pdf_filename],
+                        highlight["page_number"],
+                        highlight["selected_text"],
+                        highlight["start_offset"],
+                        highlight["end_offset"],
+                        highlight["color"],
+                        self._dump_coordinates(highlight["coordinates"]),
+                    )
+                )
+
+            with self.get_connection() as conn:
+                conn.executemany(self._INSERT_HIGHLIGHT_QUERY, rows)
+                conn.commit()
+
+            logger.info(
+                "Saved %s highlights for %s PDF(s) in one batch",
+                len(rows),
+                len(pdf_ids),
+            )
+            return len(rows)
+        except Exception as e:
+            logger.error("Error saving highlights in bulk: %s", e)
+            return 0
+
     def get_highlights_for_pdf(
-        self, pdf_filename: str, page_number: int | None = None
+        self,
+        pdf_filename: str,
+        page_number: int | None = None,
+        include_coordinates: bool = True,
     ) -> list[dict[str, Any]]:
         """
         Retrieve highlights for a PDF document, optionally filtered by page number.
@@ -209,63 +385,35 @@ class HighlightsService(BaseDatabaseService):
         Args:
             pdf_filename (str): Name of the PDF file to get highlights for
             page_number (int | None): Specific page number to filter by, or None for all pages
+            include_coordinates (bool): Whether to load coordinates; when False
+                they are not read from the database and come back as None
 
         Returns:
             list[dict[str, Any]]: List of highlight dictionaries
         """
         try:
-            # Phase 3c: Include pdf_id in query
+            # Phase 3c: pdf_id is included in the selected columns
             if page_number is not None:
-                query = """
-                    SELECT id, pdf_filename, pdf_id, page_number, selected_text, start_offset, end_offset,
-                           color, coordinates, created_at, updated_at
-                    FROM highlights
-                    WHERE pdf_filename = ? AND page_number = ?
-                    ORDER BY created_at DESC
-                """
+                query = (
+                    self._SELECT_HIGHLIGHTS_BY_PAGE_QUERY
+                    if include_coordinates
+                    else self._SELECT_HIGHLIGHT_LIST_BY_PAGE_QUERY
+                )
                 params = (pdf_filename, page_number)
             else:
-                query = """
-                    SELECT id, pdf_filename, pdf_id, page_number, selected_text, start_offset, end_offset,
-                           color, coordinates, created_at, updated_at
-                    FROM highlights
-                    WHERE pdf_filename = ?
-                    ORDER BY page_number, created_at DESC
-                """
+                query = (
+                    self._SELECT_HIGHLIGHTS_BY_PDF_QUERY
+                    if include_coordinates
+                    else self._SELECT_HIGHLIGHT_LIST_BY_PDF_QUERY
+                )
                 params = (pdf_filename,)
 
             rows = self.execute_query(query, params, fetch_all=True)
-
-            highlights = []
-            if rows:
-                for row in rows:
-                    # Parse coordinates JSON back to Python objects
-                    try:
-                        coordinates_data = json.loads(row["coordinates"])
-                    except (json.JSONDecodeError, TypeError):
-                        logger.warning(
-                            f"Invalid coordinates JSON for highlight {row['id']}"
-                        )
-                        coordinates_data = []
-
-                    highlights.append(
-                        {
-                            "id": row["id"],
-                            "pdf_filename": row["pdf_filename"],
-                            "pdf_id": row["pdf_id"],
-                            "page_number": row["page_number"],
-                            "selected_text": row["selected_text"],
-                            "start_offset": row["start_offset"],
-                            "end_offset": row["end_offset"],
-                            "color": row["color"],
-                            "coordinates": coordinates_data,
-                            "created_at": row["created_at"],
-                            "updated_at": row["updated_at"],
-                        }
-                    )
-            return highlights
+            if not include_coordinates:
+                return [dict(row, coordinates=None) for row in rows or []]
+            return [self._row_to_highlight(row) for row in rows or []]
         except Exception as e:
-            logger.error(f"Error getting highlights: {e}")
+            logger.error("Error getting highlights: %s", e)
             return []
 
     def get_highlight_by_id(self, highlight_id: int) -> dict[str, Any] | None:
@@ -279,43 +427,72 @@ class HighlightsService(BaseDatabaseService):
             dict[str, Any] | None: Highlight dictionary with all fields, or None if not found
         """
         try:
-            # Phase 3c: Include pdf_id in query
-            query = """
-                SELECT id, pdf_filename, pdf_id, page_number, selected_text, start_offset, end_offset,
-                       color, coordinates, created_at, updated_at
-                FROM highlights
-                WHERE id = ?
-            """
-            row = self.execute_query(query, (highlight_id,), fetch_one=True)
-
-            if row:
-                # Parse coordinates JSON back to Python objects
-                try:
-                    coordinates_data = json.loads(row["coordinates"])
-                except (json.JSONDecodeError, TypeError):
-                    logger.warning(
-                        f"Invalid coordinates JSON for highlight {highlight_id}"
-                    )
-                    coordinates_data = []
-
-                return {
-                    "id": row["id"],
-                    "pdf_filename": row["pdf_filename"],
-                    "pdf_id": row["pdf_id"],
-                    "page_number": row["page_number"],
-                    "selected_text": row["selected_text"],
-                    "start_offset": row["start_offset"],
-                    "end_offset": row["end_offset"],
-                    "color": row["color"],
-                    "coordinates": coordinates_data,
-                    "created_at": row["created_at"],
-                    "updated_at": row["updated_at"],
-                }
+            highlight = self._highlight_by_id_cached(
+                highlight_id, self._cache_generation
+            )
+        except LookupError:
             return None
         except Exception as e:
-            logger.error(f"Error getting highlight: {e}")
+            logger.error("Error getting highlight: %s", e)
             return None
 
+        # The cached highlight is shared, so hand each caller its own copy.
+        # Coordinate boxes only hold numbers, so copying each box is enough.
+        return {
+            **highlight,
+            "coordinates": [dict(box) for box in highlight["coordinates"]],
+        }
+
+    def _load_highlight_by_id(
+        self, highlight_id: int, generation: int
+    ) -> dict[str, Any]:
+        """
+        Read a highlight from the database for the by-id cache.
+
+        Missing highlights raise instead of returning None, so lru_cache
+        doesn't remember the miss; the id may be inserted later.
+
+        Args:
+            highlight_id (int): Unique identifier of the highlight to load
+            generation (int): Cache generation, only part of the cache key
+
+        Returns:
+            dict[str, Any]: Highlight dictionary with all fields
+        """
+        row = self.execute_query(
+            self._SELECT_HIGHLIGHT_BY_ID_QUERY, (highlight_id,), fetch_one=True
+        )
+        if not row:
+            raise LookupError(highlight_id)
+        return self._row_to_highlight(row)
+
+    def clear_highlight_cache(self):
+        """
+        Forget cached highlights after highlights were changed or deleted.
+        """
+        self._cache_generation += 1
+        self._highlight_by_id_cached.cache_clear()
+
+    def _dump_coordinates(self, coordinates: list[dict[str, Any]]) -> str:
+        """
+        Serialize coordinates for storage without the default separator
+        whitespace; rows written with the default separators still parse.
+        """
+        return json.dumps(coordinates, separators=(",", ":"))
+
+    def _row_to_highlight(self, row) -> dict[str, Any]:
+        """
+        Convert a highlights row into a highlight dictionary, parsing the
+        coordinates JSON back to Python objects.
+        """
+        highlight = dict(row)
+        try:
+            highlight["coordinates"] = json.loads(highlight["coordinates"])
+        except (json.JSONDecodeError, TypeError):
+            logger.warning("Invalid coordinates JSON for highlight %s", highlight["id"])
+            highlight["coordinates"] = []
+        return highlight
+
     def delete_highlight(self, highlight_id: int) -> bool:
         """
         Delete a specific highlight by its ID.
@@ -327,13 +504,15 @@ class HighlightsService(BaseDatabaseService):
             bool: True if a highlight was deleted, False if no highlight was found or deletion failed
         """
         try:
-            query = "DELETE FROM highlights WHERE id = ?"
-            deleted = self.execute_update_delete(query, (highlight_id,))
+            deleted = self.execute_update_delete(
+                self._DELETE_HIGHLIGHT_QUERY, (highlight_id,)
+            )
             if deleted:
-                logger.info(f"Deleted highlight {highlight_id}")
+                self.clear_highlight_cache()
+                logger.info("Deleted highlight %s", highlight_id)
             return deleted
         except Exception as e:
-            logger.error(f"Error deleting highlight: {e}")
+            logger.error("Error deleting highlight: %s", e)
             return False
 
     def update_color(self, highlight_id: int, color: str) -> bool:
@@ -348,18 +527,15 @@ class HighlightsService(BaseDatabaseService):
             bool: True if the highlight was updated, False if no highlight was found or update failed
         """
         try:
-            query = """
-                UPDATE highlights
-                SET color = ?, updated_at = ?
-                WHERE id = ?
-            """
-            params = (color, self.get_current_timestamp(), highlight_id)
-            updated = self.execute_update_delete(query, params)
+            updated = self.execute_update_delete(
+                self._UPDATE_HIGHLIGHT_COLOR_QUERY, (color, highlight_id)
+            )
             if updated:
-                logger.info(f"Updated highlight {highlight_id} color to {color}")
+                self.clear_highlight_cache()
+                logger.info("Updated highlight %s color to %s", highlight_id, color)
             return updated
         except Exception as e:
-            logger.error(f"Error updating highlight color: {e}")
+            logger.error("Error updating highlight color: %s", e)
             return False
 
     def get_highlights_count_by_pdf(self) -> dict[str, dict[str, Any]]:
@@ -370,50 +546,48 @@ class HighlightsService(BaseDatabaseService):
             dict[str, dict[str, Any]]: Dictionary mapping PDF filenames to their highlight statistics
         """
         try:
-            # First query: Get count and latest highlight date for each PDF
+            # One pass over the table: with a single MAX() aggregate, SQLite
+            # takes bare columns (the preview) from the row holding the max,
+            # so the latest highlight's text comes back with its group. The
+            # text is cut to its preview in SQLite, so long highlights aren't
+            # copied out in full only to be sliced here.
             query = """
                 SELECT
                     pdf_filename,
                     COUNT(*) as highlights_count,
-                    MAX(created_at) as latest_highlight_date
+                    MAX(created_at) as latest_highlight_date,
+                    substr(selected_text, 1, 50) as preview,
+                    length(selected_text) > 50 as truncated
                 FROM highlights
                 GROUP BY pdf_filename
             """
             rows = self.execute_query(query, fetch_all=True)
 
             highlights_info = {}
-            if rows:
-                for row in rows:
-                    # Second query: Get the text of the latest highlight
-                    text_query = """
-                        SELECT selected_text
-                        FROM highlights
-                        WHERE pdf_filename = ? AND created_at = ?
-                        LIMIT 1
-                    """
-                    text_row = self.execute_query(
-                        text_query,
-                        (row["pdf_filename"], row["latest_highlight_date"]),
-                        fetch_one=True,
-                    )
-
-                    # Truncate text for preview (first 50 characters)
-                    latest_text = (
-                        text_row["selected_text"][:50] + "..."
-                        if text_row and len(text_row["selected_text"]) > 50
-                        else (text_row["selected_text"] if text_row else "No text")
-                    )
-
-                    highlights_info[row["pdf_filename"]] = {
-                        "highlights_count": row["highlights_count"],
-                        "latest_highlight_date": row["latest_highlight_date"],
-                        "latest_highlight_text": latest_text,
-                    }
+            for row in rows or []:
+                # Preview is the first 50 characters of the latest text
+                preview = row["preview"]
+                if preview is None:
+                    latest_text = "No text"
+                elif row["truncated"]:
+                    latest_text = preview + "..."
+                else:
+                    latest_text = preview
+
+                highlights_info[row["pdf_filename"]] = {
+                    "highlights_count": row["highlights_count"],
+                    "latest_highlight_date": row["latest_highlight_date"],
+                    "latest_highlight_text": latest_text,
+                }
 
-            logger.info(
-                f"Found highlights for {len(highlights_info)} PDFs: {list(highlights_info.keys())}"
-            )
+            # The filename list is only built when INFO is actually logged
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Found highlights for %s PDFs: %s",
+                    len(highlights_info),
+                    list(highlights_info),
+                )
             return highlights_info
         except Exception as e:
-            logger.error(f"Error getting highlights count: {e}")
+            logger.error("Error getting highlights count: %s", e)
             return {}
@@ -7,18 +7,33 @@ It implements a two-pass extraction approach:
 - Pass 2: Extract relationships between concepts
 """
 
+import asyncio
 import json
 import logging
 import re
 import threading
+from bisect import bisect_right
+from collections.abc import Awaitable, Callable
 
 from openai import AsyncOpenAI
 
 from app.models.knowledge_models import ExtractedConcept, ExtractedRelationship
 from app.services.llm_config_service import LLMConfigService
 
+from .llm_cache import LLMCache
+
 logger = logging.getLogger(__name__)
 
+# Chunks of one section are sent to the LLM concurrently, up to this many
+# requests in flight per extractor
+MAX_CONCURRENT_LLM_CALLS = 8
+
+# Whether the shared extractor reuses cached LLM responses (see LLMCache)
+LLM_CACHE_ENABLED = True
+
+# Sampling temperature for extraction; low for more consistent results
+EXTRACTION_TEMPERATURE = 0.3
+
 # Prompt templates for extraction
 CONCEPT_EXTRACTION_PROMPT = """Extract key important concepts from this text. For each concept provide:
 - name: canonical form of the concept (capitalize properly)
@@ -87,18 +102,39 @@ class ConceptExtractor:
     Implements a two-pass approach:
     1. Extract concepts from text chunks
     2. Extract relationships between identified concepts
+
+    Within each pass, chunks are extracted concurrently; results are still
+    deduplicated and returned in chunk order.
     """
 
-    def __init__(self, db_path: str = "data/reading_progress.db"):
+    # Sentence endings chunk_content may break after, in order of preference
+    _SENTENCE_BREAKS = (". ", ".\n", "! ", "!\n", "? ", "?\n")
+    _SENTENCE_BREAK_PATTERN = re.compile(r"[.!?][ \n]")
+
+    # Relationship types the extraction prompt allows
+    _RELATIONSHIP_TYPES = frozenset(
+        {"explains", "contrasts", "requires", "builds-on", "examples", "causes"}
+    )
+
+    def __init__(
+        self,
+        db_path: str = "data/reading_progress.db",
+        max_concurrency: int = MAX_CONCURRENT_LLM_CALLS,
+        llm_cache: LLMCache | None = None,
+    ):
         """
         Initialize the concept extractor.
 
         Args:
             db_path: Path to the database (for loading LLM config)
+            max_concurrency: Maximum number of LLM requests in flight at once
+            llm_cache: Optional cache of earlier LLM responses
         """
         self.db_path = db_path
         self._client: AsyncOpenAI | None = None
         self._model: str | None = None
+        self._llm_semaphore = asyncio.Semaphore(max_concurrency)
+        self._llm_cache = llm_cache
         self._load_llm_config()
 
     def _load_llm_config(self) -> None:
@@ -161,19 +197,29 @@ class ConceptExtractor:
         if len(content) <= chunk_size:
             return [content]
 
+        # Find every sentence ending once, grouped by kind, instead of
+        # searching back from each chunk end for each kind in turn
+        break_positions: dict[str, list[int]] = {
+            punct: [] for punct in self._SENTENCE_BREAKS
+        }
+        for match in self._SENTENCE_BREAK_PATTERN.finditer(content):
+            break_positions[match.group()].append(match.start())
+
         chunks = []
         start = 0
 
         while start < len(content):
             end = start + chunk_size
 
-            # Try to break at a sentence boundary
+            # Try to break at a sentence boundary: the last ending of the
+            # first kind found in the second half of the chunk
             if end < len(content):
-                # Look for sentence ending punctuation
-                for punct in [". ", ".\n", "! ", "!\n", "? ", "?\n"]:
-                    last_punct = content.rfind(punct, start + chunk_size // 2, end)
-                    if last_punct != -1:
-                        end = last_punct + 1
+                for punct in self._SENTENCE_BREAKS:
+                    positions = break_positions[punct]
+                    # Last ending that fits entirely before the chunk end
+                    index = bisect_right(positions, end - len(punct))
+                    if index and positions[index - 1] >= start + chunk_size // 2:
+                        end = positions[index - 1] + 1
                         break
 
             chunk = content[start:end].strip()
@@ -189,6 +235,7 @@ class ConceptExtractor:
         text: str,
         book_title: str,
         section_title: str,
+        use_cache: bool = True,
     ) -> list[ExtractedConcept]:
         """
         Extract concepts from text using LLM.
@@ -197,6 +244,7 @@ class ConceptExtractor:
             text: Text to extract concepts from
             book_title: Title of the book
             section_title: Title of the current section
+            use_cache: Whether a cached response for the same request may be reused
 
         Returns:
             List of extracted concepts
@@ -211,26 +259,18 @@ class ConceptExtractor:
         )
 
         try:
-            response = await self._client.chat.completions.create(
-                model=self._model,
-                messages=[
+            content = await self._complete(
+                [
                     {
                         "role": "system",
                         "content": "You are a knowledge extraction assistant. Extract concepts and return valid JSON only.",
                     },
                     {"role": "user", "content": prompt},
                 ],
-                temperature=0.3,  # Lower temperature for more consistent extraction
+                "concept extraction",
+                use_cache,
             )
-
-            # Guard against empty choices
-            if not response.choices:
-                logger.warning("LLM returned empty choices for concept extraction")
-                return []
-
-            content = response.choices[0].message.content
             if not content:
-                logger.warning("LLM returned empty content for concept extraction")
                 return []
 
             concepts = self._parse_concepts_json(content.strip())
@@ -245,6 +285,7 @@ class ConceptExtractor:
         self,
         text: str,
         concepts: list[ExtractedConcept],
+        use_cache: bool = True,
     ) -> list[ExtractedRelationship]:
         """
         Extract relationships between concepts using LLM.
@@ -252,6 +293,7 @@ class ConceptExtractor:
         Args:
             text: Original text
             concepts: List of concepts extracted from the text
+            use_cache: Whether a cached response for the same request may be reused
 
         Returns:
             List of extracted relationships
@@ -271,26 +313,18 @@ class ConceptExtractor:
         )
 
         try:
-            response = await self._client.chat.completions.create(
-                model=self._model,
-                messages=[
+            content = await self._complete(
+                [
                     {
                         "role": "system",
                         "content": "You are a knowledge extraction assistant. Extract relationships and return valid JSON only.",
                     },
                     {"role": "user", "content": prompt},
                 ],
-                temperature=0.3,
+                "relationship extraction",
+                use_cache,
             )
-
-            # Guard against empty choices
-            if not response.choices:
-                logger.warning("LLM returned empty choices for relationship extraction")
-                return []
-
-            content = response.choices[0].message.content
             if not content:
-                logger.warning("LLM returned empty content for relationship extraction")
                 return []
 
             relationships = self._parse_relationships_json(content.strip(), concepts)
@@ -301,6 +335,57 @@ class ConceptExtractor:
             logger.error(f"Error extracting relationships: {e}")
             return []
 
+    async def _complete(
+        self,
+        messages: list[dict[str, str]],
+        purpose: str,
+        use_cache: bool,
+    ) -> str | None:
+        """
+        Send a chat request to the LLM and return the response content.
+
+        With an LLM cache, an identical earlier request is answered from the
+        cache without calling the LLM; fresh responses are always stored, so
+        a forced re-run (use_cache=False) refreshes the cache.
+
+        Args:
+            messages: Chat messages to send
+            purpose: What the request is for, used in log messages
+            use_cache: Whether a cached response may be reused
+
+        Returns:
+            The response content, or None if the LLM returned nothing
+        """
+        cache_key = None
+        if self._llm_cache is not None:
+            cache_key = LLMCache.make_key(self._model, messages, EXTRACTION_TEMPERATURE)
+            if use_cache:
+                cached = await self._llm_cache.get(cache_key)
+                if cached is not None:
+                    logger.debug(f"Using cached LLM response for {purpose}")
+                    return cached
+
+        async with self._llm_semaphore:
+            response = await self._client.chat.completions.create(
+                model=self._model,
+                messages=messages,
+                temperature=EXTRACTION_TEMPERATURE,
+            )
+
+        # Guard against empty choices
+        if not response.choices:
+            logger.warning(f"LLM returned empty choices for {purpose}")
+            return None
+
+        content = response.choices[0].message.content
+        if not content:
+            logger.warning(f"LLM returned empty content for {purpose}")
+            return None
+
+        if cache_key is not None:
+            await self._llm_cache.set(cache_key, content)
+        return content
+
     async def extract_concepts_incrementally(
         self,
         text: str,
@@ -309,6 +394,7 @@ class ConceptExtractor:
         skip_chunks: set[int] | None = None,
         known_concept_names: set[str] | None = None,
         pre_chunked: list[str] | None = None,
+        use_cache: bool = True,
     ):
         """
         Extract concepts from text chunk by chunk, yielding after each chunk.
@@ -323,6 +409,7 @@ class ConceptExtractor:
             skip_chunks: Set of chunk indices to skip (for resuming)
             known_concept_names: Set of concept names already extracted (for dedup across resumes)
             pre_chunked: Optional pre-chunked content list to avoid redundant chunking
+            use_cache: Whether cached LLM responses may be reused
 
         Yields:
             Tuple of (chunk_index, total_chunks, concepts, was_skipped) after each chunk
@@ -341,42 +428,56 @@ class ConceptExtractor:
         # Initialize with known concept names to avoid re-extracting duplicates
         concept_names_seen: set[str] = set(known_concept_names or set())
 
-        # Extract concepts from each chunk and yield immediately
-        for i, chunk in enumerate(chunks):
-            if i in skip_chunks:
-                logger.info(
-                    f"Chunk {i + 1}/{total_chunks}: SKIPPED (already extracted)"
-                )
-                yield (i, total_chunks, [], True)
-                continue
-
-            logger.info(f"Extracting concepts from chunk {i + 1}/{total_chunks}")
-            try:
-                concepts = await self.extract_concepts(chunk, book_title, section_title)
-
-                # Deduplicate by name within this extraction
-                unique_concepts: list[ExtractedConcept] = []
-                for concept in concepts:
-                    name_lower = concept.name.lower()
-                    if name_lower not in concept_names_seen:
-                        concept_names_seen.add(name_lower)
-                        unique_concepts.append(concept)
+        # Start every chunk up front, then yield them in order as each finishes
+        pending = self._start_chunk_tasks(
+            chunks,
+            skip_chunks,
+            lambda chunk: self.extract_concepts(
+                chunk, book_title, section_title, use_cache
+            ),
+        )
+        try:
+            for i in range(total_chunks):
+                if i in skip_chunks:
+                    logger.info(
+                        f"Chunk {i + 1}/{total_chunks}: SKIPPED (already extracted)"
+                    )
+                    yield (i, total_chunks, [], True)
+                    continue
 
-                logger.info(
-                    f"Chunk {i + 1}/{total_chunks}: extracted {len(concepts)} concepts, "
-                    f"{len(unique_concepts)} unique (after dedup)"
-                )
-                yield (i, total_chunks, unique_concepts, False)
+                logger.info(f"Extracting concepts from chunk {i + 1}/{total_chunks}")
+                try:
+                    concepts = await pending[i]
+
+                    # Deduplicate by name within this extraction
+                    unique_concepts: list[ExtractedConcept] = []
+                    for concept in concepts:
+                        name_lower = concept.name.lower()
+                        if name_lower not in concept_names_seen:
+                            concept_names_seen.add(name_lower)
+                            unique_concepts.append(concept)
+
+                    logger.info(
+                        f"Chunk {i + 1}/{total_chunks}: extracted {len(concepts)} concepts, "
+                        f"{len(unique_concepts)} unique (after dedup)"
+                    )
+                    yield (i, total_chunks, unique_concepts, False)
 
-            except Exception as e:
-                logger.error(f"Error extracting from chunk {i + 1}/{total_chunks}: {e}")
-                # Yield empty list for this chunk but continue with others
-                yield (i, total_chunks, [], False)
+                except Exception as e:
+                    logger.error(
+                        f"Error extracting from chunk {i + 1}/{total_chunks}: {e}"
+                    )
+                    # Yield empty list for this chunk but continue with others
+                    yield (i, total_chunks, [], False)
+        finally:
+            # The caller stopped early (e.g. cancellation) or we are done
+            self._cancel_chunk_tasks(pending)
 
     async def extract_relationships_for_concepts(
         self,
         text: str,
         all_concepts: list[ExtractedConcept],
+        pre_chunked: list[str] | None = None,
     ) -> list[ExtractedRelationship]:
         """
         Extract relationships between concepts from text.
@@ -384,8 +485,9 @@ class ConceptExtractor:
         This should be called after all concepts have been extracted and stored.
 
         Args:
-            text: Original text to extract relationships from
+            text: Original text to extract relationships from (ignored if pre_chunked is provided)
             all_concepts: All concepts that have been extracted
+            pre_chunked: Optional pre-chunked content list to avoid redundant chunking
 
         Returns:
             List of extracted relationships
@@ -394,30 +496,33 @@ class ConceptExtractor:
             logger.info("Fewer than 2 concepts, skipping relationship extraction")
             return []
 
-        chunks = self.chunk_content(text)
+        # Use pre-chunked content if provided, otherwise chunk the text
+        chunks = pre_chunked if pre_chunked is not None else self.chunk_content(text)
         total_chunks = len(chunks)
         logger.info(f"Extracting relationships from {total_chunks} chunks")
 
         all_relationships: list[ExtractedRelationship] = []
         relationship_keys_seen: set[str] = set()
 
-        for i, chunk in enumerate(chunks):
-            logger.info(f"Extracting relationships from chunk {i + 1}/{total_chunks}")
-            try:
-                relationships = await self.extract_relationships(chunk, all_concepts)
-
-                # Deduplicate relationships
-                for rel in relationships:
-                    key = f"{rel.source}|{rel.target}|{rel.type}"
-                    if key not in relationship_keys_seen:
-                        relationship_keys_seen.add(key)
-                        all_relationships.append(rel)
+        results = await asyncio.gather(
+            *(self.extract_relationships(chunk, all_concepts) for chunk in chunks),
+            return_exceptions=True,
+        )
 
-            except Exception as e:
+        for i, relationships in enumerate(results):
+            if isinstance(relationships, Exception):
                 logger.error(
-                    f"Error extracting relationships from chunk {i + 1}/{total_chunks}: {e}"
+                    f"Error extracting relationships from chunk {i + 1}/{total_chunks}: {relationships}"
                 )
                 # Continue with other chunks
+                continue
+
+            # Deduplicate relationships
+            for rel in relationships:
+                key = f"{rel.source}|{rel.target}|{rel.type}"
+                if key not in relationship_keys_seen:
+                    relationship_keys_seen.add(key)
+                    all_relationships.append(rel)
 
         logger.info(
             f"Relationship extraction complete: {len(all_relationships)} relationships"
@@ -431,6 +536,7 @@ class ConceptExtractor:
         skip_chunks: set[int] | None = None,
         known_relationship_keys: set[str] | None = None,
         pre_chunked: list[str] | None = None,
+        use_cache: bool = True,
     ):
         """
         Extract relationships chunk by chunk, yielding after each chunk.
@@ -444,6 +550,7 @@ class ConceptExtractor:
             skip_chunks: Set of chunk indices to skip (for resuming)
             known_relationship_keys: Set of relationship keys already extracted (for dedup)
             pre_chunked: Optional pre-chunked content list to avoid redundant chunking
+            use_cache: Whether cached LLM responses may be reused
 
         Yields:
             Tuple of (chunk_index, total_chunks, relationships, was_skipped) after each chunk
@@ -466,38 +573,81 @@ class ConceptExtractor:
         # Initialize with known relationship keys to avoid duplicates
         relationship_keys_seen: set[str] = set(known_relationship_keys or set())
 
-        for i, chunk in enumerate(chunks):
-            if i in skip_chunks:
+        # Start every chunk up front, then yield them in order as each finishes
+        pending = self._start_chunk_tasks(
+            chunks,
+            skip_chunks,
+            lambda chunk: self.extract_relationships(chunk, all_concepts, use_cache),
+        )
+        try:
+            for i in range(total_chunks):
+                if i in skip_chunks:
+                    logger.info(
+                        f"Relationship chunk {i + 1}/{total_chunks}: SKIPPED (already extracted)"
+                    )
+                    yield (i, total_chunks, [], True)
+                    continue
+
                 logger.info(
-                    f"Relationship chunk {i + 1}/{total_chunks}: SKIPPED (already extracted)"
+                    f"Extracting relationships from chunk {i + 1}/{total_chunks}"
                 )
-                yield (i, total_chunks, [], True)
-                continue
+                try:
+                    relationships = await pending[i]
+
+                    # Deduplicate relationships
+                    unique_relationships: list[ExtractedRelationship] = []
+                    for rel in relationships:
+                        key = f"{rel.source}|{rel.target}|{rel.type}"
+                        if key not in relationship_keys_seen:
+                            relationship_keys_seen.add(key)
+                            unique_relationships.append(rel)
+
+                    logger.info(
+                        f"Relationship chunk {i + 1}/{total_chunks}: extracted {len(relationships)} relationships, "
+                        f"{len(unique_relationships)} unique (after dedup)"
+                    )
+                    yield (i, total_chunks, unique_relationships, False)
 
-            logger.info(f"Extracting relationships from chunk {i + 1}/{total_chunks}")
-            try:
-                relationships = await self.extract_relationships(chunk, all_concepts)
+                except Exception as e:
+                    logger.error(
+                        f"Error extracting relationships from chunk {i + 1}/{total_chunks}: {e}"
+                    )
+                    # Yield empty list for this chunk but continue with others
+                    yield (i, total_chunks, [], False)
+        finally:
+            # The caller stopped early (e.g. cancellation) or we are done
+            self._cancel_chunk_tasks(pending)
 
-                # Deduplicate relationships
-                unique_relationships: list[ExtractedRelationship] = []
-                for rel in relationships:
-                    key = f"{rel.source}|{rel.target}|{rel.type}"
-                    if key not in relationship_keys_seen:
-                        relationship_keys_seen.add(key)
-                        unique_relationships.append(rel)
+    def _start_chunk_tasks(
+        self,
+        chunks: list[str],
+        skip_chunks: set[int],
+        extract: Callable[[str], Awaitable[list]],
+    ) -> dict[int, asyncio.Task]:
+        """
+        Start extraction of every chunk that isn't skipped.
 
-                logger.info(
-                    f"Relationship chunk {i + 1}/{total_chunks}: extracted {len(relationships)} relationships, "
-                    f"{len(unique_relationships)} unique (after dedup)"
-                )
-                yield (i, total_chunks, unique_relationships, False)
+        The semaphore in _complete bounds how many LLM calls actually run at
+        once; responses served from the LLM cache never take it.
 
-            except Exception as e:
-                logger.error(
-                    f"Error extracting relationships from chunk {i + 1}/{total_chunks}: {e}"
-                )
-                # Yield empty list for this chunk but continue with others
-                yield (i, total_chunks, [], False)
+        Args:
+            chunks: Text chunks to extract from
+            skip_chunks: Chunk indices that were already extracted
+            extract: Coroutine function extracting from one chunk
+
+        Returns:
+            Mapping of chunk index to its extraction task
+        """
+        return {
+            i: asyncio.ensure_future(extract(chunk))
+            for i, chunk in enumerate(chunks)
+            if i not in skip_chunks
+        }
+
+    def _cancel_chunk_tasks(self, pending: dict[int, asyncio.Task]) -> None:
+        """Cancel chunk extractions that haven't finished."""
+        for task in pending.values():
+            task.cancel()
 
     async def extract_from_text(
         self,
@@ -527,11 +677,15 @@ class ConceptExtractor:
         all_concepts: list[ExtractedConcept] = []
         concept_names_seen: set[str] = set()
 
-        # Pass 1: Extract concepts from each chunk
-        for i, chunk in enumerate(chunks):
-            logger.debug(f"Extracting concepts from chunk {i + 1}/{len(chunks)}")
-            concepts = await self.extract_concepts(chunk, book_title, section_title)
+        # Pass 1: Extract concepts from all chunks concurrently
+        results = await asyncio.gather(
+            *(
+                self.extract_concepts(chunk, book_title, section_title)
+                for chunk in chunks
+            )
+        )
 
+        for concepts in results:
             # Deduplicate by name within this extraction
             for concept in concepts:
                 name_lower = concept.name.lower()
@@ -541,7 +695,7 @@ class ConceptExtractor:
 
         # Pass 2: Extract relationships (using all concepts for context)
         all_relationships = await self.extract_relationships_for_concepts(
-            text, all_concepts
+            text, all_concepts, pre_chunked=chunks
         )
 
         logger.info(
@@ -620,15 +774,7 @@ class ConceptExtractor:
                     # Handle common LLM variations: "Explains" -> "explains",
                     # "builds_on" -> "builds-on"
                     rel_type = rel_type.lower().replace("_", "-")
-                    valid_types = [
-                        "explains",
-                        "contrasts",
-                        "requires",
-                        "builds-on",
-                        "examples",
-                        "causes",
-                    ]
-                    if rel_type not in valid_types:
+                    if rel_type not in self._RELATIONSHIP_TYPES:
                         logger.debug(
                             f"Unknown relationship type '{rel_type}', "
                             "falling back to 'related-to'"
@@ -680,5 +826,7 @@ def get_concept_extractor() -> ConceptExtractor:
         with _singleton_lock:
             # Double-check after acquiring lock
             if _concept_extractor is None:
-                _concept_extractor = ConceptExtractor()
+                _concept_extractor = ConceptExtractor(
+                    llm_cache=LLMCache() if LLM_CACHE_ENABLED else None
+                )
     return _concept_extractor
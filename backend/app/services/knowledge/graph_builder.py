@@ -239,6 +239,8 @@ class GraphBuilder:
                 skip_chunks=skip_chunks,
                 known_concept_names=known_concept_names,
                 pre_chunked=chunks,
+                # A forced re-extraction asks the LLM again
+                use_cache=not force,
             ):
                 total_chunks = total
                 chunks_processed = chunk_idx + 1
@@ -407,8 +409,8 @@ class GraphBuilder:
                             f"Loaded {len(known_rel_keys)} existing relationship keys for deduplication"
                         )
 
-                # Pre-compute relationship chunks
-                rel_chunks = self.concept_extractor.chunk_content(content)
+                # Relationships use the same chunks as the concept pass
+                rel_chunks = chunks
                 rel_total_chunks = len(rel_chunks)
 
                 # Initialize relationship progress
@@ -429,6 +431,7 @@ class GraphBuilder:
                         skip_chunks=skip_rel_chunks,
                         known_relationship_keys=known_rel_keys,
                         pre_chunked=rel_chunks,
+                        use_cache=not force,
                     ):
                         rel_total_chunks = rel_total
                         rel_chunks_processed = rel_chunk_idx + 1
@@ -1090,6 +1093,7 @@ class GraphBuilder:
                 skip_chunks=skip_rel_chunks,
                 known_relationship_keys=known_rel_keys,
                 pre_chunked=rel_chunks,
+                use_cache=not force,
             ):
                 rel_total_chunks = rel_total
                 rel_chunks_processed = rel_chunk_idx + 1
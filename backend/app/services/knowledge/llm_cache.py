@@ -0,0 +1,138 @@
+"""
+LLM Response Cache Module
+
+This module stores raw LLM responses in knowledge.db, keyed by a hash of the
+request (model, messages and temperature). Re-extracting a section whose text
+hasn't changed then reuses the earlier answers instead of calling the LLM
+again for every chunk.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Cached responses older than this are ignored and purged on startup
+LLM_CACHE_TTL_DAYS = 7
+
+
+class LLMCache:
+    """
+    SQLite-backed cache of LLM responses.
+
+    Lookups and stores run in a worker thread so they don't block the event
+    loop between LLM calls.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "data/knowledge.db",
+        ttl_days: int = LLM_CACHE_TTL_DAYS,
+    ):
+        """
+        Initialize the LLM response cache.
+
+        Args:
+            db_path: Path to the SQLite database file
+            ttl_days: Number of days a cached response stays valid
+        """
+        self.db_path = db_path
+        self._max_age = f"-{ttl_days} days"
+        self._ensure_data_dir()
+        self._init_table()
+
+    def _ensure_data_dir(self) -> None:
+        """Ensure the data directory exists for the database file."""
+        data_dir = os.path.dirname(self.db_path)
+        if data_dir:
+            os.makedirs(data_dir, exist_ok=True)
+
+    def _init_table(self) -> None:
+        """Create the cache table and drop expired responses."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_response_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    response TEXT NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            deleted = conn.execute(
+                "DELETE FROM llm_response_cache WHERE created_at < datetime('now', ?)",
+                (self._max_age,),
+            ).rowcount
+            conn.commit()
+        if deleted:
+            logger.info(f"Purged {deleted} expired LLM responses from the cache")
+
+    @staticmethod
+    def make_key(model: str, messages: list[dict[str, Any]], temperature: float) -> str:
+        """
+        Build the cache key for an LLM request.
+
+        Args:
+            model: Model name
+            messages: Chat messages sent to the model
+            temperature: Sampling temperature
+
+        Returns:
+            SHA-256 hex digest identifying the request
+        """
+        request = json.dumps([model, messages, temperature], sort_keys=True)
+        return hashlib.sha256(request.encode()).hexdigest()
+
+    async def get(self, key: str) -> str | None:
+        """
+        Get a cached response.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            The cached response, or None if missing, expired or unreadable
+        """
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, response: str) -> None:
+        """
+        Store a response, replacing any older one for the same request.
+
+        Args:
+            key: Cache key from make_key()
+            response: Raw response content from the LLM
+        """
+        await asyncio.to_thread(self._set, key, response)
+
+    def _get(self, key: str) -> str | None:
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                row = conn.execute(
+                    """
+                    SELECT response FROM llm_response_cache
+                    WHERE cache_key = ? AND created_at >= datetime('now', ?)
+                    """,
+                    (key, self._max_age),
+                ).fetchone()
+            return row[0] if row else None
+        except Exception as e:
+            logger.warning(f"Error reading LLM response cache: {e}")
+            return None
+
+    def _set(self, key: str, response: str) -> None:
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO llm_response_cache (cache_key, response)
+                    VALUES (?, ?)
+                    """,
+                    (key, response),
+                )
+                conn.commit()
+        except Exception as e:
+            logger.warning(f"Error writing LLM response cache: {e}")
@@ -28,7 +28,6 @@ logging.basicConfig(
 )
 
 logger = logging.getLogger(__name__)
-
 app = FastAPI(title="PDF AI Reader API", version="1.0.0")
 
 
@@ -0,0 +1,63 @@
+"""
+Shared pytest fixtures.
+"""
+
+import io
+import zipfile
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+CONTAINER_XML = """<?xml version="1.0"?>
+<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
+  <rootfiles>
+    <rootfile full-path="OEBPS/content.opf"
+              media-type="application/oebps-package+xml"/>
+  </rootfiles>
+</container>"""
+
+CONTENT_OPF = """<?xml version="1.0" encoding="utf-8"?>
+<package xmlns="http://www.idpf.org/2007/opf" version="2.0" unique-identifier="id">
+  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
+    <dc:title>Test Book</dc:title>
+    <dc:creator>Jane Doe</dc:creator>
+    <dc:identifier id="id">test-book</dc:identifier>
+    <dc:language>en</dc:language>
+    <meta name="cover" content="cover-img"/>
+  </metadata>
+  <manifest>
+    <item id="cover-img" href="images/cover.png" media-type="image/png"/>
+    <item id="ch1" href="ch1.xhtml" media-type="application/xhtml+xml"/>
+  </manifest>
+  <spine>
+    <itemref idref="ch1"/>
+  </spine>
+</package>"""
+
+CHAPTER_XHTML = """<html xmlns="http://www.w3.org/1999/xhtml">
+<head><title>Chapter 1</title></head>
+<body><p>Hello</p></body>
+</html>"""
+
+
+def _write_epub(
+    path: Path, cover_size=(600, 900), cover_mode="RGB", opf=CONTENT_OPF
+) -> Path:
+    """Write a minimal EPUB with a PNG cover referenced from the OPF"""
+    cover = io.BytesIO()
+    Image.new(cover_mode, cover_size, "red").save(cover, "PNG")
+
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("mimetype", "application/epub+zip")
+        zf.writestr("META-INF/container.xml", CONTAINER_XML)
+        zf.writestr("OEBPS/content.opf", opf)
+        zf.writestr("OEBPS/images/cover.png", cover.getvalue())
+        zf.writestr("OEBPS/ch1.xhtml", CHAPTER_XHTML)
+    return path
+
+
+@pytest.fixture
+def make_epub():
+    """Factory fixture that writes a minimal EPUB file and returns its path"""
+    return _write_epub
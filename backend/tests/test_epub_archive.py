@@ -0,0 +1,178 @@
+"""
+Unit tests for the cached EPUB archive access.
+
+Tests cover:
+- OPF discovery through META-INF/container.xml
+- Manifest href resolution
+- Cache hits, mtime invalidation and eviction
+- Metadata read straight from the OPF, with an ebooklib fallback
+"""
+
+import os
+import tempfile
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+import ebooklib
+import pytest
+from ebooklib import epub
+
+from app.services.epub import epub_archive
+from app.services.epub.epub_archive import (
+    OPF_NS,
+    EPUBArchive,
+    OPFMetadata,
+    clear_archive_cache,
+    open_epub_archive,
+    read_epub_metadata,
+    read_opf_metadata,
+)
+
+
+@pytest.fixture
+def epub_dir():
+    with tempfile.TemporaryDirectory() as tmp:
+        yield Path(tmp)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_archive_cache()
+    yield
+    clear_archive_cache()
+
+
+class TestEPUBArchive:
+    """Test opening and parsing a single archive"""
+
+    def test_parses_opf_from_container(self, epub_dir, make_epub):
+        """Test that the OPF declared in container.xml is parsed"""
+        archive = EPUBArchive(make_epub(epub_dir / "book.epub"))
+
+        assert archive.opf_path == "OEBPS/content.opf"
+        assert archive.opf_dir == "OEBPS"
+        assert archive.opf_root.tag == f"{{{OPF_NS}}}package"
+
+    def test_resolve_href_is_relative_to_opf(self, epub_dir, make_epub):
+        """Test that manifest hrefs resolve against the OPF directory"""
+        archive = EPUBArchive(make_epub(epub_dir / "book.epub"))
+
+        assert archive.resolve_href("images/cover.png") == "OEBPS/images/cover.png"
+        assert archive.zip_file.getinfo(archive.resolve_href("images/cover.png"))
+
+    def test_missing_container_raises(self, epub_dir):
+        """Test that archives without container.xml are rejected"""
+        path = epub_dir / "broken.epub"
+        with zipfile.ZipFile(path, "w") as zf:
+            zf.writestr("mimetype", "application/epub+zip")
+
+        with pytest.raises(KeyError):
+            EPUBArchive(path)
+
+
+class TestOpenEpubArchive:
+    """Test the shared archive cache"""
+
+    def test_repeated_opens_share_archive(self, epub_dir, make_epub):
+        """Test that the same file version is opened and parsed once"""
+        path = make_epub(epub_dir / "book.epub")
+
+        assert open_epub_archive(path) is open_epub_archive(path)
+
+    def test_modified_file_is_reopened(self, epub_dir, make_epub):
+        """Test that a new mtime produces a fresh archive"""
+        path = make_epub(epub_dir / "book.epub")
+        first = open_epub_archive(path)
+
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert open_epub_archive(path) is not first
+
+    def test_least_recently_used_entries_are_evicted(self, epub_dir, make_epub):
+        """Test that the cache stays bounded"""
+        paths = [make_epub(epub_dir / f"book{i}.epub") for i in range(3)]
+
+        with patch.object(epub_archive, "ARCHIVE_CACHE_SIZE", 2):
+            first = open_epub_archive(paths[0])
+            open_epub_archive(paths[1])
+            open_epub_archive(paths[2])
+
+            assert len(epub_archive._archive_cache) == 2
+            assert open_epub_archive(paths[0]) is not first
+
+
+class TestReadOPFMetadata:
+    """Test metadata read from the OPF without loading the book"""
+
+    def test_matches_ebooklib(self, epub_dir, make_epub):
+        """Test that DC values and document count agree with epub.read_epub"""
+        path = make_epub(epub_dir / "book.epub")
+        book = epub.read_epub(str(path))
+
+        metadata = read_opf_metadata(path)
+
+        for field in ("title", "creator", "language"):
+            assert [value for value, _ in metadata.get_metadata("DC", field)] == [
+                value for value, _ in book.get_metadata("DC", field)
+            ]
+        assert metadata.document_count == sum(
+            1 for _ in book.get_items_of_type(ebooklib.ITEM_DOCUMENT)
+        )
+
+    def test_missing_fields_and_other_namespaces_are_empty(self, epub_dir, make_epub):
+        """Test that absent metadata returns an empty list like ebooklib"""
+        metadata = read_opf_metadata(make_epub(epub_dir / "book.epub"))
+
+        assert metadata.get_metadata("DC", "publisher") == []
+        assert metadata.get_metadata("OPF", "cover") == []
+
+    def test_does_not_populate_archive_cache(self, epub_dir, make_epub):
+        """Test that a metadata scan leaves the shared archive cache alone"""
+        read_opf_metadata(make_epub(epub_dir / "book.epub"))
+
+        assert len(epub_archive._archive_cache) == 0
+
+    def test_shared_read_reuses_cached_archive(self, epub_dir, make_epub):
+        """Test that shared reads go through the archive cache and parse once"""
+        path = make_epub(epub_dir / "book.epub")
+
+        metadata = read_opf_metadata(path, shared=True)
+
+        assert open_epub_archive(path).metadata is metadata
+        assert read_opf_metadata(path, shared=True) is metadata
+        assert len(epub_archive._archive_cache) == 1
+
+
+class TestReadEPUBMetadata:
+    """Test the metadata source used for listings and detail views"""
+
+    def test_uses_opf_when_readable(self, epub_dir, make_epub):
+        """Test that a well-formed EPUB is answered from the OPF alone"""
+        path = make_epub(epub_dir / "book.epub")
+
+        with patch.object(epub_archive.epub, "read_epub") as mock_read:
+            source, chapter_count = read_epub_metadata(path)
+
+        mock_read.assert_not_called()
+        assert isinstance(source, OPFMetadata)
+        assert chapter_count == source.document_count
+
+    def test_falls_back_to_ebooklib(self, epub_dir, make_epub):
+        """Test that an unparseable OPF falls back to a full ebooklib load"""
+        path = make_epub(epub_dir / "book.epub")
+        book = epub.read_epub(str(path))
+
+        with (
+            patch.object(
+                epub_archive, "read_opf_metadata", side_effect=ValueError("bad")
+            ),
+            patch.object(epub_archive.epub, "read_epub", return_value=book),
+        ):
+            source, chapter_count = read_epub_metadata(path)
+
+        assert source is book
+        assert chapter_count == sum(
+            1 for _ in book.get_items_of_type(ebooklib.ITEM_DOCUMENT)
+        )
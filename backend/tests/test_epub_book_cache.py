@@ -0,0 +1,100 @@
+"""
+Unit tests for the parsed EPUB book cache.
+
+Tests cover:
+- Reuse of parsed books for unchanged files
+- Invalidation when the file's mtime changes
+- Binary resources read on demand, only from the file version parsed
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+from ebooklib import epub
+
+from app.services.epub.epub_book_cache import clear_book_cache, read_epub_cached
+
+
+@pytest.fixture
+def epub_dir():
+    with tempfile.TemporaryDirectory() as tmp:
+        yield Path(tmp)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_book_cache()
+    yield
+    clear_book_cache()
+
+
+class TestReadEpubCached:
+    """Test read_epub_cached"""
+
+    def test_unchanged_file_returns_same_book(self, epub_dir, make_epub):
+        """Test that an unchanged file is only parsed once"""
+        path = make_epub(epub_dir / "book.epub")
+
+        first = read_epub_cached(path)
+        second = read_epub_cached(path)
+
+        assert first is second
+        assert first.get_metadata("DC", "title")[0][0] == "Test Book"
+
+    def test_modified_file_is_reparsed(self, epub_dir, make_epub):
+        """Test that bumping the mtime invalidates the cached book"""
+        path = make_epub(epub_dir / "book.epub")
+        first = read_epub_cached(path)
+
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert read_epub_cached(path) is not first
+
+    def test_missing_file_raises(self, epub_dir):
+        """Test that a missing file surfaces FileNotFoundError"""
+        with pytest.raises(FileNotFoundError):
+            read_epub_cached(epub_dir / "missing.epub")
+
+    def test_binary_items_are_read_on_demand(self, epub_dir, make_epub):
+        """Test that images are left in the ZIP until their content is requested"""
+        path = make_epub(epub_dir / "book.epub")
+        expected = epub.read_epub(str(path))
+
+        book = read_epub_cached(path)
+
+        cover = book.get_item_with_id("cover-img")
+        assert cover.content == b""
+        assert (
+            cover.get_content() == expected.get_item_with_id("cover-img").get_content()
+        )
+        chapter = book.get_item_with_id("ch1")
+        assert chapter.content == expected.get_item_with_id("ch1").content
+
+    def test_resized_file_with_same_mtime_is_reparsed(self, epub_dir, make_epub):
+        """Test that a replacement keeping the old mtime still invalidates the book"""
+        path = make_epub(epub_dir / "book.epub")
+        stat = path.stat()
+        first = read_epub_cached(path)
+
+        make_epub(path, (600, 840))
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert path.stat().st_size != stat.st_size
+        assert read_epub_cached(path) is not first
+
+    def test_deferred_read_refuses_replaced_file(self, epub_dir, make_epub):
+        """Test that a cached book doesn't read images from a newer file"""
+        path = make_epub(epub_dir / "book.epub")
+        stat = path.stat()
+        book = read_epub_cached(path)
+
+        make_epub(path, (600, 840))
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        with pytest.raises(FileNotFoundError):
+            book.get_item_with_id("cover-img").get_content()
+        new_cover = read_epub_cached(path).get_item_with_id("cover-img")
+        assert new_cover.get_content()
@@ -0,0 +1,198 @@
+"""
+Unit tests for the per-book item index.
+
+Tests cover:
+- Id and name lookups matching ebooklib
+- Document lookup by href, including suffix matches
+- Spine documents in reading order and spine positions by id
+- Bucketed spine candidates for navigation hrefs
+- Image path resolution matching an in-order scan
+- One shared index per book
+"""
+
+import tempfile
+from pathlib import Path
+from unittest.mock import Mock
+
+import ebooklib
+import pytest
+from ebooklib import epub
+
+from app.services.epub.epub_book_index import (
+    EPUBBookIndex,
+    ImageNameIndex,
+    get_book_index,
+)
+
+
+@pytest.fixture
+def book(make_epub):
+    with tempfile.TemporaryDirectory() as tmp:
+        yield epub.read_epub(str(make_epub(Path(tmp) / "book.epub")))
+
+
+class TestEPUBBookIndex:
+    """Test lookups on a parsed book"""
+
+    def test_id_lookup_matches_ebooklib(self, book):
+        """Test that every item id resolves to the same item as ebooklib"""
+        index = get_book_index(book)
+
+        for item in book.get_items():
+            assert index.get_item_with_id(item.get_id()) is book.get_item_with_id(
+                item.get_id()
+            )
+        assert index.get_item_with_id("missing") is None
+
+    def test_name_lookup(self, book):
+        """Test exact file name lookups"""
+        index = get_book_index(book)
+
+        assert index.get_item_with_name("images/cover.png").get_id() == "cover-img"
+        assert index.get_item_with_name("cover.png") is None
+
+    def test_find_document_by_href(self, book):
+        """Test exact, path-suffix and partial-basename href matches"""
+        index = get_book_index(book)
+
+        assert index.find_document_by_href("ch1.xhtml").get_id() == "ch1"
+        assert index.find_document_by_href("1.xhtml").get_id() == "ch1"
+        assert index.find_document_by_href("missing.xhtml") is None
+        assert index.find_document_by_href("") is None
+
+    def test_images_are_not_documents(self, book):
+        """Test that href lookups only return document items"""
+        assert get_book_index(book).find_document_by_href("images/cover.png") is None
+
+    def test_spine_documents(self, book):
+        """Test that spine documents keep their positions and skip non-documents"""
+        expected = [
+            (position, book.get_item_with_id(item_id).get_name())
+            for position, (item_id, _) in enumerate(book.spine)
+            if book.get_item_with_id(item_id) is not None
+        ]
+
+        assert get_book_index(book).spine_documents == expected
+        assert expected
+
+    def test_spine_positions_by_id(self, book):
+        """Test that item ids map to sorted spine positions"""
+        index = get_book_index(book)
+        ids = [item_id for item_id, _ in book.spine]
+
+        assert index.get_spine_positions(reversed(ids)) == list(range(len(ids)))
+        assert index.get_spine_positions(["missing"]) == []
+
+    def test_index_is_shared_per_book(self, book):
+        """Test that the index is built once and reused"""
+        assert get_book_index(book) is get_book_index(book)
+
+
+class TestSpineCandidates:
+    """Test the bucketed spine lookup used for navigation hrefs"""
+
+    NAMES = [
+        "Text/ch1.xhtml",
+        "Text/ch10.xhtml",
+        "Text/xch1.xhtml",
+        "Text/ch1.html",
+        "Text/a.xhtml",
+        "Text/chapter_one",
+        "nav.xhtml",
+    ]
+
+    def _book(self, names):
+        items = []
+        for i, name in enumerate(names):
+            item = Mock()
+            item.get_id.return_value = f"id{i}"
+            item.get_name.return_value = name
+            item.get_type.return_value = ebooklib.ITEM_DOCUMENT
+            items.append(item)
+        return Mock(
+            get_items=Mock(return_value=items),
+            spine=[(f"id{i}", "yes") for i in range(len(names))],
+        )
+
+    @staticmethod
+    def _matches(name, href):
+        stem, href_stem = name.rsplit(".", 1)[0], href.rsplit(".", 1)[0]
+        return (
+            name.endswith(href)
+            or href.endswith(name)
+            or stem.endswith(href_stem)
+            or href_stem.endswith(stem)
+        )
+
+    @pytest.mark.parametrize(
+        "href",
+        ["ch1.xhtml", "Text/ch1.html", "1.xhtml", "ch10", "a.xhtml", "chapter_one", ""],
+    )
+    def test_candidates_cover_every_suffix_match(self, href):
+        """Test that bucketing never drops a spine document a full scan matches"""
+        index = EPUBBookIndex(self._book(self.NAMES))
+
+        expected = [
+            (position, name)
+            for position, name in index.spine_documents
+            if self._matches(name, href)
+        ]
+        candidates = index.spine_candidates(href)
+
+        assert [c for c in candidates if self._matches(c[1], href)] == expected
+        assert candidates == sorted(candidates)
+
+    def test_bucket_skips_unrelated_documents(self):
+        """Test that an href with an extension only checks its own bucket"""
+        index = EPUBBookIndex(self._book(self.NAMES))
+
+        names = {name for _, name in index.spine_candidates("Text/ch10.xhtml")}
+
+        assert "Text/ch1.xhtml" not in names
+        assert "Text/ch10.xhtml" in names
+        assert "Text/chapter_one" in names  # No extension, always checked
+
+
+class TestImageNameIndex:
+    """Test image path resolution against an in-order scan"""
+
+    NAMES = [
+        "/images/cover.png",
+        "images/a/fig.png",
+        "images/b/fig.png",
+        "OEBPS/images/over.png",
+        "images/cover.png",
+        "plate.jpg",
+    ]
+
+    @staticmethod
+    def _scan(names, image_path, normalized_path):
+        for name in names:
+            if (
+                name.lstrip("/\\") in (image_path, normalized_path)
+                or name.endswith(image_path)
+                or name.endswith(normalized_path)
+            ):
+                return name
+        target = normalized_path.split("/")[-1]
+        return next((n for n in names if n.split("/")[-1] == target), None)
+
+    @pytest.mark.parametrize(
+        "image_path, normalized_path",
+        [
+            ("images/cover.png", "images/cover.png"),
+            ("over.png", "over.png"),
+            ("b/fig.png", "b/fig.png"),
+            ("../x/fig.png", "x/fig.png"),
+            ("plate.jpg", "plate.jpg"),
+            ("ate.jpg", "ate.jpg"),
+            ("missing.png", "missing.png"),
+        ],
+    )
+    def test_matches_in_order_scan(self, image_path, normalized_path):
+        """Test that lookups agree with scanning the names in manifest order"""
+        index = ImageNameIndex(self.NAMES)
+
+        assert index.match(image_path, normalized_path) == self._scan(
+            self.NAMES, image_path, normalized_path
+        )
@@ -12,8 +12,10 @@ Tests cover:
 - Integration with EPUBDocumentsService
 """
 
+import os
 import sqlite3
 import tempfile
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -75,6 +77,9 @@ def mock_epub_service():
     """Create mock EPUBService"""
     service = Mock()
     service.generate_thumbnail = Mock(return_value=Path("thumbnails/test.jpg"))
+    service.generate_thumbnails_bulk = Mock(
+        side_effect=lambda filenames: [Path("thumbnails/test.jpg")] * len(filenames)
+    )
     return service
 
 
@@ -91,7 +96,7 @@ class TestCacheInitialization:
 
     def test_init_creates_db_service(self, temp_dirs, temp_db, mock_epub_service):
         """Test that cache initializes EPUBDocumentsService"""
-        with patch("app.services.epub_cache.epub.read_epub"):
+        with patch("app.services.epub.epub_archive.epub.read_epub"):
             cache = EPUBCache(
                 epub_dir=temp_dirs["epub_dir"],
                 thumbnails_dir=temp_dirs["thumb_dir"],
@@ -105,7 +110,7 @@ class TestCacheInitialization:
 
     def test_init_with_empty_directory(self, temp_dirs, temp_db, mock_epub_service):
         """Test initialization with empty EPUB directory"""
-        with patch("app.services.epub_cache.epub.read_epub"):
+        with patch("app.services.epub.epub_archive.epub.read_epub"):
             cache = EPUBCache(
                 epub_dir=temp_dirs["epub_dir"],
                 thumbnails_dir=temp_dirs["thumb_dir"],
@@ -125,7 +130,7 @@ class TestCacheInitialization:
         epub_file.touch()
 
         with patch(
-            "app.services.epub_cache.epub.read_epub", return_value=mock_epub_book
+            "app.services.epub.epub_archive.epub.read_epub", return_value=mock_epub_book
         ):
             with patch(
                 "app.services.epub_cache.EPUBCache._extract_metadata_values"
@@ -165,7 +170,7 @@ class TestBuildCache:
         mock_epub_book.get_items_of_type = Mock(return_value=[])
 
         with patch(
-            "app.services.epub_cache.epub.read_epub", return_value=mock_epub_book
+            "app.services.epub.epub_archive.epub.read_epub", return_value=mock_epub_book
         ):
             cache = EPUBCache(
                 epub_dir=temp_dirs["epub_dir"],
@@ -182,6 +187,72 @@ class TestBuildCache:
         assert doc is not None
         assert doc["filename"] == "book.epub"
 
+    def test_build_cache_skips_non_epub_entries(
+        self, temp_dirs, temp_db, mock_epub_service, mock_epub_book
+    ):
+        """Test that only regular .epub files are picked up by the scan"""
+        (temp_dirs["epub_dir"] / "book.epub").write_bytes(b"mock epub content")
+        (temp_dirs["epub_dir"] / "notes.txt").write_text("not an epub")
+        (temp_dirs["epub_dir"] / "folder.epub").mkdir()
+
+        with patch(
+            "app.services.epub.epub_archive.epub.read_epub", return_value=mock_epub_book
+        ):
+            cache = EPUBCache(
+                epub_dir=temp_dirs["epub_dir"],
+                thumbnails_dir=temp_dirs["thumb_dir"],
+                epub_service=mock_epub_service,
+                db_path=temp_db,
+            )
+
+        assert list(cache._cache) == ["book.epub"]
+        assert cache._cache["book.epub"].file_size == len(b"mock epub content")
+
+    def test_build_cache_reads_metadata_from_opf(
+        self, temp_dirs, temp_db, mock_epub_service, make_epub
+    ):
+        """Test that valid EPUBs are indexed without a full epub.read_epub"""
+        make_epub(temp_dirs["epub_dir"] / "book.epub")
+
+        with patch("app.services.epub.epub_archive.epub.read_epub") as mock_read:
+            cache = EPUBCache(
+                epub_dir=temp_dirs["epub_dir"],
+                thumbnails_dir=temp_dirs["thumb_dir"],
+                epub_service=mock_epub_service,
+                db_path=temp_db,
+            )
+
+        mock_read.assert_not_called()
+        info = cache._cache["book.epub"]
+        assert info.title == "Test Book"
+        assert info.author == "Jane Doe"
+        assert info.language == "en"
+        assert info.chapters == 1
+
+    def test_build_cache_extracts_new_epubs_in_parallel(
+        self, temp_dirs, temp_db, mock_epub_service, make_epub
+    ):
+        """Test that a batch of new EPUBs, one unreadable, is fully indexed"""
+        for i in range(5):
+            make_epub(temp_dirs["epub_dir"] / f"book{i}.epub")
+        (temp_dirs["epub_dir"] / "broken.epub").write_bytes(b"not a zip")
+
+        cache = EPUBCache(
+            epub_dir=temp_dirs["epub_dir"],
+            thumbnails_dir=temp_dirs["thumb_dir"],
+            epub_service=mock_epub_service,
+            db_path=temp_db,
+        )
+
+        assert len(cache._cache) == 6
+        assert cache._cache["broken.epub"].error is not None
+        assert cache._db_service.get_by_filename("broken.epub") is None
+        thumbnailed = mock_epub_service.generate_thumbnails_bulk.call_args[0][0]
+        assert sorted(thumbnailed) == [f"book{i}.epub" for i in range(5)]
+        for i in range(5):
+            doc = cache._db_service.get_by_filename(f"book{i}.epub")
+            assert doc["title"] == "Test Book"
+
     def test_build_cache_handles_corrupted_epub(
         self, temp_dirs, temp_db, mock_epub_service
     ):
@@ -192,7 +263,7 @@ class TestBuildCache:
 
         # Mock EPUB reading to raise exception
         with patch(
-            "app.services.epub_cache.epub.read_epub",
+            "app.services.epub.epub_archive.epub.read_epub",
             side_effect=Exception("Invalid EPUB"),
         ):
             cache = EPUBCache(
@@ -218,20 +289,176 @@ class TestBuildCache:
         mock_epub_book.get_items_of_type = Mock(return_value=[])
 
         thumbnail_path = temp_dirs["thumb_dir"] / "with_cover.jpg"
-        mock_epub_service.generate_thumbnail.return_value = thumbnail_path
+        mock_epub_service.generate_thumbnails_bulk.side_effect = None
+        mock_epub_service.generate_thumbnails_bulk.return_value = [thumbnail_path]
+
+        with patch(
+            "app.services.epub.epub_archive.epub.read_epub", return_value=mock_epub_book
+        ):
+            cache = EPUBCache(
+                epub_dir=temp_dirs["epub_dir"],
+                thumbnails_dir=temp_dirs["thumb_dir"],
+                epub_service=mock_epub_service,
+                db_path=temp_db,
+            )
+
+        # Verify thumbnails were generated in one batch and recorded
+        mock_epub_service.generate_thumbnails_bulk.assert_called_once_with(
+            ["with_cover.epub"]
+        )
+        assert cache.get_thumbnail_path("with_cover.epub") == str(thumbnail_path)
+        db_record = cache._db_service.get_by_filename("with_cover.epub")
+        assert db_record["thumbnail_path"] == str(thumbnail_path)
+
+    def test_build_cache_regenerates_missing_thumbnails_for_db_records(
+        self, temp_dirs, temp_db, mock_epub_service
+    ):
+        """Test that DB-backed EPUBs whose thumbnail file is gone are batched too"""
+        epub_file = temp_dirs["epub_dir"] / "known.epub"
+        epub_file.write_bytes(b"test")
+        indexed_at = datetime(2025, 1, 1).timestamp()
+        os.utime(epub_file, (indexed_at, indexed_at))
+        EPUBDocumentsService(temp_db).create_or_update(
+            filename="known.epub",
+            chapters=3,
+            title="Known",
+            author="Someone",
+            file_size=4,
+            thumbnail_path=str(temp_dirs["thumb_dir"] / "deleted.png"),
+            created_date="2025-01-01T00:00:00",
+            modified_date="2025-01-01T00:00:00",
+        )
+
+        with patch("app.services.epub.epub_archive.epub.read_epub") as mock_read:
+            cache = EPUBCache(
+                epub_dir=temp_dirs["epub_dir"],
+                thumbnails_dir=temp_dirs["thumb_dir"],
+                epub_service=mock_epub_service,
+                db_path=temp_db,
+            )
+
+        mock_read.assert_not_called()
+        mock_epub_service.generate_thumbnails_bulk.assert_called_once_with(
+            ["known.epub"]
+        )
+        assert cache.get_thumbnail_path("known.epub") == "thumbnails/test.jpg"
+
+    def test_build_cache_loads_db_records_in_one_query(
+        self, temp_dirs, temp_db, mock_epub_service
+    ):
+        """Test that indexed EPUBs are looked up with a single listing query"""
+        indexed_at = datetime(2025, 1, 1).timestamp()
+        documents = EPUBDocumentsService(temp_db)
+        for i in range(3):
+            epub_file = temp_dirs["epub_dir"] / f"book{i}.epub"
+            epub_file.write_bytes(b"test")
+            os.utime(epub_file, (indexed_at, indexed_at))
+            documents.create_or_update(
+                filename=f"book{i}.epub",
+                chapters=3,
+                title=f"Book {i}",
+                author="Someone",
+                file_size=4,
+                thumbnail_path="",
+                created_date="2025-01-01T00:00:00",
+                modified_date="2025-01-01T00:00:00",
+            )
+
+        with (
+            patch.object(
+                EPUBDocumentsService,
+                "list_all",
+                autospec=True,
+                side_effect=EPUBDocumentsService.list_all,
+            ) as mock_list_all,
+            patch.object(EPUBDocumentsService, "get_by_filename") as mock_get,
+        ):
+            cache = EPUBCache(
+                epub_dir=temp_dirs["epub_dir"],
+                thumbnails_dir=temp_dirs["thumb_dir"],
+                epub_service=mock_epub_service,
+                db_path=temp_db,
+            )
+
+        assert mock_list_all.call_count == 1
+        mock_get.assert_not_called()
+        assert sorted(info.title for info in cache._cache.values()) == [
+            "Book 0",
+            "Book 1",
+            "Book 2",
+        ]
+
+    def test_build_cache_reindexes_changed_db_records(
+        self, temp_dirs, temp_db, mock_epub_service, make_epub
+    ):
+        """Test that a DB record is refreshed when the file on disk changed"""
+        make_epub(temp_dirs["epub_dir"] / "book.epub")
+        EPUBDocumentsService(temp_db).create_or_update(
+            filename="book.epub",
+            chapters=9,
+            title="Old Title",
+            author="Old Author",
+            file_size=1,
+            thumbnail_path="",
+            created_date="2025-01-01T00:00:00",
+            modified_date="2025-01-01T00:00:00",
+        )
+
+        cache = EPUBCache(
+            epub_dir=temp_dirs["epub_dir"],
+            thumbnails_dir=temp_dirs["thumb_dir"],
+            epub_service=mock_epub_service,
+            db_path=temp_db,
+        )
+
+        assert cache._cache["book.epub"].title == "Test Book"
+        assert cache._db_service.get_by_filename("book.epub")["title"] == "Test Book"
+        assert cache._db_service.get_by_filename("book.epub")["chapters"] == 1
+
+    def test_build_cache_survives_thumbnail_failure(
+        self, temp_dirs, temp_db, mock_epub_service, mock_epub_book
+    ):
+        """Test that a failed thumbnail batch leaves empty thumbnail paths"""
+        (temp_dirs["epub_dir"] / "book.epub").write_bytes(b"test")
+        mock_epub_book.get_items_of_type = Mock(return_value=[])
+        mock_epub_service.generate_thumbnails_bulk.side_effect = RuntimeError("boom")
+
+        with patch(
+            "app.services.epub.epub_archive.epub.read_epub", return_value=mock_epub_book
+        ):
+            cache = EPUBCache(
+                epub_dir=temp_dirs["epub_dir"],
+                thumbnails_dir=temp_dirs["thumb_dir"],
+                epub_service=mock_epub_service,
+                db_path=temp_db,
+            )
+
+        assert cache.get_thumbnail_path("book.epub") == ""
+
+    def test_build_cache_skips_failed_thumbnails(
+        self, temp_dirs, temp_db, mock_epub_service, mock_epub_book
+    ):
+        """Test that covers that failed in the batch keep empty thumbnail paths"""
+        for name in ("a.epub", "b.epub"):
+            (temp_dirs["epub_dir"] / name).write_bytes(b"test")
+        mock_epub_book.get_items_of_type = Mock(return_value=[])
+        thumbnail_path = temp_dirs["thumb_dir"] / "a.jpg"
+        mock_epub_service.generate_thumbnails_bulk.side_effect = lambda filenames: [
+            thumbnail_path if name == "a.epub" else None for name in filenames
+        ]
 
         with patch(
-            "app.services.epub_cache.epub.read_epub", return_value=mock_epub_book
+            "app.services.epub.epub_archive.epub.read_epub", return_value=mock_epub_book
         ):
-            _cache = EPUBCache(
+            cache = EPUBCache(
                 epub_dir=temp_dirs["epub_dir"],
                 thumbnails_dir=temp_dirs["thumb_dir"],
                 epub_service=mock_epub_service,
                 db_path=temp_db,
             )
 
-        # Verify thumbnail generation was attempted
-        assert mock_epub_service.generate_thumbnail.called
+        assert cache.get_thumbnail_path("a.epub") == str(thumbnail_path)
+        assert cache.get_thumbnail_path("b.epub") == ""
 
 
 class TestDatabasePersistence:
@@ -251,7 +478,7 @@ class TestDatabasePersistence:
         mock_epub_book.get_items_of_type = Mock(return_value=[Mock()])
 
         with patch(
-            "app.services.epub_cache.epub.read_epub", return_value=mock_epub_book
+            "app.services.epub.epub_archive.epub.read_epub", return_value=mock_epub_book
         ):
             cache = EPUBCache(
                 epub_dir=temp_dirs["epub_dir"],
@@ -277,7 +504,7 @@ class TestDatabasePersistence:
         mock_epub_book.get_items_of_type = Mock(return_value=[])
 
         with patch(
-            "app.services.epub_cache.epub.read_epub", return_value=mock_epub_book
+            "app.services.epub.epub_archive.epub.read_epub", return_value=mock_epub_book
         ):
             with patch.object(
                 EPUBDocumentsService,
@@ -321,7 +548,7 @@ class TestExtendedMetadataLoading:
         mock_epub_book.get_items_of_type = Mock(return_value=[Mock()])
 
         with patch(
-            "app.services.epub_cache.epub.read_epub", return_value=mock_epub_book
+            "app.services.epub.epub_archive.epub.read_epub", return_value=mock_epub_book
         ):
             cache = EPUBCache(
                 epub_dir=temp_dirs["epub_dir"],
@@ -355,7 +582,7 @@ class TestExtendedMetadataLoading:
         mock_epub_book.get_items_of_type = Mock(return_value=[Mock()])
 
         with patch(
-            "app.services.epub_cache.epub.read_epub", return_value=mock_epub_book
+            "app.services.epub.epub_archive.epub.read_epub", return_value=mock_epub_book
         ):
             cache = EPUBCache(
                 epub_dir=temp_dirs["epub_dir"],
@@ -394,7 +621,8 @@ class TestExtendedMetadataLoading:
         mock_epub_book.get_items_of_type = Mock(return_value=[])
 
         with patch(
-            "app.services.epub_cache.epub.read_epub", side_effect=read_epub_side_effect
+            "app.services.epub.epub_archive.epub.read_epub",
+            side_effect=read_epub_side_effect,
         ):
             cache = EPUBCache(
                 epub_dir=temp_dirs["epub_dir"],
@@ -574,7 +802,7 @@ class TestCacheOperations:
         mock_epub_book.get_items_of_type = Mock(return_value=[])
 
         with patch(
-            "app.services.epub_cache.epub.read_epub", return_value=mock_epub_book
+            "app.services.epub.epub_archive.epub.read_epub", return_value=mock_epub_book
         ):
             cache = EPUBCache(
                 epub_dir=temp_dirs["epub_dir"],
@@ -587,6 +815,90 @@ class TestCacheOperations:
 
         assert len(all_epubs) == 3
 
+    def test_get_all_epubs_reuses_listing_when_directory_unchanged(
+        self, temp_dirs, temp_db, mock_epub_service, mock_epub_book
+    ):
+        """Test that repeated listings don't rescan an unchanged directory"""
+        (temp_dirs["epub_dir"] / "book.epub").write_bytes(b"test")
+        mock_epub_book.get_items_of_type = Mock(return_value=[])
+
+        with patch(
+            "app.services.epub.epub_archive.epub.read_epub", return_value=mock_epub_book
+        ):
+            cache = EPUBCache(
+                epub_dir=temp_dirs["epub_dir"],
+                thumbnails_dir=temp_dirs["thumb_dir"],
+                epub_service=mock_epub_service,
+                db_path=temp_db,
+            )
+
+            with patch.object(cache, "_build_cache") as mock_build:
+                first = cache.get_all_epubs()
+                second = cache.get_all_epubs()
+
+        mock_build.assert_not_called()
+        assert first == second
+        assert first is not second
+
+    def test_get_all_epubs_rebuilds_when_directory_changes(
+        self, temp_dirs, temp_db, mock_epub_service, mock_epub_book
+    ):
+        """Test that adding an EPUB invalidates the cached listing"""
+        (temp_dirs["epub_dir"] / "book0.epub").write_bytes(b"test")
+        mock_epub_book.get_items_of_type = Mock(return_value=[])
+
+        with patch(
+            "app.services.epub.epub_archive.epub.read_epub", return_value=mock_epub_book
+        ):
+            cache = EPUBCache(
+                epub_dir=temp_dirs["epub_dir"],
+                thumbnails_dir=temp_dirs["thumb_dir"],
+                epub_service=mock_epub_service,
+                db_path=temp_db,
+            )
+            assert len(cache.get_all_epubs()) == 1
+
+            (temp_dirs["epub_dir"] / "book1.epub").write_bytes(b"test")
+            # Force a distinct mtime even on filesystems with coarse timestamps
+            cache._dir_mtime_ns = -1
+
+            all_epubs = cache.get_all_epubs()
+
+        assert {epub.filename for epub in all_epubs} == {"book0.epub", "book1.epub"}
+
+    def test_rebuild_keeps_previous_cache_visible_until_complete(
+        self, temp_dirs, temp_db, mock_epub_service, mock_epub_book
+    ):
+        """Test that readers see the old cache, never a partial one, mid-rebuild"""
+        (temp_dirs["epub_dir"] / "book0.epub").write_bytes(b"test")
+        mock_epub_book.get_items_of_type = Mock(return_value=[])
+
+        with patch(
+            "app.services.epub.epub_archive.epub.read_epub", return_value=mock_epub_book
+        ):
+            cache = EPUBCache(
+                epub_dir=temp_dirs["epub_dir"],
+                thumbnails_dir=temp_dirs["thumb_dir"],
+                epub_service=mock_epub_service,
+                db_path=temp_db,
+            )
+            old_cache = cache._cache
+            (temp_dirs["epub_dir"] / "book1.epub").write_bytes(b"test")
+
+            seen_mid_build = []
+
+            def generate(filenames):
+                # Called after the scan, just before the new cache is swapped in
+                seen_mid_build.append(set(cache._cache))
+                return [Path("thumbnails/test.jpg")] * len(filenames)
+
+            mock_epub_service.generate_thumbnails_bulk.side_effect = generate
+            cache.refresh()
+
+        assert seen_mid_build == [{"book0.epub"}]
+        assert cache._cache is not old_cache
+        assert set(cache._cache) == {"book0.epub", "book1.epub"}
+
     def test_get_epub_info_existing(
         self, temp_dirs, temp_db, mock_epub_service, mock_epub_book
     ):
@@ -598,7 +910,7 @@ class TestCacheOperations:
         mock_epub_book.get_items_of_type = Mock(return_value=[])
 
         with patch(
-            "app.services.epub_cache.epub.read_epub", return_value=mock_epub_book
+            "app.services.epub.epub_archive.epub.read_epub", return_value=mock_epub_book
         ):
             cache = EPUBCache(
                 epub_dir=temp_dirs["epub_dir"],
@@ -614,7 +926,7 @@ class TestCacheOperations:
 
     def test_get_cache_info(self, temp_dirs, temp_db, mock_epub_service):
         """Test getting cache metadata"""
-        with patch("app.services.epub_cache.epub.read_epub"):
+        with patch("app.services.epub.epub_archive.epub.read_epub"):
             cache = EPUBCache(
                 epub_dir=temp_dirs["epub_dir"],
                 thumbnails_dir=temp_dirs["thumb_dir"],
@@ -642,7 +954,7 @@ class TestEdgeCases:
         mock_epub_book.get_items_of_type = Mock(return_value=[])
 
         with patch(
-            "app.services.epub_cache.epub.read_epub", return_value=mock_epub_book
+            "app.services.epub.epub_archive.epub.read_epub", return_value=mock_epub_book
         ):
             cache = EPUBCache(
                 epub_dir=temp_dirs["epub_dir"],
@@ -667,7 +979,7 @@ class TestEdgeCases:
         mock_epub_book.get_items_of_type = Mock(return_value=[])
 
         with patch(
-            "app.services.epub_cache.epub.read_epub", return_value=mock_epub_book
+            "app.services.epub.epub_archive.epub.read_epub", return_value=mock_epub_book
         ):
             cache = EPUBCache(
                 epub_dir=temp_dirs["epub_dir"],
@@ -687,7 +999,9 @@ class TestEdgeCases:
         mock_book.get_metadata.return_value = [("Test",)]
         mock_book.get_items_of_type = Mock(return_value=[])
 
-        with patch("app.services.epub_cache.epub.read_epub", return_value=mock_book):
+        with patch(
+            "app.services.epub.epub_archive.epub.read_epub", return_value=mock_book
+        ):
             cache1 = EPUBCache(
                 epub_dir=temp_dirs["epub_dir"],
                 thumbnails_dir=temp_dirs["thumb_dir"],
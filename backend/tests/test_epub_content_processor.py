@@ -0,0 +1,102 @@
+"""
+Unit tests for EPUBContentProcessor.
+
+Tests cover:
+- Chapter sanitization on the parsed HTML tree
+- Body extraction
+- Image path rewriting
+"""
+
+from unittest.mock import Mock
+
+import ebooklib
+import pytest
+
+from app.services.epub.epub_content_processor import EPUBContentProcessor
+
+CHAPTER = b"""<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE html>
+<html xmlns="http://www.w3.org/1999/xhtml">
+<head><title>Chapter</title><script>head()</script></head>
+<body class="chapter" onload="init()">
+<h1>Caf\xc3\xa9</h1>
+<p onclick="steal()" ONMOUSEOVER=track>Text<script>evil()</script> after</p>
+<a href="javascript:alert(1)">bad</a><a href="ch2.xhtml">good</a>
+<img src="../images/figure.png" alt="Figure"/>
+<img src="https://example.com/remote.png"/>
+</body>
+</html>"""
+
+
+@pytest.fixture
+def processor():
+    return EPUBContentProcessor(base_url="http://test")
+
+
+def make_item(content: bytes):
+    item = Mock()
+    item.get_content.return_value = content
+    item.get_type.return_value = ebooklib.ITEM_DOCUMENT
+    return item
+
+
+class TestProcessedItemContent:
+    """Test sanitizing and rewriting a chapter in a single parse"""
+
+    def test_returns_only_body_content(self, processor):
+        """Test that head, html and body wrappers are stripped"""
+        html = processor._get_processed_item_content(make_item(CHAPTER), "b.epub")
+
+        assert html.startswith("<h1>Café</h1>")
+        assert "<body" not in html
+        assert "<title>" not in html
+        assert "DOCTYPE" not in html
+
+    def test_removes_scripts_but_keeps_surrounding_text(self, processor):
+        """Test that script elements are dropped without losing tail text"""
+        html = processor._get_processed_item_content(make_item(CHAPTER), "b.epub")
+
+        assert "<script" not in html
+        assert "evil()" not in html
+        assert "Text after" in html
+
+    def test_removes_event_handlers_and_javascript_urls(self, processor):
+        """Test that on* attributes and javascript: links are stripped"""
+        html = processor._get_processed_item_content(make_item(CHAPTER), "b.epub")
+
+        assert "steal()" not in html
+        assert "track" not in html.lower()
+        assert "javascript:" not in html
+        assert '<a href="ch2.xhtml">good</a>' in html
+
+    def test_removes_javascript_xlink_href(self, processor):
+        """Test that namespaced xlink:href javascript: links are stripped"""
+        chapter = (
+            b'<html><body><svg><a xlink:href="javascript:alert(1)">bad</a>'
+            b'<a xlink:href="ch2.xhtml">good</a></svg></body></html>'
+        )
+        html = processor._get_processed_item_content(make_item(chapter), "b.epub")
+
+        assert "javascript:" not in html
+        assert 'xlink:href="ch2.xhtml"' in html
+
+    def test_rewrites_relative_image_paths(self, processor):
+        """Test that relative images point at the image endpoint"""
+        html = processor._get_processed_item_content(
+            make_item(CHAPTER), "b.epub", epub_id=7
+        )
+
+        assert 'src="http://test/epub/7/image/images/figure.png"' in html
+        assert 'src="https://example.com/remote.png"' in html
+
+    def test_fragment_without_body(self, processor):
+        """Test that chapters without html/body wrappers are returned as-is"""
+        html = processor._get_processed_item_content(
+            make_item(b"<p>fragment <b>bold</b></p>"), "b.epub"
+        )
+
+        assert html == "<p>fragment <b>bold</b></p>"
+
+    def test_empty_content(self, processor):
+        """Test that empty chapters produce empty content"""
+        assert processor._get_processed_item_content(make_item(b""), "b.epub") == ""
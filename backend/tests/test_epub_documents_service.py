@@ -405,6 +405,28 @@ class TestUpdateLastAccessed:
         service.update_last_accessed(99999)
 
 
+class TestUpdateThumbnailPath:
+    """Test update_thumbnail_path method"""
+
+    def test_update_thumbnail_path(self, service):
+        """Test that only the thumbnail path is changed"""
+        service.create_or_update(
+            filename="thumb_test.epub", chapters=4, title="Thumb Test"
+        )
+
+        updated = service.update_thumbnail_path("thumb_test.epub", "thumbs/t.png")
+
+        doc = service.get_by_filename("thumb_test.epub")
+        assert updated is True
+        assert doc["thumbnail_path"] == "thumbs/t.png"
+        assert doc["title"] == "Thumb Test"
+        assert doc["chapters"] == 4
+
+    def test_update_thumbnail_path_nonexistent(self, service):
+        """Test updating the thumbnail of a non-existent document"""
+        assert service.update_thumbnail_path("missing.epub", "t.png") is False
+
+
 class TestDeleteOperations:
     """Test delete operations"""
 
@@ -0,0 +1,525 @@
+"""
+Unit tests for EPUBImageService.
+
+Tests cover:
+- Thumbnail generation from EPUB covers
+- Covers streamed directly from the ZIP container
+- Bulk thumbnail generation through the process pool
+- Serving EPUB images straight from the ZIP
+"""
+
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import zipfile
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from ebooklib import epub
+from PIL import Image
+
+from app.services.epub.epub_archive import open_epub_archive
+from app.services.epub.epub_image_service import (
+    THUMBNAIL_DRAFT_SIZE,
+    THUMBNAIL_SIZE_BUCKETS,
+    EPUBImageService,
+    ZipImageItem,
+    snap_thumbnail_size,
+)
+from tests.conftest import CONTENT_OPF
+
+
+def assert_color(pixel, expected, tolerance=4):
+    """Compare colors with room for JPEG rounding"""
+    assert all(abs(a - b) <= tolerance for a, b in zip(pixel, expected)), pixel
+
+
+@pytest.fixture
+def temp_dirs():
+    """Create temporary directories for EPUBs and thumbnails"""
+    with (
+        tempfile.TemporaryDirectory() as epub_dir,
+        tempfile.TemporaryDirectory() as thumb_dir,
+    ):
+        yield {"epub_dir": Path(epub_dir), "thumb_dir": Path(thumb_dir)}
+
+
+@pytest.fixture
+def image_service(temp_dirs):
+    return EPUBImageService(str(temp_dirs["thumb_dir"]))
+
+
+class TestGenerateThumbnail:
+    """Test single thumbnail generation"""
+
+    def test_generates_thumbnail_with_requested_size(
+        self, temp_dirs, image_service, make_epub
+    ):
+        """Test that the cover is rendered at the requested dimensions"""
+        epub_path = make_epub(temp_dirs["epub_dir"] / "book.epub")
+
+        thumbnail_path = image_service.generate_thumbnail(epub_path, 200, 280)
+
+        assert thumbnail_path.exists()
+        with Image.open(thumbnail_path) as thumb:
+            assert thumb.size == (200, 280)
+
+    def test_all_size_buckets_rendered_from_one_decode(
+        self, temp_dirs, image_service, make_epub
+    ):
+        """Test that one request renders every bucket and later sizes hit disk"""
+        epub_path = make_epub(temp_dirs["epub_dir"] / "book.epub")
+
+        with patch.object(
+            image_service,
+            "_load_cover_image",
+            wraps=image_service._load_cover_image,
+        ) as mock_load:
+            image_service.generate_thumbnail(epub_path, 200, 280)
+            large_path = image_service.generate_thumbnail(epub_path, 400, 560)
+
+        assert mock_load.call_count == 1
+        for width, height in THUMBNAIL_SIZE_BUCKETS:
+            path = temp_dirs["thumb_dir"] / f"book_thumb_{width}x{height}.jpg"
+            with Image.open(path) as thumb:
+                assert thumb.size == (width, height)
+        assert large_path.name == "book_thumb_400x560.jpg"
+
+    def test_requested_size_snaps_to_nearest_bucket(
+        self, temp_dirs, image_service, make_epub
+    ):
+        """Test that arbitrary sizes are served from the closest bucket"""
+        epub_path = make_epub(temp_dirs["epub_dir"] / "book.epub")
+
+        thumbnail_path = image_service.generate_thumbnail(epub_path, 180, 240)
+
+        assert thumbnail_path.name == "book_thumb_200x280.jpg"
+        assert image_service.get_thumbnail_path(epub_path, 90, 90) == (
+            temp_dirs["thumb_dir"] / "book_thumb_100x140.jpg"
+        )
+        assert snap_thumbnail_size(1000, 1400) == (400, 560)
+
+    def test_matching_aspect_ratio_fills_frame(
+        self, temp_dirs, image_service, make_epub
+    ):
+        """Test that a cover with the target aspect ratio is saved without padding"""
+        epub_path = make_epub(temp_dirs["epub_dir"] / "book.epub", (400, 560))
+
+        thumbnail_path = image_service.generate_thumbnail(epub_path, 200, 280)
+
+        with Image.open(thumbnail_path) as thumb:
+            assert thumb.mode == "RGB"
+            assert_color(thumb.getpixel((0, 0)), (255, 0, 0))
+
+    def test_narrow_cover_is_padded_with_background(
+        self, temp_dirs, image_service, make_epub
+    ):
+        """Test that a cover narrower than the frame is centered on the background"""
+        epub_path = make_epub(temp_dirs["epub_dir"] / "book.epub", (200, 560))
+
+        thumbnail_path = image_service.generate_thumbnail(
+            epub_path, 200, 280, background_color="white"
+        )
+
+        with Image.open(thumbnail_path) as thumb:
+            assert_color(thumb.getpixel((0, 0)), (255, 255, 255))
+            assert_color(thumb.getpixel((100, 140)), (255, 0, 0))
+
+    @pytest.mark.parametrize("strategy", ["center", "fill"])
+    def test_rgba_cover_is_flattened_to_rgb(
+        self, temp_dirs, image_service, make_epub, strategy
+    ):
+        """Test that covers with alpha still produce an RGB thumbnail"""
+        epub_path = make_epub(
+            temp_dirs["epub_dir"] / "book.epub", (400, 600), cover_mode="RGBA"
+        )
+
+        thumbnail_path = image_service.generate_thumbnail(
+            epub_path, 200, 280, strategy=strategy
+        )
+
+        with Image.open(thumbnail_path) as thumb:
+            assert thumb.mode == "RGB"
+            # The cover itself, not the fallback placeholder
+            assert_color(thumb.getpixel((100, 140)), (255, 0, 0))
+
+    def test_fill_strategy_downscales_large_cover_to_exact_size(
+        self, temp_dirs, image_service, make_epub
+    ):
+        """Test that a much larger cover is cropped and reduced to the frame"""
+        epub_path = make_epub(temp_dirs["epub_dir"] / "book.epub", (2400, 3000))
+
+        thumbnail_path = image_service.generate_thumbnail(
+            epub_path, 200, 280, strategy="fill"
+        )
+
+        with Image.open(thumbnail_path) as thumb:
+            assert thumb.size == (200, 280)
+            assert_color(thumb.getpixel((100, 140)), (255, 0, 0))
+
+    def test_placeholder_written_for_every_bucket(self, temp_dirs, image_service):
+        """Test that an unreadable EPUB leaves a placeholder at every size"""
+        epub_path = temp_dirs["epub_dir"] / "broken.epub"
+        epub_path.write_bytes(b"not a zip")
+
+        thumbnail_path = image_service.generate_thumbnail(epub_path, 200, 280)
+
+        assert thumbnail_path.name == "broken_thumb_200x280.jpg"
+        paths = image_service.get_thumbnail_paths(epub_path)
+        for path, size in zip(paths, THUMBNAIL_SIZE_BUCKETS):
+            with Image.open(path) as thumb:
+                assert thumb.size == size
+                assert_color(thumb.getpixel((0, 0)), (240, 240, 240))
+
+    def test_fresh_thumbnail_is_reused(self, temp_dirs, image_service, make_epub):
+        """Test that a thumbnail newer than the EPUB is returned as-is"""
+        epub_path = make_epub(temp_dirs["epub_dir"] / "book.epub")
+        thumbnail_path = image_service.generate_thumbnail(epub_path, 200, 280)
+
+        with patch.object(image_service, "_find_zip_cover_item") as mock_find:
+            assert (
+                image_service.generate_thumbnail(
+                    epub_path, 200, 280, epub_stat=epub_path.stat()
+                )
+                == thumbnail_path
+            )
+
+        mock_find.assert_not_called()
+
+    def test_stale_thumbnail_is_regenerated(self, temp_dirs, image_service, make_epub):
+        """Test that a thumbnail older than the EPUB is rebuilt"""
+        epub_path = make_epub(temp_dirs["epub_dir"] / "book.epub")
+        thumbnail_path = image_service.generate_thumbnail(epub_path, 200, 280)
+        stat = thumbnail_path.stat()
+        os.utime(
+            thumbnail_path,
+            ns=(stat.st_atime_ns, epub_path.stat().st_mtime_ns - 1_000_000_000),
+        )
+
+        with patch.object(
+            image_service, "_find_zip_cover_item", return_value=None
+        ) as mock_find:
+            image_service.generate_thumbnail(epub_path, 200, 280)
+
+        mock_find.assert_called_once()
+
+    def test_declared_cover_skips_ebooklib(self, temp_dirs, image_service, make_epub):
+        """Test that an OPF-declared cover is rendered without loading the book"""
+        epub_path = make_epub(temp_dirs["epub_dir"] / "book.epub", (400, 560))
+
+        with patch(
+            "app.services.epub.epub_image_service.read_epub_cached"
+        ) as mock_read:
+            thumbnail_path = image_service.generate_thumbnail(epub_path, 200, 280)
+
+        mock_read.assert_not_called()
+        with Image.open(thumbnail_path) as thumb:
+            assert_color(thumb.getpixel((0, 0)), (255, 0, 0))
+
+    def test_undeclared_cover_found_without_ebooklib(
+        self, temp_dirs, image_service, make_epub
+    ):
+        """Test that books without an OPF cover are matched from the manifest"""
+        epub_path = make_epub(temp_dirs["epub_dir"] / "book.epub", (400, 560))
+
+        with (
+            patch.object(image_service, "_find_declared_cover", return_value=None),
+            patch("app.services.epub.epub_image_service.read_epub_cached") as mock_read,
+        ):
+            thumbnail_path = image_service.generate_thumbnail(epub_path, 200, 280)
+
+        mock_read.assert_not_called()
+        with Image.open(thumbnail_path) as thumb:
+            assert_color(thumb.getpixel((0, 0)), (255, 0, 0))
+
+    def test_cover_lookup_opens_archive_once(self, temp_dirs, image_service, make_epub):
+        """Test that the declared and guessed cover lookups share one archive"""
+        epub_path = make_epub(temp_dirs["epub_dir"] / "book.epub", (400, 560))
+
+        with (
+            patch(
+                "app.services.epub.epub_image_service.open_epub_archive",
+                wraps=open_epub_archive,
+            ) as mock_open,
+            patch.object(image_service, "_find_declared_cover", return_value=None),
+        ):
+            cover = image_service._find_zip_cover_item(epub_path)
+
+        assert cover is not None
+        mock_open.assert_called_once_with(epub_path)
+
+    def test_unusable_opf_falls_back_to_ebooklib(
+        self, temp_dirs, image_service, make_epub
+    ):
+        """Test that the ebooklib heuristics still run if the ZIP path fails"""
+        epub_path = make_epub(temp_dirs["epub_dir"] / "book.epub", (400, 560))
+
+        with patch.object(image_service, "_find_zip_cover_item", return_value=None):
+            thumbnail_path = image_service.generate_thumbnail(epub_path, 200, 280)
+
+        with Image.open(thumbnail_path) as thumb:
+            assert_color(thumb.getpixel((0, 0)), (255, 0, 0))
+
+
+class TestZipBackedCover:
+    """Test covers read straight from the ZIP container"""
+
+    def test_epub3_cover_image_property(self, temp_dirs, image_service, make_epub):
+        """Test that an EPUB 3 properties="cover-image" item is found in the OPF"""
+        opf = CONTENT_OPF.replace('<meta name="cover" content="cover-img"/>', "")
+        opf = opf.replace(
+            'id="cover-img" href="images/cover.png"',
+            'id="cover-img" properties="cover-image" href="images/cover.png"',
+        )
+        epub_path = make_epub(temp_dirs["epub_dir"] / "book.epub", opf=opf)
+
+        item = image_service._find_opf_cover_item(epub_path)
+
+        assert isinstance(item, ZipImageItem)
+        assert item.get_id() == "cover-img"
+
+    def test_no_declared_cover(self, temp_dirs, image_service, make_epub):
+        """Test that the OPF lookup returns None when no cover is declared"""
+        opf = CONTENT_OPF.replace('<meta name="cover" content="cover-img"/>', "")
+        epub_path = make_epub(temp_dirs["epub_dir"] / "book.epub", opf=opf)
+
+        assert image_service._find_opf_cover_item(epub_path) is None
+
+    def test_create_item_from_zip_defers_reading(
+        self, temp_dirs, image_service, make_epub
+    ):
+        """Test that the ZIP item is created from the central directory only"""
+        archive = open_epub_archive(make_epub(temp_dirs["epub_dir"] / "book.epub"))
+
+        with patch.object(archive.zip_file, "read") as mock_read:
+            item = image_service._create_image_item_from_zip(
+                archive.zip_file, archive.opf_root, "cover-img", archive.opf_path
+            )
+
+        mock_read.assert_not_called()
+        assert isinstance(item, ZipImageItem)
+        assert item.get_name() == "images/cover.png"
+
+    def test_load_cover_streams_from_zip(self, temp_dirs, image_service, make_epub):
+        """Test that ZIP-backed covers decode from the member stream"""
+        archive = open_epub_archive(
+            make_epub(temp_dirs["epub_dir"] / "book.epub", (300, 420))
+        )
+        item = ZipImageItem(
+            archive.zip_file, "cover-img", "images/cover.png", "OEBPS/images/cover.png"
+        )
+
+        with patch.object(item, "get_content") as mock_get_content:
+            img = image_service._load_cover_image(item)
+
+        mock_get_content.assert_not_called()
+        assert img.size == (300, 420)
+
+    def test_large_jpeg_cover_decoded_at_reduced_scale(self, temp_dirs, image_service):
+        """Test that JPEG covers use DCT scaling but stay above the draft size"""
+        cover = io.BytesIO()
+        Image.new("RGB", (3200, 4480), "red").save(cover, "JPEG")
+        zip_path = temp_dirs["epub_dir"] / "covers.zip"
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr("cover.jpg", cover.getvalue())
+
+        with zipfile.ZipFile(zip_path) as zf:
+            item = ZipImageItem(zf, "cover", "cover.jpg", "cover.jpg")
+            img = image_service._load_cover_image(item)
+
+        assert img.size == (800, 1120)
+        assert img.width >= THUMBNAIL_DRAFT_SIZE[0]
+        assert img.height >= THUMBNAIL_DRAFT_SIZE[1]
+
+    def test_large_png_cover_is_prereduced_once(self, image_service):
+        """Test that oversized non-JPEG covers are box-reduced before resampling"""
+        reduced = image_service._prereduce_cover(Image.new("RGB", (3200, 4480)))
+        palette = Image.new("P", (3200, 4480))
+
+        assert reduced.size == (800, 1120)
+        assert image_service._prereduce_cover(palette) is palette
+
+
+class TestGetEpubImageFromArchive:
+    """Test image lookups that bypass ebooklib"""
+
+    def test_matches_book_lookup(self, temp_dirs, image_service, make_epub):
+        """Test that exact and partial paths return the same bytes as ebooklib"""
+        epub_path = make_epub(temp_dirs["epub_dir"] / "book.epub")
+        book = epub.read_epub(str(epub_path))
+
+        for image_path in ("images/cover.png", "./images/cover.png", "cover.png"):
+            assert image_service.get_epub_image_from_archive(
+                epub_path, image_path
+            ) == image_service.get_epub_image(book, image_path)
+
+    def test_missing_and_invalid_paths_raise(self, temp_dirs, image_service, make_epub):
+        """Test that unknown or unsafe paths raise FileNotFoundError"""
+        epub_path = make_epub(temp_dirs["epub_dir"] / "book.epub")
+
+        for image_path in ("images/missing.png", "/etc/passwd", ""):
+            with pytest.raises(FileNotFoundError):
+                image_service.get_epub_image_from_archive(epub_path, image_path)
+
+
+class TestGuessCoverImage:
+    """Test cover heuristics for books that don't declare a cover"""
+
+    def _item(self, name, size):
+        item = Mock()
+        item.get_name.return_value = name
+        item.size = size
+        return item
+
+    def test_prefers_cover_filename(self, image_service):
+        """Test that a cover-like filename wins over size"""
+        big = self._item("images/photo.jpg", 500_000)
+        cover = self._item("images/Cover.jpg", 10)
+
+        assert image_service._guess_cover_image([big, cover], lambda i: i.size) is cover
+
+    def test_filename_priority_then_manifest_order(self, image_service):
+        """Test that more specific names win, and the first wins among equals"""
+        poster = self._item("images/poster.jpg", 10)
+        title = self._item("images/title.jpg", 10)
+        front = self._item("images/front.jpg", 10)
+        cover = self._item("images/cover.jpg", 10)
+        size_of = lambda i: i.size  # noqa: E731
+
+        assert (
+            image_service._guess_cover_image([poster, title, front], size_of) is title
+        )
+        assert (
+            image_service._guess_cover_image([poster, front, cover], size_of) is cover
+        )
+
+    def test_picks_clearly_largest_image(self, image_service):
+        """Test that a dominant image is chosen when names don't help"""
+        small = self._item("images/a.jpg", 20_000)
+        large = self._item("images/b.jpg", 90_000)
+
+        assert image_service._guess_cover_image([small, large], lambda i: i.size) is (
+            large
+        )
+
+    def test_falls_back_to_first_image(self, image_service):
+        """Test that similar-sized images fall back to manifest order"""
+        first = self._item("images/a.jpg", 30_000)
+        second = self._item("images/b.jpg", 40_000)
+
+        assert (
+            image_service._guess_cover_image([first, second], lambda i: i.size) is first
+        )
+        assert image_service._guess_cover_image([], lambda i: i.size) is None
+
+    def test_zip_sizes_come_from_central_directory(
+        self, temp_dirs, image_service, make_epub
+    ):
+        """Test that ZIP-backed items report size without decompressing"""
+        archive = open_epub_archive(make_epub(temp_dirs["epub_dir"] / "book.epub"))
+        item = ZipImageItem(
+            archive.zip_file, "cover-img", "images/cover.png", "OEBPS/images/cover.png"
+        )
+
+        with patch.object(archive.zip_file, "read") as mock_read:
+            size = item.get_size()
+
+        mock_read.assert_not_called()
+        assert size == archive.zip_file.getinfo("OEBPS/images/cover.png").file_size
+
+
+class TestGenerateThumbnailsBulk:
+    """Test parallel thumbnail generation"""
+
+    def test_empty_input_does_not_start_pool(self, image_service):
+        """Test that an empty batch returns immediately"""
+        with patch(
+            "app.services.epub.epub_image_service.ProcessPoolExecutor"
+        ) as mock_pool:
+            assert image_service.generate_thumbnails_bulk([]) == []
+
+        mock_pool.assert_not_called()
+
+    def test_generates_all_thumbnails_in_order(
+        self, temp_dirs, image_service, make_epub
+    ):
+        """Test that bulk generation returns one thumbnail per EPUB, in order"""
+        epub_paths = [
+            make_epub(temp_dirs["epub_dir"] / f"book{i}.epub") for i in range(3)
+        ]
+
+        thumbnail_paths = image_service.generate_thumbnails_bulk(epub_paths)
+
+        assert [p.name for p in thumbnail_paths] == [
+            f"book{i}_thumb_200x280.jpg" for i in range(3)
+        ]
+        assert all(p.exists() for p in thumbnail_paths)
+
+    def test_failed_worker_keeps_other_results(self, image_service):
+        """Test that one failed cover is logged as None without losing the rest"""
+        outcomes = iter(["thumbs/a.jpg", RuntimeError("bad cover"), "thumbs/c.jpg"])
+
+        def submit(*args):
+            future = Future()
+            outcome = next(outcomes)
+            if isinstance(outcome, Exception):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+            return future
+
+        pool = MagicMock(submit=Mock(side_effect=submit))
+        pool.__enter__.return_value = pool
+        with patch(
+            "app.services.epub.epub_image_service.ProcessPoolExecutor",
+            return_value=pool,
+        ):
+            thumbnail_paths = image_service.generate_thumbnails_bulk(
+                [Path("a.epub"), Path("b.epub"), Path("c.epub")]
+            )
+
+        assert thumbnail_paths == [Path("thumbs/a.jpg"), None, Path("thumbs/c.jpg")]
+
+    def test_pool_is_shut_down_after_each_batch(self, image_service):
+        """Test that no worker processes outlive the batch, even a broken one"""
+        future = Future()
+        future.set_exception(BrokenProcessPool("worker died"))
+        pool = MagicMock(submit=Mock(return_value=future))
+        pool.__enter__.return_value = pool
+
+        with patch(
+            "app.services.epub.epub_image_service.ProcessPoolExecutor",
+            return_value=pool,
+        ):
+            thumbnail_paths = image_service.generate_thumbnails_bulk(
+                [Path("a.epub"), Path("b.epub")]
+            )
+
+        assert thumbnail_paths == [None, None]
+        pool.__exit__.assert_called_once()
+
+    def test_workers_do_not_initialize_the_database(self, tmp_path):
+        """Test that importing the worker module leaves the database untouched"""
+        backend_dir = Path(__file__).resolve().parent.parent
+        code = (
+            "import sys\n"
+            "import app.services.epub.epub_image_service\n"
+            "print('app.services.database_service' in sys.modules)\n"
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=tmp_path,
+            env={**os.environ, "PYTHONPATH": str(backend_dir)},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert result.stdout.strip() == "False"
+        assert not (tmp_path / "data").exists()
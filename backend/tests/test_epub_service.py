@@ -0,0 +1,294 @@
+"""
+Unit tests for EPUBService.
+
+Tests cover:
+- Async wrappers that move blocking EPUB work off the event loop
+- Coalescing of concurrent thumbnail generations
+- Thumbnail path lookup and in-memory thumbnail bytes
+- Cached navigation trees and styles
+- ETags for responses derived from an EPUB
+"""
+
+import asyncio
+import os
+import tempfile
+import threading
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.services.epub_service import EPUBService
+
+
+@pytest.fixture
+def temp_dirs():
+    """Create temporary directories for EPUBs and data"""
+    with (
+        tempfile.TemporaryDirectory() as epub_dir,
+        tempfile.TemporaryDirectory() as data_dir,
+    ):
+        yield {"epub_dir": Path(epub_dir), "data_dir": Path(data_dir)}
+
+
+@pytest.fixture
+def service(temp_dirs):
+    """EPUBService with a mocked cache"""
+    mock_cache = Mock()
+    mock_cache.get_all_epubs.return_value = []
+    with patch("app.services.epub_service.EPUBCache", return_value=mock_cache):
+        yield EPUBService(
+            epub_dir=str(temp_dirs["epub_dir"]),
+            db_path=str(temp_dirs["data_dir"] / "test.db"),
+        )
+
+
+class TestAsyncWrappers:
+    """Test async wrappers around blocking EPUBService methods"""
+
+    @pytest.mark.asyncio
+    async def test_list_epubs_async_returns_cache_listing(self, service):
+        """Test that list_epubs_async returns the same result as list_epubs"""
+        result = await service.list_epubs_async()
+
+        assert result == []
+        assert service.cache.get_all_epubs.called
+
+    @pytest.mark.asyncio
+    async def test_generate_thumbnail_async_forwards_arguments(self, service):
+        """Test that generate_thumbnail_async forwards all arguments"""
+        with patch.object(
+            service, "generate_thumbnail", return_value=Path("thumb.png")
+        ) as mock_generate:
+            result = await service.generate_thumbnail_async(
+                "book.epub", 100, 140, "black", "fill"
+            )
+
+        assert result == Path("thumb.png")
+        mock_generate.assert_called_once_with("book.epub", 100, 140, "black", "fill")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_thumbnail_requests_share_one_generation(self, service):
+        """Test that concurrent generate_thumbnail_async calls render once"""
+        release = threading.Event()
+
+        def slow_generate(*args):
+            release.wait(timeout=5)
+            return Path("thumb.jpg")
+
+        with patch.object(
+            service, "generate_thumbnail", side_effect=slow_generate
+        ) as mock_generate:
+            waiters = [
+                asyncio.create_task(service.generate_thumbnail_async("book.epub"))
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0.05)
+            release.set()
+            results = await asyncio.gather(*waiters)
+
+            assert results == [Path("thumb.jpg")] * 3
+            assert mock_generate.call_count == 1
+            assert service._pending_thumbnails == {}
+
+            # Once finished, a new call generates again
+            await service.generate_thumbnail_async("book.epub")
+            assert mock_generate.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_content_by_nav_id_async_forwards_arguments(self, service):
+        """Test that get_content_by_nav_id_async forwards all arguments"""
+        with patch.object(
+            service, "get_content_by_nav_id", return_value={"nav_id": "ch1"}
+        ) as mock_content:
+            result = await service.get_content_by_nav_id_async("book.epub", "ch1", 7)
+
+        assert result == {"nav_id": "ch1"}
+        mock_content.assert_called_once_with("book.epub", "ch1", 7)
+
+    @pytest.mark.asyncio
+    async def test_read_wrappers_match_sync_results(
+        self, service, temp_dirs, make_epub
+    ):
+        """Test that the read-only async wrappers return the sync results"""
+        make_epub(temp_dirs["epub_dir"] / "book.epub")
+
+        assert await service.get_navigation_tree_async(
+            "book.epub"
+        ) == service.get_navigation_tree("book.epub")
+        assert await service.get_epub_styles_async(
+            "book.epub"
+        ) == service.get_epub_styles("book.epub")
+        assert await service.get_epub_image_async(
+            "book.epub", "images/cover.png"
+        ) == service.get_epub_image("book.epub", "images/cover.png")
+
+    @pytest.mark.asyncio
+    async def test_read_thumbnail_bytes_async_runs_in_thread(self, service, temp_dirs):
+        """Test that thumbnail reads are moved off the event loop"""
+        thumb = temp_dirs["data_dir"] / "thumb.jpg"
+        thumb.write_bytes(b"jpeg")
+        loop_thread = threading.get_ident()
+        read_threads = []
+        read = service.read_thumbnail_bytes
+
+        def record_thread(path):
+            read_threads.append(threading.get_ident())
+            return read(path)
+
+        with patch.object(service, "read_thumbnail_bytes", side_effect=record_thread):
+            assert await service.read_thumbnail_bytes_async(thumb) == b"jpeg"
+
+        assert read_threads and read_threads[0] != loop_thread
+
+
+class TestGetThumbnailPath:
+    """Test thumbnail path lookup"""
+
+    def test_returns_cached_thumbnail_path(self, service):
+        """Test that the cached thumbnail path is preferred"""
+        service.cache.get_thumbnail_path.return_value = "thumbnails/cached.png"
+
+        assert service.get_thumbnail_path("book.epub") == Path("thumbnails/cached.png")
+
+    def test_fallback_derives_path_without_touching_epub(self, service):
+        """Test that the fallback path is computed without validating the EPUB"""
+        service.cache.get_thumbnail_path.side_effect = FileNotFoundError
+
+        with patch.object(service, "get_epub_path") as mock_get_path:
+            thumbnail_path = service.get_thumbnail_path("My%20Book.epub")
+
+        mock_get_path.assert_not_called()
+        assert thumbnail_path.name == "My Book_thumb_200x280.jpg"
+
+    def test_all_paths_cover_every_bucket_and_cached_path(self, service):
+        """Test that deletion can find every size plus a legacy cached file"""
+        service.cache.get_thumbnail_path.return_value = "thumbnails/book.png"
+
+        paths = service.get_thumbnail_paths("book.epub")
+
+        assert [p.name for p in paths] == [
+            "book_thumb_100x140.jpg",
+            "book_thumb_200x280.jpg",
+            "book_thumb_400x560.jpg",
+            "book.png",
+        ]
+
+
+class TestReadThumbnailBytes:
+    """Test in-memory caching of thumbnail contents"""
+
+    def test_serves_from_memory_until_regenerated(self, service, temp_dirs):
+        """Test that bytes are reused until the thumbnail file changes"""
+        thumb = temp_dirs["data_dir"] / "thumb.jpg"
+        thumb.write_bytes(b"first")
+
+        assert service.read_thumbnail_bytes(thumb) == b"first"
+
+        with patch("pathlib.Path.read_bytes") as mock_read:
+            assert service.read_thumbnail_bytes(thumb) == b"first"
+        mock_read.assert_not_called()
+
+        thumb.write_bytes(b"second!")
+        assert service.read_thumbnail_bytes(thumb) == b"second!"
+
+    def test_missing_thumbnail_raises(self, service, temp_dirs):
+        """Test that an ungenerated thumbnail raises FileNotFoundError"""
+        with pytest.raises(FileNotFoundError):
+            service.read_thumbnail_bytes(temp_dirs["data_dir"] / "missing.jpg")
+
+
+class TestDerivedCaches:
+    """Test per-file caching of navigation trees and styles"""
+
+    def test_navigation_tree_built_once_per_file_version(
+        self, service, temp_dirs, make_epub
+    ):
+        """Test that repeated requests reuse the cached navigation tree"""
+        path = make_epub(temp_dirs["epub_dir"] / "book.epub")
+
+        with patch.object(
+            service.navigation_service,
+            "get_navigation_tree",
+            return_value={"navigation": []},
+        ) as mock_build:
+            service.get_navigation_tree("book.epub")
+            service.get_navigation_tree("book.epub")
+            assert mock_build.call_count == 1
+
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            service.get_navigation_tree("book.epub")
+            assert mock_build.call_count == 2
+
+    def test_same_mtime_different_size_is_rebuilt(self, service, temp_dirs, make_epub):
+        """Test that a replaced file with a preserved mtime isn't served stale"""
+        path = make_epub(temp_dirs["epub_dir"] / "book.epub")
+
+        with patch.object(
+            service.style_processor,
+            "get_epub_styles",
+            return_value={"styles": []},
+        ) as mock_build:
+            service.get_epub_styles("book.epub")
+
+            stat = path.stat()
+            with open(path, "ab") as f:
+                f.write(b"\0" * 16)
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            service.get_epub_styles("book.epub")
+
+        assert mock_build.call_count == 2
+
+    def test_callers_get_independent_copies(self, service, temp_dirs, make_epub):
+        """Test that mutating a returned result doesn't corrupt the cache"""
+        make_epub(temp_dirs["epub_dir"] / "book.epub")
+
+        first = service.get_epub_styles("book.epub")
+        first["styles"].append({"id": "injected"})
+
+        assert service.get_epub_styles("book.epub") != first
+
+    def test_refresh_clears_derived_caches(self, service, temp_dirs, make_epub):
+        """Test that a cache refresh forces navigation to be rebuilt"""
+        make_epub(temp_dirs["epub_dir"] / "book.epub")
+
+        with patch.object(
+            service.navigation_service,
+            "get_navigation_tree",
+            return_value={"navigation": []},
+        ) as mock_build:
+            service.get_navigation_tree("book.epub")
+            service.refresh_cache()
+            service.get_navigation_tree("book.epub")
+
+        assert mock_build.call_count == 2
+
+
+class TestGetETag:
+    """Test HTTP validators for EPUB-derived responses"""
+
+    def test_stable_until_file_changes(self, service, temp_dirs, make_epub):
+        """Test that the ETag only changes when the EPUB is modified"""
+        epub_path = make_epub(temp_dirs["epub_dir"] / "book.epub")
+        etag = service.get_etag("book.epub", "navigation")
+
+        assert service.get_etag("book.epub", "navigation") == etag
+
+        stat = epub_path.stat()
+        os.utime(epub_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert service.get_etag("book.epub", "navigation") != etag
+
+    def test_variants_differ(self, service, temp_dirs, make_epub):
+        """Test that different responses from one book get different ETags"""
+        make_epub(temp_dirs["epub_dir"] / "book.epub")
+
+        assert service.get_etag("book.epub", "content:1:ch1") != service.get_etag(
+            "book.epub", "content:1:ch2"
+        )
+
+    def test_missing_epub_raises(self, service):
+        """Test that a missing EPUB raises FileNotFoundError"""
+        with pytest.raises(FileNotFoundError):
+            service.get_etag("missing.epub")
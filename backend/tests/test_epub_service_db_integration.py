@@ -309,7 +309,9 @@ class TestIntegrationScenarios:
         mock_book.get_metadata.return_value = [("Test Book",)]
         mock_book.get_items_of_type.return_value = []
 
-        with patch("app.services.epub_cache.epub.read_epub", return_value=mock_book):
+        with patch(
+            "app.services.epub.epub_archive.epub.read_epub", return_value=mock_book
+        ):
             service = EPUBService(epub_dir=temp_dirs["epub_dir"], db_path=temp_db)
 
         # Service should be fully functional
@@ -322,7 +324,9 @@ class TestIntegrationScenarios:
         mock_book.get_metadata.return_value = [("Test",)]
         mock_book.get_items_of_type.return_value = []
 
-        with patch("app.services.epub_cache.epub.read_epub", return_value=mock_book):
+        with patch(
+            "app.services.epub.epub_archive.epub.read_epub", return_value=mock_book
+        ):
             service1 = EPUBService(epub_dir=temp_dirs["epub_dir"], db_path=temp_db)
 
             service2 = EPUBService(epub_dir=temp_dirs["epub_dir"], db_path=temp_db)
@@ -0,0 +1,374 @@
+"""
+Unit tests for HighlightsService.
+
+Tests cover:
+- Saving a single highlight with its pdf_id and local-time timestamps
+- Reading highlights back as dictionaries, with or without coordinates
+- Cached lookups by id and their invalidation
+- Bulk saving highlights in one transaction
+- Per-PDF highlight summaries
+- Indexes serving the highlight queries' ORDER BY
+- Startup backfill of pdf_id
+- WAL journal mode and relaxed synchronous commits
+- One reused connection per thread, with its tuning pragmas applied once
+"""
+
+import os
+import sqlite3
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import lru_cache
+from unittest.mock import patch
+
+import pytest
+
+from app.services.database_service import DatabaseService
+from app.services.highlights_service import HighlightsService
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+@pytest.fixture
+def temp_db_path():
+    """Create temporary database path"""
+    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".db") as f:
+        db_path = f.name
+
+    yield db_path
+
+    # Cleanup, including the WAL and shared-memory files
+    for path in (db_path, f"{db_path}-wal", f"{db_path}-shm"):
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+@pytest.fixture
+def db_service(temp_db_path):
+    """DatabaseService with one registered PDF"""
+    service = DatabaseService(db_path=temp_db_path)
+    service.highlights._pdf_docs_service.create_or_update("book.pdf", num_pages=10)
+    return service
+
+
+def make_highlight(pdf_filename="book.pdf", page_number=1):
+    return {
+        "pdf_filename": pdf_filename,
+        "page_number": page_number,
+        "selected_text": "text",
+        "start_offset": 0,
+        "end_offset": 4,
+        "color": "#ffff00",
+        "coordinates": [{"x": 1, "y": 2}],
+    }
+
+
+class TestSaveHighlight:
+    """Test single highlight inserts"""
+
+    def test_saves_highlight_with_pdf_id(self, db_service):
+        """Test that the pdf_id is filled in from pdf_documents"""
+        highlight_id = db_service.save_highlight(**make_highlight())
+
+        saved = db_service.highlights.get_highlight_by_id(highlight_id)
+        assert saved["pdf_id"] is not None
+        assert saved["coordinates"] == [{"x": 1, "y": 2}]
+        assert saved["created_at"] == saved["updated_at"]
+
+    def test_timestamps_are_local_time(self, db_service):
+        """Test that SQLite-side timestamps match get_current_timestamp()"""
+        highlights = db_service.highlights
+        highlight_id = highlights.save_highlight(**make_highlight())
+        highlights.execute_update_delete(
+            "UPDATE highlights SET updated_at = '2000-01-01 00:00:00'", ()
+        )
+
+        assert highlights.update_color(highlight_id, "#ff0000")
+
+        saved = highlights.get_highlight_by_id(highlight_id)
+        now = datetime.strptime(highlights.get_current_timestamp(), TIMESTAMP_FORMAT)
+        for column in ("created_at", "updated_at"):
+            stamp = datetime.strptime(saved[column], TIMESTAMP_FORMAT)
+            assert abs(now - stamp) < timedelta(minutes=1)
+
+
+class TestGetHighlights:
+    """Test highlight reads"""
+
+    def test_rows_become_highlight_dicts(self, db_service):
+        """Test that every column is returned and bad coordinates become []"""
+        highlight_id = db_service.save_highlight(**make_highlight())
+        db_service.highlights.execute_update_delete(
+            "UPDATE highlights SET coordinates = 'not json' WHERE id = ?",
+            (highlight_id,),
+        )
+
+        (highlight,) = db_service.get_highlights_for_pdf("book.pdf", page_number=1)
+
+        assert set(highlight) == {
+            "id",
+            "pdf_filename",
+            "pdf_id",
+            "page_number",
+            "selected_text",
+            "start_offset",
+            "end_offset",
+            "color",
+            "coordinates",
+            "created_at",
+            "updated_at",
+        }
+        assert highlight["coordinates"] == []
+        assert db_service.get_highlights_for_pdf("book.pdf", page_number=2) == []
+
+    @pytest.mark.parametrize("page_number", [None, 1])
+    def test_coordinates_can_be_skipped(self, db_service, page_number):
+        """Test that list views can leave coordinates unread"""
+        db_service.save_highlight(**make_highlight())
+        full = db_service.get_highlights_for_pdf("book.pdf", page_number)
+
+        with patch("app.services.highlights_service.json.loads") as mock_loads:
+            listed = db_service.get_highlights_for_pdf(
+                "book.pdf", page_number, include_coordinates=False
+            )
+
+        mock_loads.assert_not_called()
+        assert listed == [{**full[0], "coordinates": None}]
+
+
+class TestGetHighlightById:
+    """Test the in-memory cache behind get_highlight_by_id"""
+
+    def test_repeat_reads_skip_the_database(self, db_service):
+        """Test that a second read is served from memory as an equal copy"""
+        highlights = db_service.highlights
+        highlight_id = highlights.save_highlight(**make_highlight())
+        first = highlights.get_highlight_by_id(highlight_id)
+        first["coordinates"][0]["x"] = 99
+
+        with patch.object(highlights, "execute_query") as mock_query:
+            second = highlights.get_highlight_by_id(highlight_id)
+
+        mock_query.assert_not_called()
+        assert second["coordinates"] == [{"x": 1, "y": 2}]
+
+    def test_missing_ids_are_not_cached(self, db_service):
+        """Test that an id read before it exists is found once inserted"""
+        highlights = db_service.highlights
+        next_id = highlights.save_highlight(**make_highlight()) + 1
+
+        assert highlights.get_highlight_by_id(next_id) is None
+        assert highlights.save_highlight(**make_highlight()) == next_id
+        assert highlights.get_highlight_by_id(next_id) is not None
+
+    def test_writes_invalidate_cached_highlights(self, db_service):
+        """Test that color updates and deletes are seen by the next read"""
+        highlights = db_service.highlights
+        highlight_id = highlights.save_highlight(**make_highlight())
+        highlights.get_highlight_by_id(highlight_id)
+
+        highlights.update_color(highlight_id, "#ff0000")
+        assert highlights.get_highlight_by_id(highlight_id)["color"] == "#ff0000"
+
+        highlights.delete_highlight(highlight_id)
+        assert highlights.get_highlight_by_id(highlight_id) is None
+
+    def test_deleting_book_data_invalidates_cache(self, db_service):
+        """Test that deleting a book's data drops its cached highlights"""
+        highlight_id = db_service.save_highlight(**make_highlight())
+        db_service.get_highlight_by_id(highlight_id)
+
+        db_service.delete_all_book_data("book.pdf")
+
+        assert db_service.get_highlight_by_id(highlight_id) is None
+
+    def test_read_racing_a_write_is_not_kept(self, db_service):
+        """Test that a row loaded before an invalidation isn't served after it"""
+        highlights = db_service.highlights
+        highlight_id = highlights.save_highlight(**make_highlight())
+        load = highlights._load_highlight_by_id
+        updates = iter(["#ff0000"])
+
+        def load_then_update(*args):
+            # The color changes after this read saw the old row
+            highlight = load(*args)
+            for color in updates:
+                highlights.update_color(highlight_id, color)
+            return highlight
+
+        highlights._highlight_by_id_cached = lru_cache()(load_then_update)
+
+        assert highlights.get_highlight_by_id(highlight_id)["color"] == "#ffff00"
+        assert highlights.get_highlight_by_id(highlight_id)["color"] == "#ff0000"
+
+
+class TestSaveHighlightsBulk:
+    """Test batched highlight inserts"""
+
+    def test_saves_all_rows_with_one_lookup_per_pdf(self, db_service):
+        """Test that every row is saved and each pdf_id is looked up once"""
+        highlights = [make_highlight(page_number=page) for page in range(1, 6)]
+        highlights.append(make_highlight(pdf_filename="other.pdf"))
+
+        with patch.object(
+            db_service.highlights,
+            "_get_pdf_id",
+            wraps=db_service.highlights._get_pdf_id,
+        ) as mock_lookup:
+            assert db_service.save_highlights_bulk(highlights) == 6
+
+        assert mock_lookup.call_count == 2
+        saved = db_service.get_highlights_for_pdf("book.pdf")
+        assert sorted(h["page_number"] for h in saved) == [1, 2, 3, 4, 5]
+        assert all(h["pdf_id"] is not None for h in saved)
+        assert db_service.get_highlights_for_pdf("other.pdf")[0]["pdf_id"] is None
+
+    def test_empty_batch(self, db_service):
+        """Test that an empty batch saves nothing"""
+        assert db_service.save_highlights_bulk([]) == 0
+
+    def test_invalid_row_fails_whole_batch(self, db_service):
+        """Test that a bad row rolls back the batch"""
+        highlights = [make_highlight(), {"pdf_filename": "book.pdf"}]
+
+        assert db_service.save_highlights_bulk(highlights) == 0
+        assert db_service.get_highlights_for_pdf("book.pdf") == []
+
+
+class TestHighlightsCountByPdf:
+    """Test per-PDF highlight summaries"""
+
+    def test_latest_text_comes_from_latest_highlight(self, db_service):
+        """Test counts, latest date and truncated latest text in one query"""
+        highlights = db_service.highlights
+        latest = highlights.save_highlight(
+            **{**make_highlight(), "selected_text": "x" * 60}
+        )
+        older = highlights.save_highlight(**make_highlight())
+        highlights.save_highlight(**make_highlight(pdf_filename="other.pdf"))
+        for highlight_id, created_at in (
+            (latest, "2024-02-01 00:00:00"),
+            (older, "2024-01-01 00:00:00"),
+        ):
+            highlights.execute_update_delete(
+                "UPDATE highlights SET created_at = ? WHERE id = ?",
+                (created_at, highlight_id),
+            )
+
+        with patch.object(
+            highlights, "execute_query", wraps=highlights.execute_query
+        ) as mock_query:
+            summary = highlights.get_highlights_count_by_pdf()
+
+        assert mock_query.call_count == 1
+        assert summary["book.pdf"] == {
+            "highlights_count": 2,
+            "latest_highlight_date": "2024-02-01 00:00:00",
+            "latest_highlight_text": "x" * 50 + "...",
+        }
+        assert summary["other.pdf"]["highlights_count"] == 1
+        assert summary["other.pdf"]["latest_highlight_text"] == "text"
+
+
+class TestHighlightIndexes:
+    """Test that the highlight indexes cover the read queries"""
+
+    @pytest.mark.parametrize(
+        "query_name, params",
+        [
+            ("_SELECT_HIGHLIGHTS_BY_PAGE_QUERY", ("book.pdf", 1)),
+            ("_SELECT_HIGHLIGHTS_BY_PDF_QUERY", ("book.pdf",)),
+            ("_SELECT_HIGHLIGHT_LIST_BY_PAGE_QUERY", ("book.pdf", 1)),
+            ("_SELECT_HIGHLIGHT_LIST_BY_PDF_QUERY", ("book.pdf",)),
+        ],
+    )
+    def test_order_by_needs_no_sort(self, db_service, query_name, params):
+        """Test that SQLite reads rows in order from an index"""
+        query = getattr(db_service.highlights, query_name)
+
+        with sqlite3.connect(db_service.db_path) as conn:
+            plan = " ".join(
+                row[-1] for row in conn.execute(f"EXPLAIN QUERY PLAN {query}", params)
+            )
+
+        assert "USING INDEX idx_highlights_pdf_page_created" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_old_indexes_are_dropped(self, db_service):
+        """Test that the indexes superseded by the composite ones are removed"""
+        with sqlite3.connect(db_service.db_path) as conn:
+            names = {
+                row[0]
+                for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE tbl_name = 'highlights'"
+                    " AND type = 'index'"
+                )
+            }
+
+        assert {
+            "idx_highlights_pdf_page_created",
+            "idx_highlights_pdf_created",
+        } <= names
+        assert not names & {"idx_highlights_pdf_page", "idx_highlights_pdf"}
+
+
+class TestPdfIdBackfill:
+    """Test the startup backfill of highlights.pdf_id"""
+
+    def test_backfills_rows_for_registered_pdfs(self, db_service):
+        """Test that NULL pdf_ids are filled in on the next startup"""
+        highlight_id = db_service.save_highlight(**make_highlight())
+        db_service.highlights.execute_update_delete(
+            "UPDATE highlights SET pdf_id = NULL WHERE id = ?", (highlight_id,)
+        )
+
+        restarted = HighlightsService(db_service.db_path)
+
+        assert restarted.get_highlight_by_id(highlight_id)["pdf_id"] is not None
+
+
+class TestConnectionSettings:
+    """Test SQLite settings for highlight writes"""
+
+    def test_database_uses_wal(self, db_service):
+        """Test that the database file is switched to WAL mode"""
+        with sqlite3.connect(db_service.db_path) as conn:
+            (mode,) = conn.execute("PRAGMA journal_mode").fetchone()
+
+        assert mode == "wal"
+
+    def test_connections_use_normal_synchronous(self, db_service):
+        """Test that highlight connections skip the per-commit fsync"""
+        conn = db_service.highlights.get_connection()
+        (synchronous,) = conn.execute("PRAGMA synchronous").fetchone()
+
+        assert synchronous == 1  # NORMAL
+
+    def test_connections_apply_tuning_pragmas(self, db_service):
+        """Test that each thread's connection gets the read tuning pragmas"""
+        conn = db_service.highlights.get_connection()
+
+        assert conn.execute("PRAGMA temp_store").fetchone() == (2,)  # MEMORY
+        assert conn.execute("PRAGMA mmap_size").fetchone() == (268435456,)
+        assert conn.execute("PRAGMA cache_size").fetchone() == (-20000,)
+
+    def test_memory_database_skips_tuning_pragmas(self):
+        """Test that ':memory:' connections keep SQLite's defaults"""
+        with patch.object(HighlightsService, "_init_table"):
+            highlights = HighlightsService(":memory:")
+
+        conn = highlights.get_connection()
+
+        assert conn.execute("PRAGMA temp_store").fetchone() == (0,)  # DEFAULT
+        assert conn.execute("PRAGMA cache_size").fetchone() != (-20000,)
+
+    def test_connection_is_reused_per_thread(self, db_service):
+        """Test that each thread opens one connection and keeps it"""
+        highlights = db_service.highlights
+        conn = highlights.get_connection()
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            other = pool.submit(highlights.get_connection).result()
+
+        assert highlights.get_connection() is conn
+        assert other is not conn
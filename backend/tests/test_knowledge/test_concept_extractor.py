@@ -2,18 +2,24 @@
 Unit tests for ConceptExtractor.
 
 Tests cover:
-- Content chunking
+- Content chunking, with boundaries matching an rfind search
 - JSON parsing of LLM responses
 - Concept extraction (with mocked LLM)
 - Relationship extraction (with mocked LLM)
+- Concurrent, order-preserving extraction across chunks
+- Reuse of cached LLM responses
 """
 
+import asyncio
+import json
+import random
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from app.models.knowledge_models import ExtractedConcept
 from app.services.knowledge.concept_extractor import ConceptExtractor
+from app.services.knowledge.llm_cache import LLMCache
 
 
 class TestContentChunking:
@@ -59,6 +65,37 @@ class TestContentChunking:
         for chunk in chunks[:-1]:  # Except possibly the last one
             assert chunk.strip().endswith(".")
 
+    @pytest.mark.parametrize("seed", range(20))
+    def test_chunks_match_rfind_search(self, extractor: ConceptExtractor, seed):
+        """Test that chunk boundaries match searching back with rfind."""
+
+        def rfind_chunks(content, chunk_size, overlap):
+            chunks, start = [], 0
+            while start < len(content):
+                end = start + chunk_size
+                if end < len(content):
+                    for punct in [". ", ".\n", "! ", "!\n", "? ", "?\n"]:
+                        last = content.rfind(punct, start + chunk_size // 2, end)
+                        if last != -1:
+                            end = last + 1
+                            break
+                if content[start:end].strip():
+                    chunks.append(content[start:end].strip())
+                start = end - overlap
+            return chunks
+
+        rng = random.Random(seed)
+        content = "".join(
+            rng.choice(["word", " ", "\n", ".", "!", "?", ". ", "?\n"])
+            for _ in range(3000)
+        )
+        chunk_size = rng.randint(40, 400)
+        overlap = rng.randint(0, chunk_size // 4)
+
+        assert extractor.chunk_content(content, chunk_size, overlap) == rfind_chunks(
+            content, chunk_size, overlap
+        )
+
     def test_chunk_invalid_chunk_size_zero(self, extractor: ConceptExtractor):
         """Test that chunk_size <= 0 raises ValueError."""
         with pytest.raises(ValueError, match="chunk_size must be positive"):
@@ -348,3 +385,160 @@ class TestExtraction:
         assert len(concepts) == 2
         assert len(relationships) == 1
         assert relationships[0].type == "explains"
+
+    @pytest.mark.asyncio
+    async def test_full_extraction_chunks_text_once(self, mock_extractor):
+        """Test that both passes share one chunking of the text."""
+        extractor, mock_client = mock_extractor
+        mock_client.chat.completions.create = AsyncMock(
+            return_value=MagicMock(
+                choices=[
+                    MagicMock(
+                        message=MagicMock(
+                            content='[{"name": "A", "definition": "D"}, {"name": "B", "definition": "D"}]'
+                        )
+                    )
+                ]
+            )
+        )
+
+        with patch.object(
+            extractor, "chunk_content", wraps=extractor.chunk_content
+        ) as mock_chunk:
+            await extractor.extract_from_text("Text. " * 1000, "Test", "Ch1")
+
+        mock_chunk.assert_called_once()
+
+
+class TestConcurrentExtraction:
+    """Tests for extracting chunks concurrently."""
+
+    @pytest.fixture
+    def extractor(self):
+        """Create extractor whose LLM answers with the chunk's first word."""
+        with patch(
+            "app.services.knowledge.concept_extractor.LLMConfigService"
+        ) as mock_config:
+            mock_config.return_value.get_active_configuration.return_value = None
+            extractor = ConceptExtractor(max_concurrency=2)
+        extractor._client = MagicMock()
+        extractor._model = "test-model"
+        extractor.in_flight = 0
+        extractor.max_in_flight = 0
+        extractor.calls = []
+        extractor.completed = []
+
+        async def create(messages, **kwargs):
+            prompt = messages[1]["content"]
+            word = prompt.split("Text:\n", 1)[1].split()[0]
+            extractor.calls.append(word)
+            extractor.in_flight += 1
+            extractor.max_in_flight = max(extractor.max_in_flight, extractor.in_flight)
+            try:
+                # Earlier chunks take longer, so they finish last
+                await asyncio.sleep(0.01 * (5 - int(word[-1])))
+                extractor.completed.append(word)
+            finally:
+                extractor.in_flight -= 1
+            content = json.dumps(
+                [{"name": name, "definition": "d"} for name in (word, "Shared")]
+            )
+            return MagicMock(choices=[MagicMock(message=MagicMock(content=content))])
+
+        extractor._client.chat.completions.create = create
+        return extractor
+
+    CHUNKS = ["chunk1 text", "chunk2 text", "chunk3 text", "chunk4 text"]
+
+    @pytest.mark.asyncio
+    async def test_extract_from_text_runs_chunks_concurrently(self, extractor):
+        """Test bounded concurrency with results deduplicated in chunk order."""
+        with patch.object(extractor, "chunk_content", return_value=self.CHUNKS):
+            concepts, _ = await extractor.extract_from_text("text", "Book", "Ch1")
+
+        assert extractor.max_in_flight == 2
+        assert [c.name for c in concepts] == [
+            "chunk1",
+            "Shared",
+            "chunk2",
+            "chunk3",
+            "chunk4",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_incremental_yields_in_chunk_order(self, extractor):
+        """Test that chunks are yielded in order and skipped chunks aren't sent."""
+        results = [
+            (i, [c.name for c in concepts], skipped)
+            async for i, _, concepts, skipped in extractor.extract_concepts_incrementally(
+                "text", "Book", "Ch1", skip_chunks={1}, pre_chunked=self.CHUNKS
+            )
+        ]
+
+        assert results == [
+            (0, ["chunk1", "Shared"], False),
+            (1, [], True),
+            (2, ["chunk3"], False),
+            (3, ["chunk4"], False),
+        ]
+        assert sorted(extractor.calls) == ["chunk1", "chunk3", "chunk4"]
+
+    @pytest.mark.asyncio
+    async def test_closing_early_cancels_pending_chunks(self, extractor):
+        """Test that stopping after one chunk doesn't leave LLM calls running."""
+        chunk_results = extractor.extract_concepts_incrementally(
+            "text", "Book", "Ch1", pre_chunked=self.CHUNKS
+        )
+        first = await anext(chunk_results)
+        await chunk_results.aclose()
+        await asyncio.sleep(0.05)
+
+        assert first[0] == 0
+        assert extractor.in_flight == 0
+        assert len(extractor.completed) < len(self.CHUNKS)
+
+
+class TestLLMResponseCache:
+    """Tests for reusing cached LLM responses."""
+
+    CONTENT = '[{"name": "Cached", "definition": "Def"}]'
+
+    @pytest.fixture
+    def extractor(self, tmp_path):
+        """Create extractor with a mocked LLM and a temporary cache."""
+        with patch(
+            "app.services.knowledge.concept_extractor.LLMConfigService"
+        ) as mock_config:
+            mock_config.return_value.get_active_configuration.return_value = None
+            extractor = ConceptExtractor(
+                llm_cache=LLMCache(str(tmp_path / "knowledge.db"))
+            )
+        extractor._client = MagicMock()
+        extractor._client.chat.completions.create = AsyncMock(
+            return_value=MagicMock(
+                choices=[MagicMock(message=MagicMock(content=self.CONTENT))]
+            )
+        )
+        extractor._model = "test-model"
+        return extractor
+
+    @pytest.mark.asyncio
+    async def test_repeated_request_skips_llm(self, extractor):
+        """Test that an identical request is answered from the cache."""
+        first = await extractor.extract_concepts("text", "Book", "Ch1")
+        second = await extractor.extract_concepts("text", "Book", "Ch1")
+
+        assert first == second
+        assert [c.name for c in second] == ["Cached"]
+        assert extractor._client.chat.completions.create.call_count == 1
+
+        await extractor.extract_concepts("other text", "Book", "Ch1")
+        assert extractor._client.chat.completions.create.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_use_cache_false_asks_llm_again(self, extractor):
+        """Test that a forced request bypasses the cache."""
+        await extractor.extract_concepts("text", "Book", "Ch1")
+        await extractor.extract_concepts("text", "Book", "Ch1", use_cache=False)
+
+        assert extractor._client.chat.completions.create.call_count == 2
@@ -0,0 +1,75 @@
+"""
+Unit tests for LLMCache.
+
+Tests cover:
+- Storing and reading back responses
+- Cache keys covering model, messages and temperature
+- Expiry of old responses
+"""
+
+import sqlite3
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from app.services.knowledge.llm_cache import LLMCache
+
+MESSAGES = [{"role": "user", "content": "Extract concepts"}]
+
+
+@pytest.fixture
+def db_path():
+    """Create a temporary database path for testing."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield str(Path(temp_dir) / "test_knowledge.db")
+
+
+class TestLLMCache:
+    """Tests for cached LLM responses."""
+
+    @pytest.mark.asyncio
+    async def test_set_then_get(self, db_path):
+        """Test that a stored response is returned and can be replaced."""
+        cache = LLMCache(db_path)
+        key = LLMCache.make_key("model", MESSAGES, 0.3)
+
+        assert await cache.get(key) is None
+        await cache.set(key, "[]")
+        assert await cache.get(key) == "[]"
+        await cache.set(key, '[{"name": "A"}]')
+        assert await cache.get(key) == '[{"name": "A"}]'
+
+    def test_key_covers_the_whole_request(self):
+        """Test that changing any part of the request changes the key."""
+        key = LLMCache.make_key("model", MESSAGES, 0.3)
+
+        assert key == LLMCache.make_key("model", list(MESSAGES), 0.3)
+        assert key != LLMCache.make_key("other-model", MESSAGES, 0.3)
+        assert key != LLMCache.make_key("model", MESSAGES, 0.7)
+        assert key != LLMCache.make_key(
+            "model", [{"role": "user", "content": "Other"}], 0.3
+        )
+
+    @pytest.mark.asyncio
+    async def test_expired_responses_are_ignored_and_purged(self, db_path):
+        """Test that responses older than the TTL are not returned."""
+        cache = LLMCache(db_path, ttl_days=7)
+        await cache.set("fresh", "[]")
+        await cache.set("old", "[]")
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                "UPDATE llm_response_cache SET created_at = datetime('now', '-8 days')"
+                " WHERE cache_key = 'old'"
+            )
+
+        assert await cache.get("old") is None
+        assert await cache.get("fresh") == "[]"
+
+        LLMCache(db_path, ttl_days=7)
+        with sqlite3.connect(db_path) as conn:
+            keys = [
+                row[0]
+                for row in conn.execute("SELECT cache_key FROM llm_response_cache")
+            ]
+        assert keys == ["fresh"]